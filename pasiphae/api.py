@@ -0,0 +1,239 @@
+import dataclasses as d
+import typing as t
+from functools import partial
+from pathlib import PurePosixPath
+
+import graphql
+from graphql import DocumentNode
+
+from . import batching
+from . import client
+from . import connections
+from . import context
+from . import federation
+from . import file
+from . import incremental
+from . import introspection
+from . import limits
+from . import loadtest
+from . import metrics
+from . import mock
+from . import plans as execution_plans
+from . import scalars
+from . import serve
+from . import subscriptions
+from .app import App
+from .converters import generate_converters
+from .loader import GENERATED
+from .loader import SUFFIX
+from .loader import merge_extensions
+from .resolvers import generate_resolvers
+from .tools import chain_generators
+from .types import generate_types
+from .update import merge
+
+if t.TYPE_CHECKING:
+    import isort
+
+SCHEMA_NAME = "schema.graphql"
+# modules implemented by the service, regenerated ones are merged into them
+MERGED = ("resolvers", "context")
+GENERATED_SCHEMA = """# generated by pasiphae, please do not change manually
+{schema}
+"""
+
+
+@d.dataclass(frozen=True)
+class Options:
+    app: bool = False
+    metrics: bool = False
+    loadtest: bool = False
+    mock: bool = False
+    federation: bool = False
+    batch: bool = False
+    incremental: bool = False
+    serve: bool = False
+    introspection: bool = False
+    converters: bool = False
+    context: bool = False
+    update: bool = True
+    scalars: t.Mapping[str, str] = d.field(default_factory=dict)
+    memoize_scalars: bool = False
+
+
+@d.dataclass(frozen=True)
+class Generated:
+    modules: t.Dict[str, str]
+    schemas: t.Dict[str, str] = d.field(default_factory=dict)
+    warnings: t.List[str] = d.field(default_factory=list)
+
+
+def generate(
+    schema: t.Union[str, DocumentNode],
+    options: Options = Options(),
+    schema_names: t.Sequence[str] = (SCHEMA_NAME,),
+    existing: t.Optional[t.Mapping[str, str]] = None,
+    isort_config: t.Optional["isort.Config"] = None,
+    operations: t.Union[str, DocumentNode, None] = None,
+    format: bool = True,
+    plans: t.Union[str, DocumentNode, None] = None,
+) -> Generated:
+    """Generate service modules from schema without touching filesystem
+
+    `schema_names` are paths of schema files loaded by the app, relative to
+    generated modules. In update mode resolvers and context are merged into
+    `existing` module sources. Modules are sorted with isort defaults unless
+    `isort_config` is given. Typed `client` module is generated for named
+    `operations`, execution plans for the app are compiled from known `plans`
+    operations. Without `format` modules are returned as rendered, to be
+    finished with `format_module` when needed.
+    """
+    with scalars.configured(options.scalars, options.memoize_scalars):
+        return _generate(
+            schema,
+            options,
+            schema_names,
+            existing or {},
+            isort_config,
+            operations,
+            format,
+            plans,
+        )
+
+
+def format_module(
+    name: str,
+    code: str,
+    options: Options = Options(),
+    existing: t.Optional[t.Mapping[str, str]] = None,
+    isort_config: t.Optional["isort.Config"] = None,
+) -> str:
+    """Format rendered module, in update mode merge it into existing one"""
+    source = file.format_source(code, isort_config)
+    if options.update and name in MERGED and existing and name in existing:
+        source = merge(existing[name], source)
+    return source
+
+
+def _generate(
+    schema: t.Union[str, DocumentNode],
+    options: Options,
+    schema_names: t.Sequence[str],
+    existing: t.Mapping[str, str],
+    isort_config: t.Optional["isort.Config"],
+    operations: t.Union[str, DocumentNode, None],
+    format: bool,
+    plans: t.Union[str, DocumentNode, None],
+) -> Generated:
+    if isinstance(schema, str):
+        schema = graphql.parse(schema, no_location=True)
+    document = merge_extensions(schema)
+    generated = Generated(modules={})
+
+    def add(name: str, code: str) -> None:
+        generated.modules[name] = (
+            format_module(name, code, options, existing, isort_config)
+            if format
+            else code
+        )
+
+    application = App(schema_names=list(schema_names))
+    if connections.has_connections(document):
+        document = connections.expand_connections(document)
+        stem = (
+            PurePosixPath(schema_names[0]).stem if len(schema_names) == 1 else "schema"
+        )
+        name = f"{stem}{GENERATED}{SUFFIX}"
+        generated.schemas[name] = GENERATED_SCHEMA.format(
+            schema=graphql.print_ast(document)
+        )
+        application.schema_names = [name]
+        add("pagination", connections.RUNTIME)
+
+    if scalars.has_codecs(document):
+        add("scalar_codecs", scalars.RUNTIME)
+
+    if subscriptions.has_subscriptions(document):
+        add("broker", subscriptions.RUNTIME)
+
+    if limits.has_limits(document):
+        add("limits", limits.RUNTIME)
+
+    if options.federation or federation.has_entities(document):
+        add("federation", federation.RUNTIME)
+        federation.extend_app(application)
+
+    if options.mock:
+        add("mock", mock.render(document))
+        mock.extend_app(application)
+
+    if options.loadtest:
+        add("transport", client.RUNTIME)
+        add("loadtest", loadtest.render(document))
+
+    if options.batch:
+        add("batching", batching.RUNTIME)
+        batching.extend_app(application)
+
+    streams = options.incremental or incremental.has_streams(document)
+    if streams:
+        add("incremental", incremental.RUNTIME)
+        incremental.extend_app(application)
+
+    if options.introspection:
+        if options.federation or federation.has_entities(document):
+            raise ValueError("Introspection of federated schema cannot be precomputed")
+        directives = incremental.directives() if streams else []
+        add("introspection", introspection.render(document, directives))
+        introspection.extend_app(application)
+
+    if options.context:
+        add("lifespan", context.RUNTIME)
+        add("context", context.SCAFFOLD)
+        context.extend_app(application)
+
+    if plans is not None:
+        if isinstance(plans, str):
+            plans = graphql.parse(plans, no_location=True)
+        code, warnings = execution_plans.render(document, plans)
+        add("plans", code)
+        generated.warnings.extend(warnings)
+        if options.metrics:
+            generated.warnings.append(
+                "Plans are not executed by apps with metrics extension"
+            )
+        execution_plans.extend_app(application)
+
+    if options.metrics:
+        add("metrics", metrics.RUNTIME)
+        metrics.extend_app(application)
+
+    generators = [("types", generate_types), ("resolvers", generate_resolvers)]
+    if options.converters:
+        generators.append(("converters", generate_converters))
+    if operations is not None:
+        if isinstance(operations, str):
+            operations = graphql.parse(operations, no_location=True)
+        add("transport", client.RUNTIME)
+        generators.append(
+            ("client", partial(client.generate_client, operations=operations))
+        )
+
+    for name, blocks in chain_generators(generators, document):
+        codeblocks = list(blocks)
+
+        header = file.SERVICE_HEADER if name in MERGED else file.HEADER
+        add(name, file.render(name, iter(codeblocks), header))
+        if name == "client" and client.needs_codecs(codeblocks):
+            add("scalar_codecs", scalars.RUNTIME)
+        generated.warnings.extend(
+            codeblock.warning for codeblock in codeblocks if codeblock.warning
+        )
+
+    if options.app or options.serve:
+        add("app", application.render())
+
+    if options.serve:
+        add("serve", serve.RUNTIME)
+
+    return generated
@@ -0,0 +1,74 @@
+import dataclasses as d
+import typing as t
+
+from .domain import Import
+
+APP = """from pathlib import Path
+from ariadne import load_schema_from_path
+{factory}
+{servers}from .resolvers import resolvers
+{imports}
+{server_class}{type_defs}
+
+schema = {factory.name}(type_defs, resolvers)
+{setup}app = {server}(schema, {options})
+{wrappers}"""
+
+SERVER = Import("GraphQL", "ariadne.asgi")
+SERVER_CLASS = """
+class GraphQL({bases}):
+    \"\"\"Ariadne app with all generated request handling features\"\"\"
+
+
+"""
+
+
+TYPE_DEFS = 'type_defs = load_schema_from_path(Path(__file__).parent / "{name}")'
+TYPE_DEFS_LIST = """type_defs = [
+    load_schema_from_path(Path(__file__).parent / name)
+    for name in {names}
+]"""
+
+
+def lines(items: t.Iterable[str]) -> str:
+    return "".join(f"{item}\n" for item in items)
+
+
+@d.dataclass
+class App:
+    schema_names: t.Sequence[str]
+    factory: Import = Import("make_executable_schema", "ariadne")
+    # subclasses of ariadne app, combined when there are more of them
+    servers: t.List[Import] = d.field(default_factory=list)
+    imports: t.List[Import] = d.field(default_factory=list)
+    setup: t.List[str] = d.field(default_factory=list)
+    options: t.Dict[str, str] = d.field(default_factory=lambda: {"debug": "True"})
+    wrappers: t.List[str] = d.field(default_factory=list)
+
+    @property
+    def type_defs(self) -> str:
+        if len(self.schema_names) == 1:
+            return TYPE_DEFS.format(name=self.schema_names[0])
+        return TYPE_DEFS_LIST.format(names=tuple(self.schema_names))
+
+    @property
+    def server_class(self) -> str:
+        if len(self.servers) < 2:
+            return ""
+        return SERVER_CLASS.format(
+            bases=", ".join(server.name for server in self.servers)
+        )
+
+    def render(self) -> str:
+        servers = self.servers or [SERVER]
+        return APP.format(
+            type_defs=self.type_defs,
+            factory=self.factory,
+            servers=lines(map(str, servers)),
+            server_class=self.server_class,
+            server=servers[0].name if len(servers) == 1 else SERVER.name,
+            imports=lines(map(str, self.imports)),
+            setup=lines(self.setup),
+            options=", ".join(f"{key}={value}" for key, value in self.options.items()),
+            wrappers=lines(f"app = {wrapper}(app)" for wrapper in self.wrappers),
+        )
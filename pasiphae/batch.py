@@ -0,0 +1,126 @@
+import dataclasses as d
+import json
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+from .api import Options
+from .loader import ParseCache
+from .service import generate
+
+SERVICE_KEYS = {"name", "schema", "output", "client", "plans"}
+
+
+@d.dataclass(frozen=True)
+class Service:
+    name: str
+    schema: Path
+    output: t.Optional[Path] = None
+    options: Options = Options()
+    client: t.Optional[Path] = None
+    plans: t.Optional[Path] = None
+
+
+@d.dataclass(frozen=True)
+class Result:
+    name: str
+    seconds: float
+    warnings: t.Sequence[str] = ()
+    error: t.Optional[str] = None
+
+
+def load_manifest(path: Path) -> t.List[Service]:
+    """Services listed in manifest, invalid manifest raises ValueError"""
+    option_names = {field.name for field in d.fields(Options)}
+    try:
+        entries = json.loads(path.read_text())
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Failed to parse manifest - {e}")
+    if not isinstance(entries, list):
+        raise ValueError("Manifest has to be a list of services")
+    services = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Manifest entry {index} has to be an object")
+        if "schema" not in entry:
+            raise ValueError(f"Manifest entry {index} has no schema")
+        unknown = set(entry) - SERVICE_KEYS - option_names
+        if unknown:
+            raise ValueError(
+                f"Unknown keys of manifest entry {index}: {', '.join(sorted(unknown))}"
+            )
+        output = path.parent / entry["output"] if "output" in entry else None
+        client = path.parent / entry["client"] if "client" in entry else None
+        plans = path.parent / entry["plans"] if "plans" in entry else None
+        if "name" in entry:
+            name = entry["name"]
+        else:
+            name = entry.get("output", entry["schema"])
+        services.append(
+            Service(
+                name=name,
+                schema=path.parent / entry["schema"],
+                output=output,
+                options=Options(
+                    **{key: entry[key] for key in option_names & set(entry)}
+                ),
+                client=client,
+                plans=plans,
+            )
+        )
+    return services
+
+
+# parsed schemas and formatted modules are cached per worker process and shared
+# by all services it generates
+cache = ParseCache()
+
+
+def init_worker(cache_dir: t.Optional[Path]) -> None:
+    global cache
+    cache = ParseCache(cache_dir)
+
+
+def run_service(service: Service, parallel: bool = False) -> Result:
+    start = perf_counter()
+    try:
+        warnings = generate(
+            service.schema,
+            service.output,
+            service.options,
+            cache,
+            parallel,
+            service.client,
+            service.plans,
+        )
+    except Exception as e:
+        return Result(service.name, perf_counter() - start, error=f"{e!r}")
+    return Result(service.name, perf_counter() - start, warnings)
+
+
+def run(
+    services: t.Sequence[Service],
+    workers: t.Optional[int] = None,
+    cache_dir: t.Optional[Path] = None,
+) -> t.List[Result]:
+    if workers == 1 or len(services) == 1:
+        init_worker(cache_dir)
+        return [run_service(service, parallel=True) for service in services]
+    with ProcessPoolExecutor(
+        workers, initializer=init_worker, initargs=(cache_dir,)
+    ) as executor:
+        return list(executor.map(run_service, services))
+
+
+def report(results: t.Sequence[Result], elapsed: float) -> str:
+    width = max(map(len, ("service", *(result.name for result in results))))
+    lines = [f"{'service':<{width}} {'seconds':>8} {'warnings':>8}  status"]
+    for result in results:
+        lines.append(
+            f"{result.name:<{width}} {result.seconds:>8.2f}"
+            f" {len(result.warnings):>8}  {result.error or 'ok'}"
+        )
+    total = sum(result.seconds for result in results)
+    lines.append(f"{len(results)} services in {elapsed:.2f}s ({total:.2f}s in workers)")
+    return "\n".join(lines)
@@ -1,55 +1,259 @@
-import itertools as it
+import typing as t
 from pathlib import Path
+from time import perf_counter
 
 import click
-import graphql
 
-from . import file
-from .resolvers import generate_resolvers
-from .tools import chain_generators
-from .types import generate_types
+# generation modules are imported by commands which need them, so cli starts fast
 
-APP = """from pathlib import Path
-from ariadne import load_schema_from_path, make_executable_schema
-from ariadne.asgi import GraphQL
-from .resolvers import resolvers
 
-type_defs = load_schema_from_path(Path(__file__).parent / "{schema_name}")
+class DefaultGroup(click.Group):
+    """Group which runs default command when no other command is given"""
 
-schema = make_executable_schema(type_defs, resolvers)
-app = GraphQL(schema, debug=True)
-"""
+    def __init__(self, *args: t.Any, default: str, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.default = default
 
+    def parse_args(self, ctx: click.Context, args: t.List[str]) -> t.List[str]:
+        if not args or (args[0] not in self.commands and args[0] != "--help"):
+            args = [self.default, *args]
+        return super().parse_args(ctx, args)
 
-@click.command()
+
+@click.group(cls=DefaultGroup, default="generate")
+def pasiphae() -> None:
+    """Generate ariadne services from graphql schemas"""
+
+
+def parse_scalars(
+    ctx: click.Context, param: click.Parameter, values: t.Sequence[str]
+) -> t.Dict[str, str]:
+    scalars = {}
+    for value in values:
+        name, separator, path = value.partition("=")
+        if not (separator and name and path):
+            raise click.BadParameter(f"Expected NAME=TYPE, got {value!r}")
+        scalars[name] = path
+    return scalars
+
+
+@pasiphae.command()
 @click.argument("schema", type=click.Path(path_type=Path))
+@click.option(
+    "--output",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory for generated modules, directory with schema by default",
+)
 @click.option("--debug/--no-debug", default=False)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    envvar="PASIPHAE_CACHE_DIR",
+    help="Keep parsed schema files between runs",
+)
+@click.option(
+    "--client",
+    type=click.Path(path_type=Path),
+    help="Generate typed client for operations in file, directory or glob",
+)
+@click.option(
+    "--plans",
+    type=click.Path(path_type=Path),
+    help="Compile execution plans for known operations in file, directory or glob",
+)
 @click.option("--app", default=False, is_flag=True)
-def pasiphae(schema: Path, debug: bool, app: bool) -> None:
-    """Generate ariadne service from provided schema"""
-    with open(schema) as f:
-        schema_data = f.read()
+@click.option(
+    "--metrics",
+    default=False,
+    is_flag=True,
+    help="Generate resolvers latency metrics extension",
+)
+@click.option(
+    "--loadtest",
+    default=False,
+    is_flag=True,
+    help="Generate load testing harness for all queries",
+)
+@click.option(
+    "--mock",
+    default=False,
+    is_flag=True,
+    help="Serve deterministic fake data instead of calling resolvers",
+)
+@click.option(
+    "--federation",
+    default=False,
+    is_flag=True,
+    help="Generate Apollo Federation subgraph, implied by @key types",
+)
+@click.option(
+    "--batch",
+    default=False,
+    is_flag=True,
+    help="Accept list of operations in one request, executed concurrently",
+)
+@click.option(
+    "--incremental",
+    default=False,
+    is_flag=True,
+    help="Serve @defer and @stream as multipart responses, implied by @streamable",
+)
+@click.option(
+    "--serve",
+    default=False,
+    is_flag=True,
+    help="Generate preforking server sharing one schema between workers",
+)
+@click.option(
+    "--introspection",
+    default=False,
+    is_flag=True,
+    help="Serve standard introspection query from result computed by pasiphae",
+)
+@click.option(
+    "--converters",
+    default=False,
+    is_flag=True,
+    help="Generate functions building types from rows and mappings and back",
+)
+@click.option(
+    "--context",
+    default=False,
+    is_flag=True,
+    help="Open pooled resources on app startup and build a context for requests",
+)
+@click.option(
+    "--scalar",
+    "scalars",
+    multiple=True,
+    metavar="NAME=TYPE",
+    callback=parse_scalars,
+    help="Python type of scalar, e.g. `DateTime=datetime.datetime` or `Float=float`",
+)
+@click.option(
+    "--memoize-scalars",
+    default=False,
+    is_flag=True,
+    help="Cache results of scalar codecs",
+)
+@click.option(
+    "--update/--overwrite",
+    default=True,
+    help="Merge resolvers into existing module instead of overwriting it",
+)
+@click.option(
+    "--check",
+    default=False,
+    is_flag=True,
+    help="Do not write files, exit with 1 when generated files are out of date",
+)
+@click.option(
+    "--diff",
+    default=False,
+    is_flag=True,
+    help="Do not write files, show changes which would be made, implies --check",
+)
+def generate(
+    schema: Path,
+    output: t.Optional[Path],
+    debug: bool,
+    cache_dir: t.Optional[Path],
+    client: t.Optional[Path],
+    plans: t.Optional[Path],
+    check: bool,
+    diff: bool,
+    **options: t.Any,
+) -> None:
+    """Generate ariadne service from provided schema
+
+    Schema is a file, directory or glob of files, `extend` definitions are
+    merged into types they extend.
+    """
+    import graphql
+
+    from . import loader
+    from .api import Options
+    from .service import check as check_service
+    from .service import generate as generate_service
+
     try:
-        parsed_schema = graphql.parse(schema_data)
+        if check or diff:
+            drifts = check_service(
+                schema,
+                output,
+                Options(**options),
+                loader.ParseCache(cache_dir),
+                client=client,
+                plans=plans,
+            )
+            for drift in drifts:
+                changes = drift.diff() if diff else ""
+                if changes:
+                    click.echo(changes, nl=False)
+                else:
+                    click.echo(f"would update {drift.path}")
+            if drifts:
+                raise SystemExit(1)
+            return
+        warnings = generate_service(
+            schema,
+            output,
+            Options(**options),
+            loader.ParseCache(cache_dir),
+            client=client,
+            plans=plans,
+        )
+    except FileNotFoundError as e:
+        click.echo(e)
+        raise SystemExit(1)
     except graphql.GraphQLSyntaxError as e:
         click.echo(f"Failed to parse schema - {e}")
         if debug:
             raise
         raise SystemExit(1)
+    except ValueError as e:
+        click.echo(e)
+        if debug:
+            raise
+        raise SystemExit(1)
+    for warning in warnings:
+        click.echo(f"⚠️  {warning}")
 
-    for name, codeblocks in chain_generators(
-        [("types", generate_types), ("resolvers", generate_resolvers)], parsed_schema
-    ):
-        codeblocks, for_errors = it.tee(codeblocks)
 
-        file.write(schema.parent, name, codeblocks)
-        for codeblock in for_errors:
-            if codeblock.warning:
-                click.echo(f"⚠️  {codeblock.warning}")
+@pasiphae.command()
+@click.argument("manifest", type=click.Path(dir_okay=False, path_type=Path))
+@click.option(
+    "--workers",
+    type=int,
+    help="Number of worker processes, number of CPUs by default",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    envvar="PASIPHAE_CACHE_DIR",
+    help="Keep parsed schema files between runs",
+)
+def batch(
+    manifest: Path, workers: t.Optional[int], cache_dir: t.Optional[Path]
+) -> None:
+    """Generate all services from manifest in one process
 
-    if app:
-        with open(schema.parent / "app.py", "w") as f:
-            f.write(APP.format(schema_name=schema.name))
-        file.reformat_file(schema.parent / "app.py")
+    Manifest is a JSON list of services:
+    `{"schema": ..., "output": ..., "app": true, ...}`, paths are relative to
+    the manifest.
+    """
+    from . import batch as batch_
 
-    (schema.parent / "__init__.py").touch(exist_ok=True)
+    start = perf_counter()
+    try:
+        services = batch_.load_manifest(manifest)
+    except (OSError, ValueError) as e:
+        click.echo(e)
+        raise SystemExit(1)
+    results = batch_.run(services, workers, cache_dir)
+    for result in results:
+        for warning in result.warnings:
+            click.echo(f"⚠️  {result.name}: {warning}")
+    click.echo(batch_.report(results, perf_counter() - start))
+    if any(result.error for result in results):
+        raise SystemExit(1)
@@ -0,0 +1,690 @@
+import dataclasses as d
+import typing as t
+
+import graphql
+from graphql import DocumentNode
+from graphql import GraphQLEnumType
+from graphql import GraphQLInputObjectType
+from graphql import GraphQLList
+from graphql import GraphQLNamedType
+from graphql import GraphQLNonNull
+from graphql import GraphQLObjectType
+from graphql import GraphQLScalarType
+from graphql import GraphQLSchema
+from graphql import GraphQLType
+from graphql import specified_scalar_types
+from graphql.language import ast
+from graphql.utilities import type_from_ast
+
+from . import scalars
+from .domain import CodeBlock
+from .domain import PythonType
+from .to_python_type import to_python_type
+from .tools import camel_to_snake
+
+MODULE = ".client"
+TRANSPORT = ".transport"
+
+RUNTIME = '''# generated by pasiphae, please do not change manually
+import asyncio
+import json
+import typing as t
+from urllib.parse import urlsplit
+
+Send = t.Callable[[bytes], t.Awaitable[t.Tuple[int, bytes]]]
+Result = t.Dict[str, t.Any]
+
+
+class GraphQLError(Exception):
+    def __init__(self, errors: t.Sequence[t.Mapping[str, t.Any]]) -> None:
+        super().__init__("; ".join(error.get("message", "") for error in errors))
+        self.errors = errors
+
+
+def in_process(app: t.Any, path: str = "/") -> Send:
+    """Call ASGI app directly, without network"""
+
+    async def send(body: bytes) -> t.Tuple[int, bytes]:
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [
+                (b"host", b"localhost"),
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+            "client": ("127.0.0.1", 0),
+            "server": ("127.0.0.1", 80),
+        }
+        requests = [{"type": "http.request", "body": body, "more_body": False}]
+        status = 0
+        chunks: t.List[bytes] = []
+
+        async def receive() -> t.Dict[str, t.Any]:
+            if requests:
+                return requests.pop()
+            await asyncio.Future()  # wait until response is sent
+            return {"type": "http.disconnect"}
+
+        async def respond(message: t.Dict[str, t.Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await app(scope, receive, respond)
+        return status, b"".join(chunks)
+
+    return send
+
+
+class ConnectionClosed(ConnectionResetError):
+    """Connection was closed by server without response"""
+
+
+class Connection:
+    """Keep-alive HTTP/1.1 connection, used by one request at a time
+
+    Servers close idle keep-alive connections, request which got no response
+    on a reused connection is sent again on a new one. Other connection errors
+    are raised, the server might have processed the request.
+    """
+
+    def __init__(self, url: str, headers: t.Mapping[str, str] = {}) -> None:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme {parts.scheme!r}")
+        self.ssl = parts.scheme == "https"
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or (443 if self.ssl else 80)
+        self.path = parts.path or "/"
+        self.headers = "".join(
+            f"{name}: {value}\\r\\n" for name, value in headers.items()
+        )
+        self.reader: t.Optional[asyncio.StreamReader] = None
+        self.writer: t.Optional[asyncio.StreamWriter] = None
+
+    async def send(self, body: bytes) -> t.Tuple[int, bytes]:
+        if self.writer is None:
+            return await self.exchange(body)
+        try:
+            return await self.exchange(body)
+        except ConnectionClosed:
+            self.close()
+        return await self.exchange(body)
+
+    async def exchange(self, body: bytes) -> t.Tuple[int, bytes]:
+        if self.reader is None or self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port, ssl=self.ssl
+            )
+        head = (
+            f"POST {self.path} HTTP/1.1\\r\\n"
+            f"Host: {self.host}:{self.port}\\r\\n"
+            "Content-Type: application/json\\r\\n"
+            f"{self.headers}"
+            f"Content-Length: {len(body)}\\r\\n\\r\\n"
+        )
+        self.writer.write(head.encode() + body)
+        await self.writer.drain()
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionClosed("Connection closed by server")
+        status = int(status_line.split()[1])
+        length, chunked, keep_alive = 0, False, True
+        while (line := await self.reader.readline()) not in (b"\\r\\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+            elif name.lower() == "transfer-encoding":
+                chunked = "chunked" in value.lower()
+            elif name.lower() == "connection":
+                keep_alive = "close" not in value.lower()
+        if chunked:
+            chunks = []
+            while size := int((await self.reader.readline()).strip(), 16):
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            await self.reader.readline()
+            content = b"".join(chunks)
+        else:
+            content = await self.reader.readexactly(length)
+        if not keep_alive:
+            self.close()
+        return status, content
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+class Pool:
+    """Keep-alive connections reused by concurrent requests"""
+
+    def __init__(
+        self, url: str, size: int = 10, headers: t.Mapping[str, str] = {}
+    ) -> None:
+        self.connections = [Connection(url, headers) for _ in range(size)]
+        self.idle: "asyncio.Queue[Connection]" = asyncio.Queue()
+        for connection in self.connections:
+            self.idle.put_nowait(connection)
+
+    async def send(self, body: bytes) -> t.Tuple[int, bytes]:
+        connection = await self.idle.get()
+        try:
+            return await connection.send(body)
+        except BaseException:
+            connection.close()
+            raise
+        finally:
+            self.idle.put_nowait(connection)
+
+    def close(self) -> None:
+        for connection in self.connections:
+            connection.close()
+
+
+class Transport:
+    """Execute operations, concurrent calls are sent in one request with `batch`"""
+
+    def __init__(
+        self,
+        send: Send,
+        batch: bool = False,
+        max_batch_size: int = 100,
+        close: t.Callable[[], None] = lambda: None,
+    ) -> None:
+        self.send = send
+        self.batch = batch
+        self.max_batch_size = max_batch_size
+        self.close = close
+        self.pending: t.List[t.Tuple[Result, "asyncio.Future[Result]"]] = []
+
+    @classmethod
+    def connect(
+        cls,
+        url: str,
+        pool_size: int = 10,
+        headers: t.Mapping[str, str] = {},
+        **kwargs: t.Any,
+    ) -> "Transport":
+        """Send requests over pool of keep-alive connections"""
+        pool = Pool(url, pool_size, headers)
+        return cls(pool.send, close=pool.close, **kwargs)
+
+    async def __aenter__(self) -> "Transport":
+        return self
+
+    async def __aexit__(self, *_: t.Any) -> None:
+        self.close()
+
+    async def execute(
+        self, query: str, operation_name: str, variables: t.Mapping[str, t.Any]
+    ) -> Result:
+        payload = {
+            "query": query,
+            "operationName": operation_name,
+            "variables": variables,
+        }
+        if not self.batch:
+            return data(await self.post(payload))
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((payload, future))
+        if len(self.pending) == 1:
+            asyncio.get_running_loop().call_soon(self.flush)
+        elif len(self.pending) >= self.max_batch_size:
+            self.flush()
+        return data(await future)
+
+    def flush(self) -> None:
+        pending, self.pending = self.pending, []
+        if pending:
+            asyncio.ensure_future(self.send_batch(pending))
+
+    async def send_batch(
+        self, pending: t.Sequence[t.Tuple[Result, "asyncio.Future[Result]"]]
+    ) -> None:
+        try:
+            if len(pending) == 1:
+                results = [await self.post(pending[0][0])]
+            else:
+                results = await self.post([payload for payload, _ in pending])
+                if not isinstance(results, list) or len(results) != len(pending):
+                    raise batch_error(results, len(pending))
+        except BaseException as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def post(self, payload: t.Any) -> t.Any:
+        status, body = await self.send(json.dumps(payload).encode())
+        try:
+            return json.loads(body)
+        except ValueError:
+            raise GraphQLError([{"message": f"HTTP {status}: {body[:200]!r}"}])
+
+
+def batch_error(results: t.Any, size: int) -> GraphQLError:
+    """Batch answered with other shape than list of all results"""
+    if isinstance(results, dict) and results.get("errors"):
+        return GraphQLError(results["errors"])
+    message = f"Expected list of {size} results, got {json.dumps(results)[:200]}"
+    return GraphQLError([{"message": message}])
+
+
+def data(result: Result) -> Result:
+    if result.get("errors"):
+        raise GraphQLError(result["errors"])
+    return result["data"]
+'''
+
+
+@d.dataclass
+class Field:
+    key: str
+    type_: GraphQLType
+    nodes: t.List[ast.FieldNode] = d.field(default_factory=list)
+    conditional: bool = False
+
+    @property
+    def name(self) -> str:
+        return "typename" if self.key == "__typename" else camel_to_snake(self.key)
+
+
+Fields = t.Dict[str, Field]
+Fragments = t.Mapping[str, ast.FragmentDefinitionNode]
+
+
+def collect_fields(
+    schema: GraphQLSchema,
+    parent: GraphQLNamedType,
+    selection_set: ast.SelectionSetNode,
+    fragments: Fragments,
+    conditional: bool = False,
+    fields: t.Optional[Fields] = None,
+) -> Fields:
+    """Fields of selection set by response key, with fragments flattened
+
+    Fields of fragments on other types than `parent` may be missing in the
+    response, they are conditional.
+    """
+    fields = {} if fields is None else fields
+    for selection in selection_set.selections:
+        if isinstance(selection, ast.FieldNode):
+            key = (selection.alias or selection.name).value
+            if selection.name.value == "__typename":
+                type_: GraphQLType = GraphQLNonNull(specified_scalar_types["String"])
+            else:
+                type_ = parent.fields[selection.name.value].type  # type: ignore
+            field = fields.setdefault(key, Field(key, type_, conditional=conditional))
+            field.nodes.append(selection)
+            field.conditional = field.conditional and conditional
+            continue
+        if isinstance(selection, ast.FragmentSpreadNode):
+            fragment: t.Union[
+                ast.FragmentDefinitionNode, ast.InlineFragmentNode
+            ] = fragments[selection.name.value]
+        else:
+            fragment = t.cast(ast.InlineFragmentNode, selection)
+        condition = (
+            t.cast(
+                GraphQLNamedType, schema.get_type(fragment.type_condition.name.value)
+            )
+            if fragment.type_condition
+            else parent
+        )
+        collect_fields(
+            schema,
+            condition,
+            fragment.selection_set,
+            fragments,
+            conditional or condition is not parent,
+            fields,
+        )
+    return fields
+
+
+@d.dataclass
+class ResultClass:
+    name: str
+    fields: t.Sequence[t.Tuple[Field, PythonType, str]]
+
+    @property
+    def types(self) -> t.Iterator[PythonType]:
+        yield PythonType("dataclass", "dataclasses")
+        yield PythonType("Any", "typing")
+        yield PythonType("Mapping", "typing")
+        yield PythonType(self.name, MODULE)
+        for _, type_, _ in self.fields:
+            yield type_
+
+    def render(self) -> str:
+        annotations = sorted(
+            (
+                (type_.default, field.name, type_.render(MODULE))
+                for field, type_, _ in self.fields
+            ),
+            key=lambda annotation: annotation[0],
+        )
+        values = (
+            f"            {field.name}={value}," for field, _, value in self.fields
+        )
+        return "\n".join(
+            (
+                "@dataclass(frozen=True)",
+                f"class {self.name}:",
+                *(
+                    f"    {name}: {result}{f' = {default}' if default else ''}"
+                    for default, name, result in annotations
+                ),
+                "",
+                "    @classmethod",
+                f'    def from_json(cls, data: Mapping[str, Any]) -> "{self.name}":',
+                "        return cls(",
+                *values,
+                "        )",
+            )
+        )
+
+
+class Generator:
+    """Result classes, encoders and client methods of operations document"""
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        operations: DocumentNode,
+        known: t.Mapping[str, str],
+    ) -> None:
+        self.schema = schema
+        self.known = known
+        self.fragments = {
+            definition.name.value: definition
+            for definition in operations.definitions
+            if isinstance(definition, ast.FragmentDefinitionNode)
+        }
+        self.classes: t.List[ResultClass] = []
+        self.encoders: t.Dict[str, t.Tuple[str, t.List[PythonType]]] = {}
+        self.types: t.List[PythonType] = []
+
+    def python_type(self, type_: GraphQLNamedType) -> PythonType:
+        if (
+            isinstance(type_, GraphQLScalarType)
+            and type_.name in specified_scalar_types
+        ):
+            return t.cast(PythonType, scalars.get_type(type_.name))
+        return PythonType(type_.name, self.known.get(type_.name, ".types"))
+
+    def codec(self, type_: GraphQLNamedType, prefix: str) -> t.Optional[str]:
+        codec = scalars.get_codec(type_.name)
+        if not isinstance(type_, GraphQLScalarType) or codec is None:
+            return None
+        self.types.append(PythonType(f"{prefix}_{codec}", scalars.MODULE))
+        return f"{prefix}_{codec}"
+
+    def decode(
+        self, type_: GraphQLType, value: str, field: Field, prefix: str, depth: int = 0
+    ) -> t.Tuple[PythonType, str]:
+        if isinstance(type_, GraphQLNonNull):
+            return self.decode_value(type_.of_type, value, field, prefix, depth)
+        python_type, decoded = self.decode_value(type_, value, field, prefix, depth)
+        if decoded != value:
+            decoded = f"None if {value} is None else {decoded}"
+        return (
+            PythonType("Optional", "typing", child=[python_type], default="None"),
+            decoded,
+        )
+
+    def decode_value(
+        self, type_: GraphQLType, value: str, field: Field, prefix: str, depth: int
+    ) -> t.Tuple[PythonType, str]:
+        if isinstance(type_, GraphQLList):
+            item = f"item_{depth}" if depth else "item"
+            python_type, decoded = self.decode(
+                type_.of_type, item, field, prefix, depth + 1
+            )
+            sequence = PythonType("Sequence", "typing", child=[python_type])
+            if decoded == item:
+                return sequence, value
+            return sequence, f"[{decoded} for {item} in {value}]"
+        named = t.cast(GraphQLNamedType, type_)
+        if isinstance(named, GraphQLEnumType):
+            return self.python_type(named), f"{named.name}({value})"
+        if isinstance(named, GraphQLScalarType):
+            codec = self.codec(named, "parse")
+            python_type = self.python_type(named)
+            return python_type, f"{codec}({value})" if codec else value
+        name = f"{prefix}{field.key[0].upper()}{field.key[1:]}"
+        selection_set = ast.SelectionSetNode(
+            selections=tuple(
+                selection
+                for node in field.nodes
+                if node.selection_set
+                for selection in node.selection_set.selections
+            )
+        )
+        self.result_class(name, named, selection_set)
+        return PythonType(name, MODULE), f"{name}.from_json({value})"
+
+    def result_class(
+        self, name: str, parent: GraphQLNamedType, selection_set: ast.SelectionSetNode
+    ) -> None:
+        fields = collect_fields(self.schema, parent, selection_set, self.fragments)
+        position = len(self.classes)
+        decoded = []
+        for field in fields.values():
+            type_ = field.type_
+            value = f'data["{field.key}"]'
+            if field.conditional:
+                if isinstance(type_, GraphQLNonNull):
+                    type_ = type_.of_type
+                value = f'data.get("{field.key}")'
+            python_type, decoder = self.decode(type_, value, field, name)
+            decoded.append((field, python_type, decoder))
+        self.classes.insert(position, ResultClass(name, decoded))
+
+    def encode(self, type_: GraphQLType, value: str, depth: int = 0) -> str:
+        if isinstance(type_, GraphQLNonNull):
+            return self.encode_value(type_.of_type, value, depth)
+        encoded = self.encode_value(type_, value, depth)
+        return (
+            encoded if encoded == value else f"None if {value} is None else {encoded}"
+        )
+
+    def encode_value(self, type_: GraphQLType, value: str, depth: int) -> str:
+        if isinstance(type_, GraphQLList):
+            item = f"item_{depth}" if depth else "item"
+            encoded = self.encode(type_.of_type, item, depth + 1)
+            return value if encoded == item else f"[{encoded} for {item} in {value}]"
+        if isinstance(type_, GraphQLEnumType):
+            return f"{value}.value"
+        if isinstance(type_, GraphQLInputObjectType):
+            return f"{self.encoder(type_)}({value})"
+        codec = self.codec(t.cast(GraphQLNamedType, type_), "serialize")
+        return f"{codec}({value})" if codec else value
+
+    def encoder(self, type_: GraphQLInputObjectType) -> str:
+        name = f"encode_{camel_to_snake(type_.name)}"
+        if type_.name not in self.encoders:
+            self.encoders[type_.name] = ("", [])
+            python_type = self.python_type(type_)
+            values = (
+                f'        "{key}": '
+                f"{self.encode(field.type, f'value.{camel_to_snake(key)}')},"
+                for key, field in type_.fields.items()
+            )
+            self.encoders[type_.name] = (
+                "\n".join(
+                    (
+                        f"def {name}(value: {python_type.name}) -> Dict[str, Any]:",
+                        "    return {",
+                        *values,
+                        "    }",
+                    )
+                ),
+                [
+                    python_type,
+                    PythonType("Dict", "typing"),
+                    PythonType("Any", "typing"),
+                ],
+            )
+        return name
+
+    def method(self, operation: ast.OperationDefinitionNode) -> CodeBlock:
+        if operation.name is None:
+            raise ValueError("Client operations have to be named")
+        if operation.operation == ast.OperationType.SUBSCRIPTION:
+            raise ValueError(
+                f"Subscription {operation.name.value} is not supported by client"
+            )
+        operation_name = operation.name.value
+        name = camel_to_snake(operation_name)
+        result = f"{operation_name}Result"
+        root = self.schema.get_root_type(operation.operation)
+        self.result_class(
+            result, t.cast(GraphQLObjectType, root), operation.selection_set
+        )
+
+        arguments: t.List[t.Tuple[str, str, PythonType]] = []
+        required, optional = [], []
+        for variable in operation.variable_definitions:
+            key = variable.variable.name.value
+            argument = camel_to_snake(key)
+            python_type = to_python_type(variable.type, self.known)
+            type_ = type_from_ast(self.schema, variable.type)
+            arguments.append((argument, python_type.render(MODULE), python_type))
+            if isinstance(type_, GraphQLNonNull):
+                required.append(f'"{key}": {self.encode(type_, argument)},')
+            else:
+                encoded = self.encode_value(type_, argument, 0)  # type: ignore
+                optional.append(
+                    f"if {argument} is not None:\n"
+                    f'            variables["{key}"] = {encoded}'
+                )
+        signature = ", ".join(
+            (
+                "self",
+                *(
+                    f"{argument}: {annotation}"
+                    f"{f' = {type_.default}' if type_.default else ''}"
+                    for argument, annotation, type_ in sorted(
+                        arguments, key=lambda argument: argument[2].default
+                    )
+                ),
+            )
+        )
+        body = "\n".join(
+            (
+                f"    async def {name}({signature}) -> {result}:",
+                f"        variables: Dict[str, Any] = {{{' '.join(required)}}}",
+                *(f"        {line}" for line in optional),
+                "        data = await self.transport.execute(",
+                f'            {name.upper()}, "{operation_name}", variables',
+                "        )",
+                f"        return {result}.from_json(data)",
+            )
+        )
+        return CodeBlock(
+            body=body,
+            used_types=[
+                PythonType("Dict", "typing"),
+                PythonType("Any", "typing"),
+                *(type_ for _, _, type_ in arguments),
+            ],
+        )
+
+
+def document_text(operation: ast.OperationDefinitionNode, fragments: Fragments) -> str:
+    """Printed operation with fragments it uses, as sent by generated client"""
+    used: t.Dict[str, ast.FragmentDefinitionNode] = {}
+    pending: t.List[ast.Node] = [operation]
+    while pending:
+        node = pending.pop()
+        for spread in fragment_spreads(node):
+            if spread not in used:
+                used[spread] = fragments[spread]
+                pending.append(fragments[spread])
+    document = ast.DocumentNode(definitions=(operation, *used.values()))
+    return graphql.print_ast(document)
+
+
+def document_source(
+    operation: ast.OperationDefinitionNode, fragments: Fragments
+) -> str:
+    text = document_text(operation, fragments)
+    source = text.replace("\\", "\\\\").replace('"""', '\\"""')
+    return f'"""\n{source}\n"""'
+
+
+def fragment_spreads(node: ast.Node) -> t.Iterator[str]:
+    selection_set = getattr(node, "selection_set", None)
+    for selection in selection_set.selections if selection_set else ():
+        if isinstance(selection, ast.FragmentSpreadNode):
+            yield selection.name.value
+        else:
+            yield from fragment_spreads(selection)
+
+
+def generate_client(
+    document: DocumentNode, known_types: t.Mapping[str, str], operations: DocumentNode
+) -> t.Iterator[CodeBlock]:
+    schema = graphql.build_ast_schema(document, assume_valid_sdl=True)
+    errors = graphql.validate(schema, operations)
+    if errors:
+        raise ValueError(
+            f"Invalid client operations: {'; '.join(error.message for error in errors)}"
+        )
+    generator = Generator(schema, operations, known_types)
+    methods = [
+        generator.method(definition)
+        for definition in operations.definitions
+        if isinstance(definition, ast.OperationDefinitionNode)
+    ]
+    for definition in operations.definitions:
+        if isinstance(definition, ast.OperationDefinitionNode):
+            name = camel_to_snake(t.cast(ast.NameNode, definition.name).value).upper()
+            yield CodeBlock(
+                body=f"{name} = {document_source(definition, generator.fragments)}",
+                weight=0,
+            )
+    for result_class in generator.classes:
+        yield CodeBlock(
+            body=result_class.render(), used_types=list(result_class.types), weight=1
+        )
+    for body, used_types in generator.encoders.values():
+        yield CodeBlock(body=body, used_types=used_types, weight=2)
+    yield CodeBlock(
+        body="\n".join(
+            (
+                "class Client:",
+                "    def __init__(self, transport: Transport) -> None:",
+                "        self.transport = transport",
+            )
+        ),
+        used_types=[PythonType("Transport", TRANSPORT), *generator.types],
+        weight=3,
+    )
+    for method in methods:
+        yield d.replace(method, weight=4)
+
+
+def needs_codecs(codeblocks: t.Iterable[CodeBlock]) -> bool:
+    """Whether generated client uses `scalar_codecs` module"""
+    return any(
+        type_.module == scalars.MODULE
+        for codeblock in codeblocks
+        for type_ in codeblock.used_types
+    )
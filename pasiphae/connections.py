@@ -0,0 +1,306 @@
+import copy
+import dataclasses as d
+import typing as t
+
+from graphql import DocumentNode
+from graphql import parse
+from graphql import parse_type
+from graphql.language import ast
+
+from .tools import directive_arguments
+from .tools import get_directive
+
+DIRECTIVE = "connection"
+CONNECTION_SUFFIX = "Connection"
+EDGE_SUFFIX = "Edge"
+PAGE_INFO = "PageInfo"
+PAGINATION_ARGUMENTS = ("first", "after", "last", "before")
+
+DEFINITIONS = f"""
+directive @{DIRECTIVE}(key: String = "id", maxPageSize: Int = 100) on FIELD_DEFINITION
+
+type {PAGE_INFO} {{
+  hasNextPage: Boolean!
+  hasPreviousPage: Boolean!
+  startCursor: String
+  endCursor: String
+}}
+"""
+
+ARGUMENTS = "first: Int, after: String, last: Int, before: String"
+
+RUNTIME = '''# generated by pasiphae, please do not change manually
+import base64
+import itertools as it
+import typing as t
+from dataclasses import dataclass
+from functools import wraps
+from inspect import isawaitable
+import json
+
+from graphql import GraphQLError
+
+from .types import PageInfo
+
+
+def encode_cursor(key: t.Any) -> str:
+    payload = json.dumps(key, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> t.Any:
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError as e:
+        raise GraphQLError(f"Invalid cursor: {cursor}") from e
+
+
+@dataclass(frozen=True)
+class Page:
+    """Keyset page requested by the client.
+
+    Resolver should fetch at most `fetch_size` nodes ordered by key, starting
+    right after `after` (or right before `before` when `backward` is set,
+    nearest to the cursor first).
+    """
+
+    limit: int
+    after: t.Any = None
+    before: t.Any = None
+    backward: bool = False
+
+    @property
+    def fetch_size(self) -> int:
+        return self.limit + 1
+
+    @classmethod
+    def from_arguments(
+        cls,
+        first: t.Optional[int],
+        after: t.Optional[str],
+        last: t.Optional[int],
+        before: t.Optional[str],
+        max_page_size: int,
+    ) -> "Page":
+        if first is not None and last is not None:
+            raise GraphQLError("Passing both `first` and `last` is not supported")
+        size = first if last is None else last
+        if size is None:
+            size = max_page_size
+        if size < 0:
+            raise GraphQLError("Page size cannot be negative")
+        if size > max_page_size:
+            raise GraphQLError(f"Page size cannot exceed {max_page_size}")
+        return cls(
+            limit=size,
+            after=None if after is None else decode_cursor(after),
+            before=None if before is None else decode_cursor(before),
+            backward=last is not None,
+        )
+
+
+def get_key(node: t.Any, key: str) -> t.Any:
+    if isinstance(node, t.Mapping):
+        return node[key]
+    return getattr(node, key)
+
+
+def build_connection(
+    nodes: t.Iterable[t.Any],
+    page: Page,
+    connection: t.Callable[..., t.Any],
+    edge: t.Callable[..., t.Any],
+    key: str,
+) -> t.Any:
+    fetched = list(it.islice(nodes, page.fetch_size))
+    has_more = len(fetched) > page.limit
+    del fetched[page.limit :]
+    if page.backward:
+        fetched.reverse()
+    edges = [
+        edge(cursor=encode_cursor(get_key(node, key)), node=node) for node in fetched
+    ]
+    # nodes exist beyond the cursor the page starts from
+    page_info = PageInfo(
+        has_next_page=has_more if not page.backward else page.before is not None,
+        has_previous_page=has_more if page.backward else page.after is not None,
+        start_cursor=edges[0].cursor if edges else None,
+        end_cursor=edges[-1].cursor if edges else None,
+    )
+    return connection(edges=edges, page_info=page_info)
+
+
+def paginated(
+    connection: t.Callable[..., t.Any],
+    edge: t.Callable[..., t.Any],
+    key: str = "id",
+    max_page_size: int = 100,
+) -> t.Callable[[t.Callable[..., t.Any]], t.Callable[..., t.Any]]:
+    def decorator(resolver: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
+        async def complete(nodes: t.Awaitable[t.Iterable[t.Any]], page: Page) -> t.Any:
+            return build_connection(await nodes, page, connection, edge, key)
+
+        @wraps(resolver)
+        def wrapper(
+            parent: t.Any,
+            info: t.Any,
+            *,
+            first: t.Optional[int] = None,
+            after: t.Optional[str] = None,
+            last: t.Optional[int] = None,
+            before: t.Optional[str] = None,
+            **kwargs: t.Any,
+        ) -> t.Any:
+            page = Page.from_arguments(first, after, last, before, max_page_size)
+            nodes = resolver(parent, info, page=page, **kwargs)
+            if isawaitable(nodes):
+                return complete(nodes, page)
+            return build_connection(nodes, page, connection, edge, key)
+
+        return wrapper
+
+    return decorator
+'''
+
+
+@d.dataclass(frozen=True)
+class Connection:
+    node: str
+    key: str = "id"
+    max_page_size: int = 100
+
+    @property
+    def name(self) -> str:
+        return f"{self.node}{CONNECTION_SUFFIX}"
+
+    @property
+    def edge(self) -> str:
+        return f"{self.node}{EDGE_SUFFIX}"
+
+    @property
+    def definitions(self) -> str:
+        return f"""
+type {self.name} {{
+  edges: [{self.edge}!]!
+  pageInfo: {PAGE_INFO}!
+}}
+
+type {self.edge} {{
+  cursor: String!
+  node: {self.node}!
+}}
+"""
+
+
+def node_name(type_: ast.TypeNode) -> str:
+    if isinstance(type_, (ast.NonNullTypeNode, ast.ListTypeNode)):
+        return node_name(type_.type)
+    assert isinstance(type_, ast.NamedTypeNode)
+    return type_.name.value
+
+
+def get_connection(field: ast.FieldDefinitionNode) -> t.Optional[Connection]:
+    directive = get_directive(field, DIRECTIVE)
+    if directive is None:
+        return None
+    arguments = directive_arguments(directive)
+    node = node_name(field.type)
+    if not _is_list(field.type):
+        if not _is_expanded(field):
+            raise ValueError(f"@{DIRECTIVE} field {field.name.value} has to be a list")
+        node = node[: -len(CONNECTION_SUFFIX)]
+    return Connection(
+        node=node,
+        key=arguments.get("key", "id"),
+        max_page_size=arguments.get("maxPageSize", 100),
+    )
+
+
+def _is_expanded(field: ast.FieldDefinitionNode) -> bool:
+    """Field is already expanded, type is `<Node>Connection!` with pagination"""
+    type_ = field.type
+    return (
+        isinstance(type_, ast.NonNullTypeNode)
+        and isinstance(type_.type, ast.NamedTypeNode)
+        and type_.type.name.value.endswith(CONNECTION_SUFFIX)
+        and type_.type.name.value != CONNECTION_SUFFIX
+        and set(PAGINATION_ARGUMENTS)
+        <= {argument.name.value for argument in field.arguments}
+    )
+
+
+def _is_list(type_: ast.TypeNode) -> bool:
+    if isinstance(type_, ast.NonNullTypeNode):
+        type_ = type_.type
+    return isinstance(type_, ast.ListTypeNode)
+
+
+def _fields(
+    document: DocumentNode,
+) -> t.Iterator[ast.FieldDefinitionNode]:
+    for definition in document.definitions:
+        if isinstance(
+            definition, (ast.ObjectTypeDefinitionNode, ast.InterfaceTypeDefinitionNode)
+        ):
+            yield from definition.fields
+
+
+def has_connections(document: DocumentNode) -> bool:
+    return any(get_connection(field) for field in _fields(document))
+
+
+def expand_field(field: ast.FieldDefinitionNode) -> ast.FieldDefinitionNode:
+    connection = get_connection(field)
+    if connection is None or not _is_list(field.type):
+        return field
+    defined = {argument.name.value for argument in field.arguments}
+    pagination = parse(f"type T {{ f({ARGUMENTS}): Int }}").definitions[0]
+    assert isinstance(pagination, ast.ObjectTypeDefinitionNode)
+    expanded = copy.copy(field)
+    expanded.type = parse_type(f"{connection.name}!")
+    expanded.arguments = (
+        *field.arguments,
+        *(
+            argument
+            for argument in pagination.fields[0].arguments
+            if argument.name.value not in defined
+        ),
+    )
+    return expanded
+
+
+def expand_connections(document: DocumentNode) -> DocumentNode:
+    """Replace list fields marked with `@connection` by relay connections
+
+    Connection, edge and `PageInfo` types are added to the document when
+    schema does not define them yet.
+    """
+    defined = {
+        definition.name.value
+        for definition in document.definitions
+        if isinstance(definition, (ast.TypeDefinitionNode, ast.DirectiveDefinitionNode))
+    }
+    connections = {
+        connection.name: connection
+        for connection in map(get_connection, _fields(document))
+        if connection
+    }
+    extra = [
+        definition
+        for definition in parse(
+            "\n".join((DEFINITIONS, *(c.definitions for c in connections.values())))
+        ).definitions
+        if isinstance(definition, (ast.TypeDefinitionNode, ast.DirectiveDefinitionNode))
+        and definition.name.value not in defined
+    ]
+
+    definitions = []
+    for definition in document.definitions:
+        if isinstance(
+            definition, (ast.ObjectTypeDefinitionNode, ast.InterfaceTypeDefinitionNode)
+        ):
+            definition = copy.copy(definition)
+            definition.fields = tuple(map(expand_field, definition.fields))
+        definitions.append(definition)
+
+    return DocumentNode(definitions=(*definitions, *extra))
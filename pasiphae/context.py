@@ -0,0 +1,126 @@
+from .app import App
+from .domain import Import
+from .file import SERVICE_HEADER
+
+RUNTIME = '''# generated by pasiphae, please do not change manually
+import os
+import typing as t
+from contextlib import AsyncExitStack
+
+from ariadne.asgi import GraphQL
+from starlette.requests import HTTPConnection
+
+# `production` profile hides tracebacks of errors from clients
+DEBUG = os.environ.get("GRAPHQL_PROFILE", "development") != "production"
+
+R = t.TypeVar("R")
+
+
+class RequestContext(t.Generic[R]):
+    """Context of one request with resources shared by all of them
+
+    It can be read as ariadne default context too: `context["request"]`.
+    """
+
+    def __init__(self, request: HTTPConnection, resources: R) -> None:
+        self.request = request
+        self.resources = resources
+
+    def __getitem__(self, key: str) -> t.Any:
+        return getattr(self, key)
+
+
+class ContextGraphQL(GraphQL):
+    """GraphQL app with pooled resources and a context for every request
+
+    Resources are opened by `open_resources` on ASGI lifespan startup and
+    closed by its exit stack on shutdown, every request and websocket gets
+    its own `context_class` instance.
+    """
+
+    def __init__(
+        self,
+        *args: t.Any,
+        open_resources: t.Callable[[AsyncExitStack], t.Awaitable[t.Any]],
+        context_class: t.Callable[[HTTPConnection, t.Any], t.Any],
+        **kwargs: t.Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.open_resources = open_resources
+        self.context_class = context_class
+        self.resources: t.Any = None
+        self.stack: t.Optional[AsyncExitStack] = None
+
+    async def __call__(self, scope: t.Any, receive: t.Any, send: t.Any) -> None:
+        if scope["type"] == "lifespan":
+            return await self.lifespan(receive, send)
+        await super().__call__(scope, receive, send)
+
+    async def startup(self) -> None:
+        stack = AsyncExitStack()
+        try:
+            self.resources = await self.open_resources(stack)
+        except BaseException:
+            await stack.aclose()
+            raise
+        self.stack = stack
+
+    async def shutdown(self) -> None:
+        stack, self.stack, self.resources = self.stack, None, None
+        if stack is not None:
+            await stack.aclose()
+
+    async def lifespan(self, receive: t.Any, send: t.Any) -> None:
+        while True:
+            message = await receive()
+            event = message["type"].rsplit(".", 1)[-1]
+            try:
+                await (self.startup() if event == "startup" else self.shutdown())
+            except Exception as error:
+                await send({"type": f"lifespan.{event}.failed", "message": str(error)})
+                return
+            await send({"type": f"lifespan.{event}.complete"})
+            if event == "shutdown":
+                return
+
+    async def get_context_for_request(self, request: t.Any) -> t.Any:
+        if self.stack is None:
+            raise RuntimeError("Resources are not open, is ASGI lifespan enabled?")
+        return self.context_class(request, self.resources)
+'''
+
+# implemented by the service, merged like resolvers when regenerated
+SCAFFOLD = f'''{SERVICE_HEADER}
+from contextlib import AsyncExitStack
+
+from .lifespan import RequestContext
+
+
+class Resources:
+    """Pooled resources, opened once on startup and shared by all requests"""
+
+
+class Context(RequestContext[Resources]):
+    """Context of a request, passed to resolvers as `info.context`
+
+    Per-request objects, like loaders and caches, are `cached_property`:
+    they are created on first access and dropped with the request.
+    """
+
+
+async def open_resources(stack: AsyncExitStack) -> Resources:
+    """Open pooled resources on startup, `stack` closes them on shutdown"""
+    return Resources()
+'''
+
+
+def extend_app(app: App) -> None:
+    app.servers.append(Import("ContextGraphQL", ".lifespan"))
+    app.imports += [
+        Import("Context", ".context"),
+        Import("open_resources", ".context"),
+        Import("DEBUG", ".lifespan"),
+    ]
+    app.options.update(
+        debug="DEBUG", open_resources="open_resources", context_class="Context"
+    )
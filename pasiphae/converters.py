@@ -0,0 +1,164 @@
+import typing as t
+
+from graphql import DocumentNode
+from graphql.language import ast
+
+from .domain import CodeBlock
+from .domain import PythonType
+from .tools import camel_to_snake
+from .types import MODULE as TYPES_MODULE
+from .types import class_fields
+
+MODULE = ".converters"
+
+ROOT_TYPES = ("Query", "Mutation", "Subscription")
+
+ANY = PythonType("Any", module="typing")
+ROW = PythonType("Sequence", module="typing", child=[ANY])
+ROWS = PythonType("Iterable", module="typing", child=[ROW])
+MAPPING = PythonType("Mapping", module="typing", child=[PythonType("str"), ANY])
+DICT = PythonType("Dict", module="typing", child=[PythonType("str"), ANY])
+
+FUNCTIONS = '''def {name}_from_row(row: {row}) -> {type_}:
+    """{type_} from values in order of its fields"""
+    return {type_}({from_row})
+
+
+def {name}_from_rows(rows: {rows}) -> {items}:
+    return [{type_}({from_row}) for row in rows]
+
+
+def {name}_from_mapping(mapping: {mapping}) -> {type_}:
+    return {type_}({from_mapping})
+
+
+def {name}_to_dict(value: {type_}) -> {dict_}:
+    return {{{to_dict}}}'''
+
+
+class Kinds(t.NamedTuple):
+    objects: t.Set[str]
+    enums: t.Set[str]
+
+
+def named_type(type_: ast.TypeNode) -> str:
+    while not isinstance(type_, ast.NamedTypeNode):
+        type_ = type_.type  # type: ignore
+    return type_.name.value
+
+
+def convert(
+    type_: ast.TypeNode,
+    value: str,
+    kinds: Kinds,
+    suffix: str,
+    depth: int = 0,
+    name: t.Optional[str] = None,
+) -> str:
+    """Expression converting `value` of schema type, `value` when it needs none
+
+    Objects are converted with their `<name>_<suffix>` functions, enums are
+    made from values and turned back into them by `to_dict`. Nullable `value`
+    is evaluated once when it is bound to variable `name`.
+    """
+    nullable = not isinstance(type_, ast.NonNullTypeNode)
+    target = name if nullable and name else value
+    if isinstance(type_, ast.NonNullTypeNode):
+        type_ = type_.type
+    if isinstance(type_, ast.ListTypeNode):
+        item = f"item_{depth}" if depth else "item"
+        converted = convert(type_.type, item, kinds, suffix, depth + 1)
+        if converted == item:
+            return value
+        expression = f"[{converted} for {item} in {target}]"
+    else:
+        type_name = named_type(type_)
+        if type_name in kinds.objects:
+            expression = f"{camel_to_snake(type_name)}_{suffix}({target})"
+        elif type_name not in kinds.enums:
+            return value
+        elif suffix == "to_dict":
+            expression = f"{target}.value"
+        else:
+            expression = f"{type_name}({target})"
+    if not nullable:
+        return expression
+    if target != value:
+        return f"None if ({target} := {value}) is None else {expression}"
+    return f"None if {value} is None else {expression}"
+
+
+def generate_converters(
+    root: DocumentNode, known_types: t.Mapping[str, str]
+) -> t.Iterator[CodeBlock]:
+    objects = [
+        definition
+        for definition in root.definitions
+        if isinstance(definition, ast.ObjectTypeDefinitionNode)
+        and definition.name.value not in ROOT_TYPES
+    ]
+    kinds = Kinds(
+        objects={definition.name.value for definition in objects},
+        enums={
+            definition.name.value
+            for definition in root.definitions
+            if isinstance(definition, ast.EnumTypeDefinitionNode)
+        },
+    )
+    for definition in objects:
+        yield process_object(definition, known_types, kinds)
+
+
+def process_object(
+    definition: ast.ObjectTypeDefinitionNode,
+    known_types: t.Mapping[str, str],
+    kinds: Kinds,
+) -> CodeBlock:
+    type_ = PythonType(definition.name.value, module=TYPES_MODULE)
+    items = PythonType("List", module="typing", child=[type_])
+    fields = [
+        (field, camel_to_snake(field.name.value), bool(result.default))
+        for field, result in class_fields(definition, known_types)
+    ]
+    # nullable values are bound to variables, they are read only once
+    from_row = ", ".join(
+        convert(field.type, f"row[{index}]", kinds, "from_row", name=f"value_{index}")
+        for index, (field, _, _) in enumerate(fields)
+    )
+    from_mapping = ", ".join(
+        convert(
+            field.type,
+            f'mapping.get("{name}")' if optional else f'mapping["{name}"]',
+            kinds,
+            "from_mapping",
+            name=f"value_{index}",
+        )
+        for index, (field, name, optional) in enumerate(fields)
+    )
+    to_dict = ", ".join(
+        f'"{name}": {convert(field.type, f"value.{name}", kinds, "to_dict")}'
+        for field, name, _ in fields
+    )
+    enums = {named_type(field.type) for field, _, _ in fields} & kinds.enums
+    return CodeBlock(
+        body=FUNCTIONS.format(
+            name=camel_to_snake(definition.name.value),
+            type_=type_.render(MODULE),
+            row=ROW.render(MODULE),
+            rows=ROWS.render(MODULE),
+            items=items.render(MODULE),
+            mapping=MAPPING.render(MODULE),
+            dict_=DICT.render(MODULE),
+            from_row=from_row,
+            from_mapping=from_mapping,
+            to_dict=to_dict,
+        ),
+        used_types=[
+            type_,
+            items,
+            ROWS,
+            MAPPING,
+            DICT,
+            *(PythonType(enum, module=TYPES_MODULE) for enum in sorted(enums)),
+        ],
+    )
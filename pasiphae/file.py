@@ -1,24 +1,29 @@
 import itertools as it
 import operator
 import typing as t
+from functools import lru_cache
 from pathlib import Path
 
-import black
-from isort.api import sort_file
-
 from .domain import CodeBlock
 from .domain import Import
 
+if t.TYPE_CHECKING:
+    import isort
+
+# runtime modules are the same in every service, they are formatted once
+FORMAT_CACHE_SIZE = 256
 
-def write(root: Path, name: str, codeblocks: t.Iterator[CodeBlock]) -> None:
-    file_name = root / f"{name}.py"
-    with open(root / f"{name}.py", "w") as f:
-        f.writelines(it.chain(*zip(generate_lines(name, codeblocks), it.cycle("\n"))))
-    reformat_file(file_name)
+HEADER = "# generated by pasiphae, please do not change manually"
+SERVICE_HEADER = (
+    "# implemented by the service, pasiphae keeps this code and merges new\n"
+    "# definitions into it when the service is regenerated"
+)
 
 
-def generate_lines(name: str, codeblocks: t.Iterator[CodeBlock]) -> t.Iterator[str]:
-    yield "# generated by pasiphae, please do not change manually"
+def generate_lines(
+    name: str, codeblocks: t.Iterator[CodeBlock], header: str = HEADER
+) -> t.Iterator[str]:
+    yield header
     module = f".{name}"
     codeblocks, for_imports = it.tee(codeblocks, 2)
 
@@ -33,17 +38,30 @@ def generate_lines(name: str, codeblocks: t.Iterator[CodeBlock]) -> t.Iterator[s
 
     yield ""
     for definition in sorted(codeblocks, key=operator.attrgetter("weight")):
-        if definition:
+        if definition.body:
             yield definition.body
             yield ""
 
 
-def reformat_file(path: Path) -> None:
-    black.reformat_one(
-        src=path,
-        fast=False,
-        write_back=black.WriteBack.YES,
-        mode=black.Mode(),
-        report=black.Report(quiet=True),
-    )
-    sort_file(path, quiet=True)
+def render(name: str, codeblocks: t.Iterator[CodeBlock], header: str = HEADER) -> str:
+    return "".join(f"{line}\n" for line in generate_lines(name, codeblocks, header))
+
+
+# black and isort are slow to import, they are loaded once code is formatted
+@lru_cache(maxsize=None)
+def isort_config(root: Path) -> "isort.Config":
+    """Settings of project with `root`, which may be not created yet"""
+    import isort
+
+    while not root.is_dir():
+        root = root.parent
+    return isort.Config(settings_path=str(root))
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def format_source(code: str, config: t.Optional["isort.Config"] = None) -> str:
+    import black
+    import isort
+
+    code = black.format_str(code, mode=black.Mode())
+    return isort.code(code, config=config) if config else isort.code(code)
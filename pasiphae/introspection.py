@@ -0,0 +1,89 @@
+import hashlib
+import json
+import typing as t
+
+import graphql
+from graphql import DocumentNode
+from graphql import GraphQLDirective
+
+from .app import App
+from .domain import Import
+
+# query sent by graphql-js `getIntrospectionQuery()` with default options
+QUERY = graphql.get_introspection_query(descriptions=True)
+
+HEADER = """# generated by pasiphae, please do not change manually
+import typing as t
+
+from ariadne.asgi import GraphQL
+from ariadne.exceptions import HttpError
+from starlette.requests import Request
+from starlette.responses import Response
+"""
+
+RUNTIME = '''
+
+def is_standard(data: t.Any) -> bool:
+    return (
+        isinstance(data, dict)
+        and isinstance(data.get("query"), str)
+        and " ".join(data["query"].split()) == QUERY
+        and data.get("operationName") in (None, "IntrospectionQuery")
+        and not data.get("variables")
+    )
+
+
+class IntrospectionGraphQL(GraphQL):
+    """GraphQL app answering the standard introspection query with stored result
+
+    Result was computed from the schema when the service was generated, it is
+    sent without context, extensions or execution. Other introspection queries
+    are executed as usual.
+    """
+
+    async def graphql_http_server(self, request: Request) -> Response:
+        if not self.introspection:
+            return await super().graphql_http_server(request)
+        try:
+            data = await self.extract_data_from_request(request)
+        except HttpError:
+            return await super().graphql_http_server(request)
+        if not is_standard(data):
+            return await super().graphql_http_server(request)
+        headers = {"ETag": ETAG}
+        matching = request.headers.get("if-none-match", "")
+        if {tag.strip() for tag in matching.split(",")} & {ETAG, "*"}:
+            return Response(status_code=304, headers=headers)
+        return Response(RESPONSE, media_type="application/json", headers=headers)
+'''
+
+
+def introspect(
+    document: DocumentNode, directives: t.Sequence[GraphQLDirective] = ()
+) -> t.Dict[str, t.Any]:
+    """Result of standard introspection query of schema the app builds"""
+    schema = graphql.build_ast_schema(document)
+    schema.directives = (*schema.directives, *directives)
+    result = graphql.graphql_sync(schema, QUERY)
+    if result.errors:
+        raise ValueError(f"Cannot introspect schema: {result.errors[0].message}")
+    assert result.data is not None
+    return result.data
+
+
+def render(
+    document: DocumentNode, directives: t.Sequence[GraphQLDirective] = ()
+) -> str:
+    response = json.dumps(
+        {"data": introspect(document, directives)}, separators=(",", ":")
+    ).encode()
+    etag = f'"{hashlib.sha256(response).hexdigest()[:32]}"'
+    query = " ".join(QUERY.split())
+    return (
+        f"{HEADER}\nETAG = {etag!r}\nQUERY = {query!r}\n"
+        f"RESPONSE = {response!r}\n{RUNTIME}"
+    )
+
+
+def extend_app(app: App) -> None:
+    app.servers.append(Import("IntrospectionGraphQL", ".introspection"))
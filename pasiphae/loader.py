@@ -0,0 +1,207 @@
+import hashlib
+import itertools as it
+import os
+import pickle
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from pathlib import Path
+
+import graphql
+from graphql import DocumentNode
+from graphql.language import ast
+
+SUFFIX = ".graphql"
+GENERATED = ".generated"
+GLOB_CHARACTERS = "*?["
+# parsing in worker processes pays off only for many files
+PARALLEL_THRESHOLD = 8
+
+Extension = t.Union[ast.SchemaExtensionNode, ast.TypeExtensionNode]
+
+EXTENDED: t.Mapping[t.Type[Extension], t.Type[ast.Node]] = {
+    ast.SchemaExtensionNode: ast.SchemaDefinitionNode,
+    ast.ScalarTypeExtensionNode: ast.ScalarTypeDefinitionNode,
+    ast.ObjectTypeExtensionNode: ast.ObjectTypeDefinitionNode,
+    ast.InterfaceTypeExtensionNode: ast.InterfaceTypeDefinitionNode,
+    ast.UnionTypeExtensionNode: ast.UnionTypeDefinitionNode,
+    ast.EnumTypeExtensionNode: ast.EnumTypeDefinitionNode,
+    ast.InputObjectTypeExtensionNode: ast.InputObjectTypeDefinitionNode,
+}
+EXTENSIONS = tuple(EXTENDED)
+MERGED_ATTRIBUTES = (
+    "directives",
+    "interfaces",
+    "fields",
+    "types",
+    "values",
+    "operation_types",
+)
+
+
+def is_glob(part: str) -> bool:
+    return any(character in part for character in GLOB_CHARACTERS)
+
+
+def is_schema_file(path: Path) -> bool:
+    return (
+        path.is_file() and path.suffix == SUFFIX and not path.stem.endswith(GENERATED)
+    )
+
+
+def find_files(schema: Path) -> t.Tuple[Path, t.List[Path]]:
+    """Directory with schema files and the files: one, all in directory or glob"""
+    if schema.is_dir():
+        return schema, sorted(filter(is_schema_file, schema.rglob(f"*{SUFFIX}")))
+    if not any(map(is_glob, schema.parts)):
+        return schema.parent, [schema]
+    root = Path(*it.takewhile(lambda part: not is_glob(part), schema.parts))
+    pattern = str(schema.relative_to(root))
+    return root, sorted(filter(is_schema_file, root.glob(pattern)))
+
+
+class ParseCache:
+    """Parsed documents by hash of source, stored on disk when directory is set"""
+
+    def __init__(self, directory: t.Optional[Path] = None) -> None:
+        self.directory = directory
+        self.documents: t.Dict[str, DocumentNode] = {}
+
+    @staticmethod
+    def key(source: str) -> str:
+        return hashlib.sha256(f"{graphql.version}\n{source}".encode()).hexdigest()
+
+    def get(self, key: str) -> t.Optional[DocumentNode]:
+        if key in self.documents or self.directory is None:
+            return self.documents.get(key)
+        try:
+            with open(self.directory / f"{key}.pickle", "rb") as f:
+                document = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        self.documents[key] = document
+        return document
+
+    def set(self, key: str, document: DocumentNode) -> None:
+        self.documents[key] = document
+        if self.directory is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.pickle"
+        temporary = path.with_suffix(f".{os.getpid()}")
+        with open(temporary, "wb") as f:
+            pickle.dump(document, f)
+        temporary.replace(path)
+
+
+def parse(source: str, name: str) -> DocumentNode:
+    return graphql.parse(graphql.Source(source, name), no_location=True)
+
+
+def try_parse(source: str, name: str) -> t.Optional[DocumentNode]:
+    # syntax errors cannot be sent back from worker process, file is parsed
+    # again in main process to raise it
+    try:
+        return parse(source, name)
+    except graphql.GraphQLSyntaxError:
+        return None
+
+
+def parse_files(
+    files: t.Sequence[Path],
+    cache: t.Optional[ParseCache] = None,
+    parallel: bool = True,
+) -> DocumentNode:
+    cache = cache or ParseCache()
+    sources = [file.read_text() for file in files]
+    keys = list(map(cache.key, sources))
+    documents = list(map(cache.get, keys))
+    missing = [index for index, document in enumerate(documents) if document is None]
+    if parallel and len(missing) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            parsed = list(
+                executor.map(
+                    try_parse,
+                    [sources[index] for index in missing],
+                    [str(files[index]) for index in missing],
+                )
+            )
+    else:
+        parsed = [None] * len(missing)
+    for index, document in zip(missing, parsed):
+        document = document or parse(sources[index], str(files[index]))
+        cache.set(keys[index], document)
+        documents[index] = document
+    return DocumentNode(
+        definitions=tuple(
+            it.chain.from_iterable(
+                document.definitions for document in documents if document
+            )
+        )
+    )
+
+
+def definition_key(node: t.Union[ast.TypeSystemDefinitionNode, Extension]) -> str:
+    name = getattr(node, "name", None)
+    return name.value if name else "schema"
+
+
+def extend(definition: ast.Node, extension: Extension) -> ast.Node:
+    if EXTENDED[type(extension)] is not type(definition):
+        raise ValueError(
+            f"Cannot extend {definition_key(extension)} with {extension.kind}"
+        )
+    extended = copy(definition)
+    for attribute in MERGED_ATTRIBUTES:
+        if attribute in extension.keys:
+            setattr(
+                extended,
+                attribute,
+                (
+                    *(getattr(definition, attribute) or ()),
+                    *(getattr(extension, attribute) or ()),
+                ),
+            )
+    return extended
+
+
+def to_definition(extension: Extension) -> ast.Node:
+    return EXTENDED[type(extension)](
+        **{key: getattr(extension, key) for key in extension.keys if key != "loc"}
+    )
+
+
+def merge_extensions(document: DocumentNode) -> DocumentNode:
+    """Merge `extend` definitions into their base definitions
+
+    Extension of type which is not defined (e.g. entity of other federated
+    service) becomes its definition.
+    """
+    definitions: t.List[ast.Node] = [
+        definition
+        for definition in document.definitions
+        if not isinstance(definition, EXTENSIONS)
+    ]
+    positions = {
+        definition_key(definition): index
+        for index, definition in enumerate(definitions)
+        if isinstance(definition, (ast.TypeDefinitionNode, ast.SchemaDefinitionNode))
+    }
+    for extension in document.definitions:
+        if not isinstance(extension, EXTENSIONS):
+            continue
+        key = definition_key(extension)
+        if key in positions:
+            definitions[positions[key]] = extend(definitions[positions[key]], extension)
+        else:
+            positions[key] = len(definitions)
+            definitions.append(to_definition(extension))
+    return DocumentNode(definitions=tuple(definitions))
+
+
+def load(
+    files: t.Sequence[Path],
+    cache: t.Optional[ParseCache] = None,
+    parallel: bool = True,
+) -> DocumentNode:
+    return merge_extensions(parse_files(files, cache, parallel))
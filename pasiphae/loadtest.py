@@ -0,0 +1,252 @@
+import typing as t
+
+from graphql import DocumentNode
+from graphql import print_ast
+from graphql.language import ast
+
+from .resolvers import to_resolve_function_argument
+from .scalars import get_codec
+from .types import MODULE as TYPES_MODULE
+
+MAX_DEPTH = 2
+
+BUILD_IN_VALUES: t.Mapping[str, str] = {
+    "ID": '"1"',
+    "String": '"loadtest"',
+    "Float": "1.0",
+    "Int": "1",
+    "Boolean": "true",
+}
+
+CODEC_VALUES: t.Mapping[str, str] = {
+    "datetime": '"2020-01-01T00:00:00+00:00"',
+    "date": '"2020-01-01"',
+    "time": '"00:00:00"',
+    "uuid": '"00000000-0000-0000-0000-000000000001"',
+    "decimal": '"1.0"',
+}
+
+LEAF_TYPES = (ast.ScalarTypeDefinitionNode, ast.EnumTypeDefinitionNode)
+Definitions = t.Mapping[str, ast.TypeDefinitionNode]
+
+HEADER = """# generated by pasiphae, please do not change manually
+import argparse
+import asyncio
+import json
+import typing as t
+from time import perf_counter
+
+from .transport import Connection
+from .transport import Send
+from .transport import in_process
+"""
+
+RUNTIME = """
+def percentile(latencies: t.Sequence[float], fraction: float) -> float:
+    if not latencies:
+        return 0.0
+    return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+
+async def run_operation(
+    senders: t.Sequence[Send], query: str, requests: int
+) -> t.Dict[str, float]:
+    body = json.dumps({"query": query}).encode()
+    latencies: t.List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker(send: Send) -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = perf_counter()
+            status, response = await send(body)
+            latencies.append(perf_counter() - start)
+            if status != 200 or b'"errors"' in response:
+                errors += 1
+
+    start = perf_counter()
+    await asyncio.gather(*map(worker, senders))
+    elapsed = perf_counter() - start
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "rps": requests / elapsed,
+        "p50": percentile(latencies, 0.50) * 1000,
+        "p95": percentile(latencies, 0.95) * 1000,
+        "p99": percentile(latencies, 0.99) * 1000,
+    }
+
+
+async def run(
+    operations: t.Mapping[str, str],
+    concurrency: int,
+    requests: int,
+    url: t.Optional[str],
+) -> t.Dict[str, t.Dict[str, float]]:
+    if url is None:
+        from .app import app
+
+        send = in_process(app)
+        return {
+            name: await run_operation([send] * concurrency, query, requests)
+            for name, query in operations.items()
+        }
+    connections = [Connection(url) for _ in range(concurrency)]
+    try:
+        return {
+            name: await run_operation(
+                [connection.send for connection in connections], query, requests
+            )
+            for name, query in operations.items()
+        }
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def report(results: t.Mapping[str, t.Mapping[str, float]]) -> str:
+    width = max(map(len, ("operation", *results)))
+    lines = [
+        f"{'operation':<{width}} {'requests':>9} {'errors':>9} {'rps':>9}"
+        f" {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    ]
+    for name, result in results.items():
+        lines.append(
+            f"{name:<{width}} {result['requests']:>9.0f} {result['errors']:>9.0f}"
+            f" {result['rps']:>9.0f} {result['p50']:>9.2f} {result['p95']:>9.2f}"
+            f" {result['p99']:>9.2f}"
+        )
+    return "\\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test generated service")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument(
+        "--url", help="service url, app is called in-process when not provided"
+    )
+    parser.add_argument("--operation", action="append", choices=sorted(OPERATIONS))
+    args = parser.parse_args()
+    operations = {
+        name: query
+        for name, query in OPERATIONS.items()
+        if not args.operation or name in args.operation
+    }
+    results = asyncio.run(run(operations, args.concurrency, args.requests, args.url))
+    print(report(results))
+
+
+if __name__ == "__main__":
+    main()
+"""
+
+
+def named_type(type_: ast.TypeNode) -> str:
+    if isinstance(type_, (ast.NonNullTypeNode, ast.ListTypeNode)):
+        return named_type(type_.type)
+    assert isinstance(type_, ast.NamedTypeNode)
+    return type_.name.value
+
+
+def is_required(argument: ast.InputValueDefinitionNode) -> bool:
+    return isinstance(argument.type, ast.NonNullTypeNode) and not argument.default_value
+
+
+def to_value(type_: ast.TypeNode, definitions: Definitions) -> str:
+    if isinstance(type_, ast.NonNullTypeNode):
+        return to_value(type_.type, definitions)
+    if isinstance(type_, ast.ListTypeNode):
+        return f"[{to_value(type_.type, definitions)}]"
+    name = named_type(type_)
+    definition = definitions.get(name)
+    if isinstance(definition, ast.EnumTypeDefinitionNode):
+        return definition.values[0].name.value
+    if isinstance(definition, ast.InputObjectTypeDefinitionNode):
+        fields = ", ".join(
+            f"{field.name.value}: {to_value(field.type, definitions)}"
+            for field in definition.fields
+            if is_required(field)
+        )
+        return f"{{{fields}}}"
+    if name in BUILD_IN_VALUES:
+        return BUILD_IN_VALUES[name]
+    return CODEC_VALUES.get(get_codec(name) or "", BUILD_IN_VALUES["String"])
+
+
+def to_arguments(
+    arguments: t.Sequence[ast.InputValueDefinitionNode], definitions: Definitions
+) -> str:
+    """Defaults the resolver gets are sent, other optional arguments are not"""
+    known_types = {name: TYPES_MODULE for name in definitions}
+    rendered = []
+    for argument in arguments:
+        resolver_argument = to_resolve_function_argument(argument, known_types)
+        if argument.default_value and resolver_argument.default:
+            value = print_ast(argument.default_value)
+        elif resolver_argument.type_.name == "Optional":
+            continue
+        else:
+            value = to_value(argument.type, definitions)
+        rendered.append(f"{argument.name.value}: {value}")
+    return f"({', '.join(rendered)})" if rendered else ""
+
+
+def is_leaf(name: str, definitions: Definitions) -> bool:
+    return isinstance(definitions.get(name), (type(None), *LEAF_TYPES))
+
+
+def to_selection(name: str, definitions: Definitions, depth: int = 1) -> str:
+    definition = definitions.get(name)
+    if is_leaf(name, definitions):
+        return ""
+    if not isinstance(
+        definition, (ast.ObjectTypeDefinitionNode, ast.InterfaceTypeDefinitionNode)
+    ):
+        return " { __typename }"
+    selections = []
+    for field in definition.fields:
+        if any(map(is_required, field.arguments)):
+            continue
+        field_type = named_type(field.type)
+        if is_leaf(field_type, definitions):
+            selections.append(field.name.value)
+        elif depth < MAX_DEPTH:
+            selection = to_selection(field_type, definitions, depth + 1)
+            selections.append(f"{field.name.value}{selection}")
+    return f" {{ {' '.join(selections or ['__typename'])} }}"
+
+
+def generate_operations(document: DocumentNode) -> t.Dict[str, str]:
+    """Representative query for every `Query` field
+
+    Required arguments and defaults known to the resolvers are passed, enums
+    get their first value.
+    """
+    definitions: Definitions = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, ast.TypeDefinitionNode)
+    }
+    query = definitions.get("Query")
+    if not isinstance(query, ast.ObjectTypeDefinitionNode):
+        return {}
+    return {
+        field.name.value: (
+            f"query {field.name.value[0].upper()}{field.name.value[1:]} {{ "
+            f"{field.name.value}{to_arguments(field.arguments, definitions)}"
+            f"{to_selection(named_type(field.type), definitions)} }}"
+        )
+        for field in query.fields
+    }
+
+
+def render(document: DocumentNode) -> str:
+    operations = "\n".join(
+        f"    {name!r}: {query!r},"
+        for name, query in generate_operations(document).items()
+    )
+    return f"{HEADER}\nOPERATIONS = {{\n{operations}\n}}\n\n{RUNTIME}"
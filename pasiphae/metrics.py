@@ -0,0 +1,203 @@
+from .app import App
+from .domain import Import
+
+RUNTIME = '''# generated by pasiphae, please do not change manually
+import os
+import typing as t
+from bisect import bisect_left
+from inspect import isawaitable
+from time import perf_counter
+
+from ariadne.types import Extension
+from graphql import GraphQLObjectType
+from graphql import GraphQLResolveInfo
+from graphql import GraphQLSchema
+
+BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+RESOLVER_PREFIX = "resolve_"
+CONTENT_TYPE = b"text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    __slots__ = ("name", "buckets", "sum", "calls", "errors")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.calls = 0
+        self.errors = 0
+
+    def observe(self, seconds: float) -> None:
+        self.buckets[bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+
+
+class Registry:
+    """Histograms of all generated resolvers, allocated once per schema
+
+    Every resolver call and error is counted, latency is recorded for every
+    `sample_every` call only.
+    """
+
+    def __init__(self, sample_rate: float = 1.0) -> None:
+        self.histograms: t.Dict[str, t.Dict[str, Histogram]] = {}
+        self.sample_every = 1
+        self.set_sample_rate(sample_rate)
+
+    def set_sample_rate(self, sample_rate: float) -> None:
+        if not 0 < sample_rate <= 1:
+            raise ValueError("Sample rate should be in (0, 1] range")
+        self.sample_every = round(1 / sample_rate)
+
+    def register(self, schema: GraphQLSchema) -> None:
+        for type_ in schema.type_map.values():
+            if not isinstance(type_, GraphQLObjectType):
+                continue
+            for field_name, field in type_.fields.items():
+                name = getattr(field.resolve, "__name__", "")
+                if name.startswith(RESOLVER_PREFIX):
+                    fields = self.histograms.setdefault(type_.name, {})
+                    fields[field_name] = Histogram(name)
+
+    def get(self, info: GraphQLResolveInfo) -> t.Optional[Histogram]:
+        fields = self.histograms.get(info.parent_type.name)
+        return fields.get(info.field_name) if fields else None
+
+    def render(self) -> str:
+        histograms = [
+            histogram
+            for fields in self.histograms.values()
+            for histogram in fields.values()
+        ]
+        lines = [
+            "# HELP graphql_resolver_duration_seconds Sampled resolver latency.",
+            "# TYPE graphql_resolver_duration_seconds histogram",
+        ]
+        for histogram in histograms:
+            label = f'resolver="{histogram.name}"'
+            total = 0
+            for bound, count in zip((*map(str, BUCKETS), "+Inf"), histogram.buckets):
+                total += count
+                lines.append(
+                    f'graphql_resolver_duration_seconds_bucket{{{label},le="{bound}"}}'
+                    f" {total}"
+                )
+            lines.append(
+                f"graphql_resolver_duration_seconds_sum{{{label}}} {histogram.sum}"
+            )
+            lines.append(f"graphql_resolver_duration_seconds_count{{{label}}} {total}")
+        lines += [
+            "# HELP graphql_resolver_calls_total Resolver calls.",
+            "# TYPE graphql_resolver_calls_total counter",
+            *(
+                f'graphql_resolver_calls_total{{resolver="{histogram.name}"}}'
+                f" {histogram.calls}"
+                for histogram in histograms
+            ),
+            "# HELP graphql_resolver_errors_total Resolver errors.",
+            "# TYPE graphql_resolver_errors_total counter",
+            *(
+                f'graphql_resolver_errors_total{{resolver="{histogram.name}"}}'
+                f" {histogram.errors}"
+                for histogram in histograms
+            ),
+        ]
+        return "\\n".join(lines) + "\\n"
+
+
+registry = Registry(float(os.environ.get("METRICS_SAMPLE_RATE", "1.0")))
+
+
+async def count_errors(result: t.Awaitable[t.Any], histogram: Histogram) -> t.Any:
+    try:
+        return await result
+    except Exception:
+        histogram.errors += 1
+        raise
+
+
+async def measure(
+    result: t.Awaitable[t.Any], histogram: Histogram, start: float
+) -> t.Any:
+    try:
+        return await result
+    except Exception:
+        histogram.errors += 1
+        raise
+    finally:
+        histogram.observe(perf_counter() - start)
+
+
+class ResolverMetrics(Extension):
+    def resolve(
+        self,
+        next_: t.Callable[..., t.Any],
+        obj: t.Any,
+        info: GraphQLResolveInfo,
+        **kwargs: t.Any,
+    ) -> t.Any:
+        histogram = registry.get(info)
+        if histogram is None:
+            return next_(obj, info, **kwargs)
+        histogram.calls += 1
+        if histogram.calls % registry.sample_every:
+            try:
+                result = next_(obj, info, **kwargs)
+            except Exception:
+                histogram.errors += 1
+                raise
+            return count_errors(result, histogram) if isawaitable(result) else result
+        start = perf_counter()
+        try:
+            result = next_(obj, info, **kwargs)
+        except Exception:
+            histogram.errors += 1
+            histogram.observe(perf_counter() - start)
+            raise
+        if isawaitable(result):
+            return measure(result, histogram, start)
+        histogram.observe(perf_counter() - start)
+        return result
+
+
+def metrics_endpoint(app: t.Any, path: str = "/metrics") -> t.Any:
+    async def wrapper(scope: t.Any, receive: t.Any, send: t.Any) -> None:
+        if scope["type"] != "http" or scope["path"] != path:
+            return await app(scope, receive, send)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", CONTENT_TYPE)],
+            }
+        )
+        await send({"type": "http.response.body", "body": registry.render().encode()})
+
+    return wrapper
+'''
+
+
+def extend_app(app: App) -> None:
+    app.imports += [
+        Import("ResolverMetrics", ".metrics"),
+        Import("metrics_endpoint", ".metrics"),
+        Import("registry", ".metrics"),
+    ]
+    app.setup.append("registry.register(schema)")
+    app.options["extensions"] = "[ResolverMetrics]"
+    app.wrappers.append("metrics_endpoint")
@@ -0,0 +1,166 @@
+from graphql import DocumentNode
+from graphql.language import ast
+
+from .app import App
+from .domain import Import
+from .scalars import build_in_types
+from .scalars import get_codec
+from .scalars import get_type
+
+# builtin python types with mock values, besides the scalar codecs
+BUILTIN_VALUES = ("str", "int", "float", "bool")
+
+HEADER = """# generated by pasiphae, please do not change manually
+import os
+import typing as t
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timezone
+from decimal import Decimal
+from uuid import UUID
+from zlib import crc32
+
+from graphql import GraphQLObjectType
+from graphql import GraphQLOutputType
+from graphql import GraphQLSchema
+from graphql import get_named_type
+from graphql import is_abstract_type
+from graphql import is_enum_type
+from graphql import is_leaf_type
+from graphql import is_list_type
+from graphql import is_non_null_type
+
+SEED = int(os.environ.get("MOCK_SEED", "0"))
+LIST_SIZE = int(os.environ.get("MOCK_LIST_SIZE", "3"))
+
+Value = t.Callable[[int], t.Any]
+
+# values of python types and scalar codecs the scalars are mapped to
+VALUES: t.Dict[str, Value] = {
+    "str": lambda key: f"mock {key}",
+    "int": lambda key: key % 1000,
+    "float": lambda key: key % 100000 / 100,
+    "bool": lambda key: bool(key & 1),
+    "uuid": lambda key: UUID(int=key),
+    "decimal": lambda key: Decimal(key % 100000).scaleb(-2),
+    "datetime": lambda key: datetime.fromtimestamp(key, timezone.utc),
+    "date": lambda key: date.fromordinal(730120 + key % 36525),
+    "time": lambda key: time(key % 24, key // 24 % 60, key // 1440 % 60),
+}
+"""
+
+RUNTIME = '''
+
+class Mock:
+    """Object of schema type, its fields are generated when requested
+
+    Every value is derived from the key, which is a checksum of the seed and
+    the path to the value, so the same query always gets the same data.
+    """
+
+    __slots__ = ("key", "typename")
+
+    def __init__(self, key: int, typename: str) -> None:
+        self.key = key
+        self.typename = typename
+
+
+def list_value(item: Value, size: int) -> Value:
+    indexes = [index.to_bytes(4, "little") for index in range(size)]
+
+    def value(key: int) -> t.Iterator[t.Any]:
+        return (item(crc32(index, key)) for index in indexes)
+
+    return value
+
+
+def to_value(
+    type_: GraphQLOutputType, schema: GraphQLSchema, list_size: int
+) -> Value:
+    if is_non_null_type(type_):
+        return to_value(type_.of_type, schema, list_size)  # type: ignore
+    if is_list_type(type_):
+        item = to_value(type_.of_type, schema, list_size)  # type: ignore
+        return list_value(item, list_size)
+    named = get_named_type(type_)
+    if is_enum_type(named):
+        # enum values are already bound to enums from types module
+        members = [value.value for value in named.values.values()]  # type: ignore
+        return lambda key: members[key % len(members)]
+    if is_leaf_type(named):
+        return SCALARS.get(named.name, VALUES["str"])
+    if is_abstract_type(named):
+        names = [possible.name for possible in schema.get_possible_types(named)]
+        return lambda key: Mock(key, names[key % len(names)])
+    return lambda key: Mock(key, named.name)
+
+
+def field_resolver(name: str, value: Value, seed: int) -> t.Callable[..., t.Any]:
+    path = name.encode()
+
+    def resolve(parent: t.Any, *_: t.Any, **__: t.Any) -> t.Any:
+        key = parent.key if isinstance(parent, Mock) else seed
+        return value(crc32(path, key))
+
+    return resolve
+
+
+def resolve_mock_type(mock: Mock, *_: t.Any) -> str:
+    return mock.typename
+
+
+def mock_schema(
+    schema: GraphQLSchema,
+    seed: int = SEED,
+    list_size: int = LIST_SIZE,
+    list_sizes: t.Optional[t.Mapping[str, int]] = None,
+) -> None:
+    """Replace resolvers of all fields with deterministic fake data
+
+    List size can be changed for single fields with `{"Type.field": size}`.
+    """
+    list_sizes = list_sizes or {}
+    for type_ in schema.type_map.values():
+        # introspection and federation types keep their resolvers
+        if type_.name.startswith("_") or type_ is schema.subscription_type:
+            continue
+        if is_abstract_type(type_):
+            type_.resolve_type = resolve_mock_type  # type: ignore
+        if not isinstance(type_, GraphQLObjectType):
+            continue
+        for name, field in type_.fields.items():
+            if name.startswith("_"):
+                continue
+            size = list_sizes.get(f"{type_.name}.{name}", list_size)
+            value = to_value(field.type, schema, size)
+            field.resolve = field_resolver(name, value, seed)
+'''
+
+
+def to_values_key(scalar: str) -> str:
+    """Values of scalar codec or builtin python type, strings for the others"""
+    codec = get_codec(scalar)
+    if codec is not None:
+        return codec
+    type_ = get_type(scalar)
+    if type_ is not None and type_.module is None and type_.name in BUILTIN_VALUES:
+        return type_.name
+    return "str"
+
+
+def render(document: DocumentNode) -> str:
+    names = [*build_in_types] + [
+        definition.name.value
+        for definition in document.definitions
+        if isinstance(definition, ast.ScalarTypeDefinitionNode)
+    ]
+    values = "\n".join(
+        f'    "{name}": VALUES["{to_values_key(name)}"],' for name in names
+    )
+    return f"{HEADER}\nSCALARS: t.Dict[str, Value] = {{\n{values}\n}}\n\n{RUNTIME}"
+
+
+def extend_app(app: App) -> None:
+    app.imports.append(Import("mock_schema", ".mock"))
+    app.setup.append("mock_schema(schema)")
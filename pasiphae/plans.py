@@ -0,0 +1,676 @@
+import dataclasses as d
+import itertools
+import typing as t
+
+import graphql
+from graphql import DocumentNode
+from graphql import GraphQLNamedType
+from graphql import GraphQLObjectType
+from graphql import GraphQLOutputType
+from graphql import GraphQLSchema
+from graphql.execution.collect_fields import collect_fields
+from graphql.execution.collect_fields import collect_sub_fields
+from graphql.language import ast
+
+from .app import App
+from .client import document_source
+from .client import document_text
+from .domain import Import
+from .tools import camel_to_snake
+
+RUNTIME = '''# generated by pasiphae, please do not change manually
+import asyncio
+import typing as t
+from collections.abc import Mapping
+
+from ariadne.asgi import GraphQL
+from ariadne.exceptions import HttpError
+from ariadne.graphql import handle_query_result
+from graphql import DocumentNode
+from graphql import ExecutionResult
+from graphql import FieldNode
+from graphql import GraphQLError
+from graphql import GraphQLResolveInfo as Info
+from graphql import GraphQLSchema
+from graphql import OperationDefinitionNode
+from graphql import Undefined
+from graphql import located_error
+from graphql import parse
+from graphql import validate
+from graphql.execution.values import get_argument_values
+from graphql.execution.values import get_variable_values
+from graphql.pyutils import Path
+from graphql.pyutils import inspect
+from graphql.pyutils import is_awaitable
+from graphql.pyutils import is_iterable
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+class Errors:
+    """Field errors of execution, without errors below already nulled fields"""
+
+    def __init__(self) -> None:
+        self.errors: t.List[GraphQLError] = []
+        self.nulled: t.Set[t.Optional[Path]] = set()
+
+    def add(self, error: GraphQLError, path: t.Optional[Path]) -> None:
+        position = path
+        while position is not None:
+            if position in self.nulled:
+                return
+            position = position.prev
+        if None in self.nulled:
+            return
+        self.nulled.add(path)
+        self.errors.append(error)
+
+
+class Execution:
+    """State of one execution of a plan"""
+
+    __slots__ = ("root", "variables", "info", "errors")
+
+    def __init__(
+        self, root: t.Any, variables: t.Dict[str, t.Any], info: t.Tuple, errors: Errors
+    ) -> None:
+        self.root = root
+        self.variables = variables
+        # resolve info values which are the same for all fields
+        self.info = info
+        self.errors = errors
+
+
+class Plan:
+    """Known operation with the function executing it"""
+
+    def __init__(
+        self,
+        source: str,
+        document: DocumentNode,
+        execute: t.Callable[[Execution], t.Awaitable[t.Any]],
+    ) -> None:
+        self.source = source
+        self.document = document
+        self.operation = t.cast(OperationDefinitionNode, document.definitions[0])
+        assert self.operation.name is not None
+        self.name = self.operation.name.value
+        self.fragments = {
+            definition.name.value: definition for definition in document.definitions[1:]
+        }
+        self.execute = execute
+
+
+def field_nodes(document: DocumentNode) -> t.List[FieldNode]:
+    """Field nodes of document in order of appearance"""
+    nodes = []
+    pending = list(reversed(document.definitions))
+    while pending:
+        node = pending.pop()
+        if isinstance(node, FieldNode):
+            nodes.append(node)
+        selection_set = getattr(node, "selection_set", None)
+        if selection_set is not None:
+            pending.extend(reversed(selection_set.selections))
+    return nodes
+
+
+def load(source: str) -> t.Tuple[DocumentNode, t.List[FieldNode]]:
+    document = parse(source)
+    return document, field_nodes(document)
+
+
+def field_error(
+    state: Execution,
+    error: Exception,
+    nodes: t.List[FieldNode],
+    path: Path,
+    nullable: bool,
+) -> None:
+    located = located_error(error, nodes, path.as_list())
+    if not nullable:
+        raise located
+    state.errors.add(located, path)
+    return None
+
+
+def leaf_error(type_: t.Any, value: t.Any, serialized: t.Any) -> TypeError:
+    return TypeError(
+        f"Expected `{inspect(type_)}.serialize({inspect(value)})`"
+        f" to return non-nullable value, returned: {inspect(serialized)}"
+    )
+
+
+async def settle(
+    state: Execution,
+    value: t.Awaitable[t.Any],
+    complete: t.Optional[t.Callable[[Execution, t.Any, Path], t.Any]],
+    nodes: t.List[FieldNode],
+    path: Path,
+    nullable: bool,
+) -> t.Any:
+    """Awaited value of field or list item, completed when `complete` is given"""
+    try:
+        result = await value
+        if complete is not None:
+            result = complete(state, result, path)
+            if is_awaitable(result):
+                result = await result
+        return result
+    except Exception as error:
+        return field_error(state, error, nodes, path, nullable)
+
+
+async def gather_values(
+    data: t.Dict[str, t.Any], keys: t.List[str]
+) -> t.Dict[str, t.Any]:
+    data.update(zip(keys, await asyncio.gather(*(data[key] for key in keys))))
+    return data
+
+
+async def gather_items(items: t.List[t.Any], indexes: t.List[int]) -> t.List[t.Any]:
+    values = await asyncio.gather(*(items[index] for index in indexes))
+    for index, value in zip(indexes, values):
+        items[index] = value
+    return items
+
+
+async def run(
+    plan: Plan,
+    schema: GraphQLSchema,
+    variables: t.Optional[t.Dict[str, t.Any]],
+    context: t.Any,
+    root: t.Any,
+) -> ExecutionResult:
+    coerced = get_variable_values(
+        schema, plan.operation.variable_definitions or (), variables or {}
+    )
+    if isinstance(coerced, list):
+        return ExecutionResult(None, coerced)
+    info = (schema, plan.fragments, root, plan.operation, coerced, context)
+    state = Execution(root, coerced, (*info, is_awaitable), Errors())
+    try:
+        data = await plan.execute(state)
+    except GraphQLError as error:
+        state.errors.add(error, None)
+        data = None
+    errors = state.errors.errors
+    if not errors:
+        return ExecutionResult(data, None)
+    errors.sort(
+        key=lambda error: (error.locations or [], error.path or [], error.message)
+    )
+    return ExecutionResult(data, errors)
+
+
+class PlansGraphQL(GraphQL):
+    """GraphQL app executing known operations with plans compiled by pasiphae
+
+    Operations are found by their query text, or by their name sent as `id`
+    without query.
+    They are not parsed or validated again and their resolvers are called
+    directly, without graphql-core executor, only custom validation rules are
+    checked. Other operations, operations failing the rules and all operations
+    of apps with extensions or middleware are executed as usual.
+    """
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.plans = {}
+        self.queries = {}
+        for build in PLANS:
+            plan = build(self.schema)
+            self.plans[plan.name] = plan
+            self.queries[" ".join(plan.source.split())] = plan
+
+    async def extract_data_from_request(self, request: Request) -> t.Any:
+        data = await super().extract_data_from_request(request)
+        # operations sent by id are executed as usual when plan is not used
+        if isinstance(data, dict) and isinstance(data.get("id"), str):
+            plan = self.plans.get(data["id"])
+            if plan is not None and "query" not in data:
+                data = {**data, "query": plan.source}
+        return data
+
+    def find_plan(self, data: t.Any) -> t.Optional[Plan]:
+        if not isinstance(data, dict):
+            return None
+        if not isinstance(data.get("variables") or {}, dict):
+            return None
+        plan = None
+        id_ = data.get("id")
+        if isinstance(data.get("query"), str):
+            plan = self.queries.get(" ".join(data["query"].split()))
+            # query sent with id has to be the operation of that id
+            if plan is not None and id_ is not None and id_ != plan.name:
+                return None
+        elif isinstance(id_, str):
+            plan = self.plans.get(id_)
+        if plan is None or data.get("operationName") not in (None, plan.name):
+            return None
+        return plan
+
+    async def graphql_http_server(self, request: Request) -> Response:
+        if self.extensions or self.middleware:
+            return await super().graphql_http_server(request)
+        try:
+            data = await self.extract_data_from_request(request)
+        except HttpError:
+            return await super().graphql_http_server(request)
+        plan = self.find_plan(data)
+        if plan is None:
+            # request body is cached, it is not read again
+            return await super().graphql_http_server(request)
+        context_value = await self.get_context_for_request(request)
+        validation_rules = self.validation_rules
+        if callable(validation_rules):
+            validation_rules = validation_rules(context_value, plan.document, data)
+        # custom rules, like depth or cost limits, are checked on every request
+        if validation_rules and validate(self.schema, plan.document, validation_rules):
+            return await super().graphql_http_server(request)
+        root_value = self.root_value
+        if callable(root_value):
+            root_value = root_value(context_value, plan.document)
+            if is_awaitable(root_value):
+                root_value = await root_value
+        result = await run(
+            plan, self.schema, data.get("variables"), context_value, root_value
+        )
+        success, response = handle_query_result(
+            result,
+            logger=self.logger,
+            error_formatter=self.error_formatter,
+            debug=self.debug,
+        )
+        return await self.create_json_response(request, response, success)
+'''
+
+BUILD = """
+
+def build_{name}(schema: GraphQLSchema) -> Plan:
+    document, fields = load({constant})
+    types = schema.type_map
+{body}
+    return Plan({constant}, document, execute)
+"""
+
+OBJECT = """def object_{index}(
+    state: Execution, parent: t.Any, path: t.Optional[Path]
+) -> t.Any:
+    data: t.Dict[str, t.Any] = {{}}
+    pending: t.List[str] = []
+{fields}
+    return gather_values(data, pending) if pending else data"""
+
+COMPLETE = """def complete_{index}(state: Execution, value: t.Any, path: Path) -> t.Any:
+    if isinstance(value, Exception):
+        raise value
+    if value is None or value is Undefined:
+        {null}
+{body}"""
+
+LIST = """    if not is_iterable(value):
+        raise GraphQLError(
+            "Expected Iterable, but did not find one for field '{label}'."
+        )
+    items = []
+    pending = []
+    for index, item in enumerate(value):
+        item_path = Path(path, index, None)
+        try:
+            if is_awaitable(item):
+                item = settle(state, item, {item}, {nodes}, item_path, {nullable})
+            else:
+                item = {item}(state, item, item_path)
+                if is_awaitable(item):
+                    item = settle(state, item, None, {nodes}, item_path, {nullable})
+        except Exception as error:
+            item = field_error(state, error, {nodes}, item_path, {nullable})
+        if is_awaitable(item):
+            pending.append(index)
+        items.append(item)
+    return gather_items(items, pending) if pending else items"""
+
+LEAF = """if isinstance(value, Exception):
+    raise value
+if value is None or value is Undefined:
+    {null}
+else:
+    serialized = serialize_{type_}(value)
+    if serialized is None or serialized is Undefined:
+        raise leaf_error(types["{type_}"], value, serialized)
+    value = serialized"""
+
+FIELD = """try:
+    if resolve_{index} is None:
+        if isinstance(parent, Mapping):
+            value = parent.get("{name}")
+        else:
+            value = getattr(parent, "{name}", None)
+        if callable(value):
+            value = value({info}{args})
+    else:
+        value = resolve_{index}(parent, {info}{args})
+    if is_awaitable(value):
+        value = settle(state, value, {complete}, nodes_{index}, {path}, {nullable})
+    else:
+{completion}
+except Exception as error:
+    value = field_error(state, error, nodes_{index}, {path}, {nullable})"""
+
+COMPLETED = """value = {complete}(state, value, {path})
+if is_awaitable(value):
+    value = settle(state, value, None, nodes_{index}, {path}, {nullable})"""
+
+QUERY = """async def execute(state: Execution) -> t.Any:
+    data = object_{index}(state, state.root, None)
+    return await data if is_awaitable(data) else data"""
+
+MUTATION = """async def execute(state: Execution) -> t.Any:
+    parent, path = state.root, None
+    data: t.Dict[str, t.Any] = {{}}
+{fields}
+    return data"""
+
+# directives with literal arguments are applied when operation is compiled
+CONDITIONS = ("skip", "include")
+SELECTIONS = (ast.FieldNode, ast.InlineFragmentNode, ast.FragmentSpreadNode)
+
+Fields = t.Dict[str, t.List[ast.FieldNode]]
+
+
+class Unsupported(Exception):
+    """Part of operation which is executed only by graphql-core"""
+
+
+def indent(code: str, level: int = 1) -> str:
+    prefix = "    " * level
+    return "\n".join(prefix + line if line else line for line in code.split("\n"))
+
+
+def field_nodes(document: DocumentNode) -> t.List[ast.FieldNode]:
+    """Field nodes of document in order of appearance, as runtime finds them"""
+    nodes = []
+    pending: t.List[ast.Node] = list(reversed(document.definitions))
+    while pending:
+        node = pending.pop()
+        if isinstance(node, ast.FieldNode):
+            nodes.append(node)
+        selection_set = getattr(node, "selection_set", None)
+        if selection_set is not None:
+            pending.extend(reversed(selection_set.selections))
+    return nodes
+
+
+def has_variables(value: ast.ValueNode) -> bool:
+    if isinstance(value, ast.VariableNode):
+        return True
+    if isinstance(value, ast.ListValueNode):
+        return any(map(has_variables, value.values))
+    if isinstance(value, ast.ObjectValueNode):
+        return any(has_variables(field.value) for field in value.fields)
+    return False
+
+
+def check_directives(document: DocumentNode) -> None:
+    pending: t.List[ast.Node] = list(document.definitions)
+    while pending:
+        node = pending.pop()
+        if isinstance(node, SELECTIONS):
+            for directive in getattr(node, "directives", None) or ():
+                if directive.name.value not in CONDITIONS or any(
+                    has_variables(argument.value) for argument in directive.arguments
+                ):
+                    raise Unsupported(f"directive {graphql.print_ast(directive)}")
+        selection_set = getattr(node, "selection_set", None)
+        if selection_set is not None:
+            pending.extend(selection_set.selections)
+
+
+@d.dataclass
+class Compiler:
+    """Unrolls execution of one operation into functions of its plan"""
+
+    schema: GraphQLSchema
+    document: DocumentNode
+    setup: t.List[str] = d.field(default_factory=list)
+    functions: t.List[str] = d.field(default_factory=list)
+    serializers: t.Set[str] = d.field(default_factory=set)
+    # completion of leaf types by type and field it reports in errors
+    leaves: t.Dict[t.Tuple[str, str], str] = d.field(default_factory=dict)
+    counter: t.Iterator[int] = d.field(default_factory=itertools.count)
+
+    def __post_init__(self) -> None:
+        self.indexes = {
+            id(node): i for i, node in enumerate(field_nodes(self.document))
+        }
+        self.fragments = {
+            definition.name.value: definition
+            for definition in self.document.definitions
+            if isinstance(definition, ast.FragmentDefinitionNode)
+        }
+
+    def compile(self, operation: ast.OperationDefinitionNode) -> str:
+        root = self.schema.get_root_type(operation.operation)
+        if operation.operation == ast.OperationType.SUBSCRIPTION or root is None:
+            raise Unsupported(f"{operation.operation.value} operation")
+        fields = collect_fields(
+            self.schema, self.fragments, {}, root, operation.selection_set
+        )
+        if operation.operation == ast.OperationType.MUTATION:
+            body = "\n".join(
+                self.field(root, key, nodes, serial=True)
+                for key, nodes in fields.items()
+            )
+            execute = MUTATION.format(fields=indent(body))
+        else:
+            execute = QUERY.format(index=self.object(root, fields))
+        functions = "\n\n".join((*self.functions, execute))
+        return f"{indent(chr(10).join(self.setup))}\n\n{indent(functions)}\n"
+
+    def serializer(self, type_: GraphQLNamedType) -> str:
+        if type_.name not in self.serializers:
+            self.serializers.add(type_.name)
+            self.setup.append(
+                f'serialize_{type_.name} = types["{type_.name}"].serialize'
+            )
+        return type_.name
+
+    def object(self, type_: GraphQLObjectType, fields: Fields) -> int:
+        index = next(self.counter)
+        body = "\n".join(
+            self.field(type_, key, nodes, serial=False) for key, nodes in fields.items()
+        )
+        self.functions.append(OBJECT.format(index=index, fields=indent(body)))
+        return index
+
+    def field(
+        self,
+        parent: GraphQLObjectType,
+        key: str,
+        nodes: t.List[ast.FieldNode],
+        serial: bool,
+    ) -> str:
+        name = nodes[0].name.value
+        if name == "__typename":
+            return f'data["{key}"] = "{parent.name}"'
+        if name not in parent.fields:
+            raise Unsupported(f"introspection field {name}")
+        definition = parent.fields[name]
+        index = next(self.counter)
+        nullable = not graphql.is_non_null_type(definition.type)
+        self.setup += [
+            f'field_{index} = types["{parent.name}"].fields["{name}"]',
+            f"nodes_{index} = [{', '.join(self.node(node) for node in nodes)}]",
+            f"resolve_{index} = field_{index}.resolve",
+            f'info_{index} = ("{name}", nodes_{index}, field_{index}.type,'
+            f' types["{parent.name}"])',
+        ]
+        args = ""
+        if definition.args:
+            if any(has_variables(argument.value) for argument in nodes[0].arguments):
+                args = (
+                    f", **get_argument_values(field_{index}, nodes_{index}[0],"
+                    " state.variables)"
+                )
+            else:
+                self.setup.append(
+                    f"args_{index} = get_argument_values(field_{index},"
+                    f" nodes_{index}[0], {{}})"
+                )
+                args = f", **args_{index}"
+        label = f"{parent.name}.{name}"
+        complete = self.complete(definition.type, label, nodes, f"nodes_{index}")
+        named = graphql.get_nullable_type(definition.type)
+        lines = []
+        if graphql.is_leaf_type(named):
+            path = f'Path(path, "{key}", "{parent.name}")'
+            completion = self.leaf(t.cast(GraphQLNamedType, named), nullable, label)
+        else:
+            lines.append(f'field_path = Path(path, "{key}", "{parent.name}")')
+            path = "field_path"
+            completion = COMPLETED.format(
+                complete=complete, path=path, index=index, nullable=nullable
+            )
+        lines.append(
+            FIELD.format(
+                index=index,
+                name=name,
+                info=f"Info(*info_{index}, {path}, *state.info)",
+                args=args,
+                complete=complete,
+                path=path,
+                nullable=nullable,
+                completion=indent(completion, 2),
+            )
+        )
+        if serial:
+            lines.append("if is_awaitable(value):\n    value = await value")
+        else:
+            lines.append(f'if is_awaitable(value):\n    pending.append("{key}")')
+        lines.append(f'data["{key}"] = value')
+        return "\n".join(lines)
+
+    def node(self, node: ast.FieldNode) -> str:
+        return f"fields[{self.indexes[id(node)]}]"
+
+    def leaf(self, type_: GraphQLNamedType, nullable: bool, label: str) -> str:
+        return LEAF.format(
+            type_=self.serializer(type_), null=null_statement(nullable, label, "value")
+        )
+
+    def complete(
+        self,
+        type_: GraphQLOutputType,
+        label: str,
+        nodes: t.List[ast.FieldNode],
+        nodes_name: str,
+    ) -> str:
+        nullable = not isinstance(type_, graphql.GraphQLNonNull)
+        inner = type_.of_type if isinstance(type_, graphql.GraphQLNonNull) else type_
+        leaf = graphql.is_leaf_type(inner)
+        if leaf and (str(type_), label) in self.leaves:
+            return self.leaves[str(type_), label]
+        index = next(self.counter)
+        if graphql.is_list_type(inner):
+            item_type = t.cast(graphql.GraphQLList, inner).of_type
+            item = self.complete(item_type, label, nodes, nodes_name)
+            body = LIST.format(
+                label=label,
+                item=item,
+                nodes=nodes_name,
+                nullable=not graphql.is_non_null_type(item_type),
+            )
+        elif leaf:
+            self.leaves[str(type_), label] = f"complete_{index}"
+            type_name = self.serializer(t.cast(GraphQLNamedType, inner))
+            body = indent(
+                f"serialized = serialize_{type_name}(value)\n"
+                "if serialized is None or serialized is Undefined:\n"
+                f'    raise leaf_error(types["{type_name}"], value, serialized)\n'
+                "return serialized"
+            )
+        elif graphql.is_object_type(inner):
+            object_type = t.cast(GraphQLObjectType, inner)
+            fields = collect_sub_fields(
+                self.schema, self.fragments, {}, object_type, nodes
+            )
+            object_index = self.object(object_type, fields)
+            body = f"    return object_{object_index}(state, value, path)"
+        else:
+            raise Unsupported(f"abstract type {graphql.get_named_type(inner).name}")
+        self.functions.append(
+            COMPLETE.format(
+                index=index,
+                null=null_statement(nullable, label, "return").lstrip(),
+                body=body,
+            )
+        )
+        return f"complete_{index}"
+
+
+def null_statement(nullable: bool, label: str, target: str) -> str:
+    if not nullable:
+        return (
+            "raise TypeError(" f'"Cannot return null for non-nullable field {label}.")'
+        )
+    return "return None" if target == "return" else "value = None"
+
+
+def compile_operation(
+    schema: GraphQLSchema,
+    operation: ast.OperationDefinitionNode,
+    fragments: t.Mapping[str, ast.FragmentDefinitionNode],
+) -> str:
+    """Source of function building the plan of operation for app schema"""
+    assert operation.name is not None
+    name = camel_to_snake(operation.name.value)
+    # compiled from the same text which is parsed at runtime
+    document = graphql.parse(document_text(operation, fragments), no_location=True)
+    check_directives(document)
+    body = Compiler(schema, document).compile(
+        t.cast(ast.OperationDefinitionNode, document.definitions[0])
+    )
+    constant = name.upper()
+    return f"\n\n{constant} = {document_source(operation, fragments)}\n" + BUILD.format(
+        name=name, constant=constant, body=body
+    )
+
+
+def render(
+    document: DocumentNode, operations: DocumentNode
+) -> t.Tuple[str, t.List[str]]:
+    """Plans module for operations, with warnings about operations left out"""
+    schema = graphql.build_ast_schema(document, assume_valid_sdl=True)
+    errors = graphql.validate(schema, operations)
+    if errors:
+        raise ValueError(
+            f"Invalid plan operations: {'; '.join(error.message for error in errors)}"
+        )
+    fragments = {
+        definition.name.value: definition
+        for definition in operations.definitions
+        if isinstance(definition, ast.FragmentDefinitionNode)
+    }
+    code, names, warnings = [RUNTIME], [], []
+    for operation in operations.definitions:
+        if not isinstance(operation, ast.OperationDefinitionNode):
+            continue
+        if operation.name is None:
+            raise ValueError("Operations executed by plans have to be named")
+        try:
+            code.append(compile_operation(schema, operation, fragments))
+        except Unsupported as error:
+            warnings.append(
+                f"{operation.name.value} is executed without plan: {error} is not"
+                " supported"
+            )
+            continue
+        names.append(f"build_{camel_to_snake(operation.name.value)}")
+    code.append(f"\n\nPLANS = [{', '.join(names)}]\n")
+    return "".join(code), warnings
+
+
+def extend_app(app: App) -> None:
+    # known operations are taken before other servers see the request
+    app.servers.insert(0, Import("PlansGraphQL", ".plans"))
@@ -9,8 +9,17 @@ from functools import singledispatch
 from graphql import DocumentNode
 from graphql.language import ast
 
+from . import scalars
+from .connections import PAGINATION_ARGUMENTS
+from .connections import Connection
+from .connections import get_connection
 from .domain import CodeBlock
 from .domain import PythonType
+from .federation import is_entity
+from .incremental import is_streamed
+from .incremental import stream_item
+from .limits import Limit
+from .limits import get_limit
 from .to_python_type import to_python_type
 from .tools import camel_to_snake
 from .tools import has_arguments
@@ -23,6 +32,8 @@ class ResolverType(Enum):
     ENUM_TYPE = "EnumType"
     QUERY_TYPE = "QueryType"
     MUTATION_TYPE = "MutationType"
+    SUBSCRIPTION_TYPE = "SubscriptionType"
+    SCALAR_TYPE = "ScalarType"
 
 
 @d.dataclass(frozen=True)
@@ -55,12 +66,44 @@ class ResolverFunction:
     schema_name: str
     return_: PythonType
     arguments: t.Sequence[ResolverFunctionArgument] = d.field(default_factory=list)
+    connection: t.Optional[Connection] = None
+    limit: t.Optional[Limit] = None
 
     @property
     def types(self) -> t.Iterator[PythonType]:
         yield PythonType("GraphQLResolveInfo", module="graphql")
         yield from it.chain(*map(operator.attrgetter("types"), self.arguments))
         yield self.return_
+        if self.connection:
+            yield PythonType("paginated", module=".pagination")
+            yield PythonType(self.connection.name, module=".types")
+            yield PythonType(self.connection.edge, module=".types")
+        if self.limit:
+            yield PythonType("limited", module=".limits")
+
+    def decorators(self, resolver: "ObjectResolver") -> t.Iterator[str]:
+        if self.connection:
+            arguments = (
+                f"{self.connection.name}, {self.connection.edge}, "
+                f'key="{camel_to_snake(self.connection.key)}", '
+                f"max_page_size={self.connection.max_page_size}"
+            )
+            yield f"@paginated({arguments})"
+        if self.limit:
+            yield self.limit.decorator(f"{resolver.schema_name}.{self.schema_name}")
+
+    def definitions(self, resolver: "ObjectResolver") -> t.Iterator[str]:
+        yield f'@{resolver.name}.field("{self.schema_name}")'
+        yield from self.decorators(resolver)
+        yield self.render(resolver=resolver)
+
+    def head(
+        self, resolver: "ObjectResolver", first: str, result: str, prefix: str
+    ) -> str:
+        arguments = ", ".join(
+            (first, "info: GraphQLResolveInfo", *map(str, self.arguments))
+        )
+        return f"def {prefix}_{resolver.name}_{self.name}({arguments}) -> {result}:"
 
     def render(self, resolver: "ObjectResolver") -> str:
         first = (
@@ -68,12 +111,11 @@ class ResolverFunction:
             if resolver.parent
             else "_: None"
         )
-        arguments = (
-            f"{first}, info: GraphQLResolveInfo, {', '.join(map(str, self.arguments))}"
-        )
         result = self.return_.render(MODULE)
 
-        head = f"def resolve_{resolver.name}_{self.name}({arguments}) -> {result}:"
+        head = self.head(resolver, first=first, result=result, prefix="resolve")
+        if self.limit:
+            head = f"async {head}"
         body = "    ..."
         return f"{head}\n{body}"
 
@@ -82,6 +124,100 @@ class ResolverFunction:
         return camel_to_snake(self.schema_name)
 
 
+@d.dataclass
+class SubscriptionFunction(ResolverFunction):
+    @property
+    def types(self) -> t.Iterator[PythonType]:
+        yield from super().types
+        yield self.source
+        yield PythonType("broker", module=".broker")
+
+    @property
+    def source(self) -> PythonType:
+        return PythonType("AsyncIterator", module="typing", child=[self.return_])
+
+    def definitions(self, resolver: "ObjectResolver") -> t.Iterator[str]:
+        yield f'@{resolver.name}.source("{self.schema_name}")'
+        head = self.head(
+            resolver,
+            first="_: None",
+            result=self.source.render(MODULE),
+            prefix="subscribe",
+        )
+        body = (
+            f'    async for event in broker.subscribe("{self.schema_name}"):',
+            "        yield event",
+        )
+        yield "\n".join((f"async {head}", *body))
+        yield from super().definitions(resolver)
+
+    def render(self, resolver: "ObjectResolver") -> str:
+        result = self.return_.render(MODULE)
+        head = self.head(
+            resolver, first=f"event: {result}", result=result, prefix="resolve"
+        )
+        return f"{head}\n    return event"
+
+
+@d.dataclass
+class StreamFunction(ResolverFunction):
+    @property
+    def types(self) -> t.Iterator[PythonType]:
+        yield from super().types
+        yield self.items
+
+    @property
+    def items(self) -> PythonType:
+        return PythonType("AsyncIterator", module="typing", child=[self.return_])
+
+    def render(self, resolver: "ObjectResolver") -> str:
+        first = (
+            f"{resolver.name}_: {resolver.parent.render(MODULE)}"
+            if resolver.parent
+            else "_: None"
+        )
+        head = self.head(
+            resolver, first=first, result=self.items.render(MODULE), prefix="resolve"
+        )
+        return f"async {head}\n    for item in ():\n        yield item"
+
+
+@d.dataclass
+class ReferenceFunction:
+    entity: PythonType
+
+    @property
+    def types(self) -> t.Iterator[PythonType]:
+        yield PythonType("GraphQLResolveInfo", module="graphql")
+        yield self.representations
+        yield self.return_
+        yield PythonType("batch_reference", module=".federation")
+
+    @property
+    def representations(self) -> PythonType:
+        any_ = PythonType("Any", module="typing")
+        mapping = PythonType(
+            "Mapping", module="typing", child=[PythonType("str"), any_]
+        )
+        return PythonType("Sequence", module="typing", child=[mapping])
+
+    @property
+    def return_(self) -> PythonType:
+        optional = PythonType("Optional", module="typing", child=[self.entity])
+        return PythonType("Sequence", module="typing", child=[optional])
+
+    def definitions(self, resolver: "ObjectResolver") -> t.Iterator[str]:
+        arguments = (
+            "info: GraphQLResolveInfo, "
+            f"representations: {self.representations.render(MODULE)}"
+        )
+        yield f'@batch_reference("{resolver.schema_name}")'
+        yield (
+            f"def resolve_{resolver.name}_references({arguments})"
+            f" -> {self.return_.render(MODULE)}:\n    ..."
+        )
+
+
 @d.dataclass
 class Resolver:
     schema_name: str
@@ -107,12 +243,15 @@ class Resolver:
 class ObjectResolver(Resolver):
     parent: t.Optional[PythonType]
     functions: t.Sequence[ResolverFunction] = d.field(default_factory=list)
+    reference: t.Optional[ReferenceFunction] = None
 
     @property
     def types(self) -> t.Iterator[PythonType]:
         yield from super().types
 
         yield from it.chain(*map(operator.attrgetter("types"), self.functions))
+        if self.reference:
+            yield from self.reference.types
 
     def generator(self) -> t.Iterator[str]:
         if not self.parent:
@@ -120,8 +259,9 @@ class ObjectResolver(Resolver):
         else:
             yield super().body
         for function in self.functions:
-            yield f'@{self.name}.field("{function.schema_name}")'
-            yield function.render(resolver=self)
+            yield from function.definitions(resolver=self)
+        if self.reference:
+            yield from self.reference.definitions(resolver=self)
 
     @property
     def body(self) -> str:
@@ -145,6 +285,39 @@ class EnumResolver(Resolver):
         yield self.target
 
 
+@d.dataclass
+class ScalarResolver(Resolver):
+    codec: str
+    memoize: bool = False
+
+    type_: t.Literal[ResolverType.SCALAR_TYPE]
+
+    def function(self, prefix: str) -> str:
+        name = f"{prefix}_{self.codec}"
+        return f"memoized({name})" if self.is_memoized(prefix) else name
+
+    def is_memoized(self, prefix: str) -> bool:
+        if prefix == "serialize" and self.codec in scalars.UNCACHED_SERIALIZERS:
+            return False
+        return self.memoize
+
+    @property
+    def body(self):
+        arguments = (
+            f'"{self.schema_name}", serializer={self.function("serialize")}, '
+            f'value_parser={self.function("parse")}'
+        )
+        return f"{self.name} = {self.type_.value}({arguments})"
+
+    @property
+    def types(self) -> t.Iterator[PythonType]:
+        yield from super().types
+        yield PythonType(f"serialize_{self.codec}", module=scalars.MODULE)
+        yield PythonType(f"parse_{self.codec}", module=scalars.MODULE)
+        if self.memoize:
+            yield PythonType("memoized", module=scalars.MODULE)
+
+
 def generate_resolvers(
     root: DocumentNode, known_types: t.Mapping[str, str]
 ) -> t.Iterator[CodeBlock]:
@@ -170,6 +343,13 @@ def process_definition(
 object_type_overrides: t.Mapping[str, ResolverType] = {
     "Query": ResolverType.QUERY_TYPE,
     "Mutation": ResolverType.MUTATION_TYPE,
+    "Subscription": ResolverType.SUBSCRIPTION_TYPE,
+}
+
+root_types = {
+    ResolverType.QUERY_TYPE,
+    ResolverType.MUTATION_TYPE,
+    ResolverType.SUBSCRIPTION_TYPE,
 }
 
 
@@ -188,13 +368,19 @@ def process_object(
     definition_name = definition.name.value
     type_ = object_type_overrides.get(definition_name, ResolverType.OBJECT_TYPE)
 
-    functions = map(
-        partial(resolver_function, known_types=known_types),
-        filter(has_arguments, definition.fields),
-    )
+    if type_ == ResolverType.SUBSCRIPTION_TYPE:
+        functions: t.Iterable[ResolverFunction] = map(
+            partial(subscription_function, known_types=known_types),
+            definition.fields,
+        )
+    else:
+        functions = map(
+            partial(resolver_function, known_types=known_types),
+            filter(needs_resolver, definition.fields),
+        )
     parent = (
         None
-        if type_ in {ResolverType.QUERY_TYPE, ResolverType.MUTATION_TYPE}
+        if type_ in root_types
         else PythonType(definition_name, known_types[definition_name])
     )
 
@@ -203,6 +389,9 @@ def process_object(
         type_=type_,
         functions=list(functions),
         parent=parent,
+        reference=ReferenceFunction(parent)
+        if parent and is_entity(definition)
+        else None,
     )
 
 
@@ -232,10 +421,17 @@ def process_union(
 
 @process_definition.register
 def process_scalar(
-    defiinition: ast.ScalarTypeDefinitionNode, known_types: t.Mapping[str, str]
+    definition: ast.ScalarTypeDefinitionNode, known_types: t.Mapping[str, str]
 ) -> t.Optional[Resolver]:
-    # TODO: create scalar processor
-    return None
+    codec = scalars.get_codec(definition.name.value)
+    if codec is None:
+        return None
+    return ScalarResolver(
+        schema_name=definition.name.value,
+        type_=ResolverType.SCALAR_TYPE,
+        codec=codec,
+        memoize=scalars.config.get().memoize,
+    )
 
 
 @process_definition.register
@@ -250,8 +446,24 @@ def process_enum(
     )
 
 
+def needs_resolver(field: ast.FieldDefinitionNode) -> bool:
+    return has_arguments(field) or get_limit(field) is not None or is_streamed(field)
+
+
 def resolver_function(
     field: ast.FieldDefinitionNode, known_types: t.Mapping[str, str]
+) -> ResolverFunction:
+    if connection := get_connection(field):
+        function = connection_function(field, connection, known_types)
+    elif is_streamed(field):
+        function = stream_function(field, known_types)
+    else:
+        function = plain_function(field, known_types)
+    return d.replace(function, limit=get_limit(field))
+
+
+def plain_function(
+    field: ast.FieldDefinitionNode, known_types: t.Mapping[str, str]
 ) -> ResolverFunction:
     return ResolverFunction(
         schema_name=field.name.value,
@@ -265,6 +477,58 @@ def resolver_function(
     )
 
 
+def subscription_function(
+    field: ast.FieldDefinitionNode, known_types: t.Mapping[str, str]
+) -> SubscriptionFunction:
+    function = resolver_function(field, known_types)
+    return SubscriptionFunction(
+        schema_name=function.schema_name,
+        return_=function.return_,
+        arguments=function.arguments,
+    )
+
+
+def stream_function(
+    field: ast.FieldDefinitionNode, known_types: t.Mapping[str, str]
+) -> StreamFunction:
+    function = plain_function(field, known_types)
+    return StreamFunction(
+        schema_name=function.schema_name,
+        return_=stream_item(field, function.return_),
+        arguments=function.arguments,
+    )
+
+
+def connection_function(
+    field: ast.FieldDefinitionNode,
+    connection: Connection,
+    known_types: t.Mapping[str, str],
+) -> ResolverFunction:
+    page = ResolverFunctionArgument(
+        schema_name="page", type_=PythonType("Page", module=".pagination"), default=None
+    )
+    return ResolverFunction(
+        schema_name=field.name.value,
+        return_=PythonType(
+            "Iterable",
+            module="typing",
+            child=[PythonType(connection.node, module=known_types[connection.node])],
+        ),
+        arguments=[
+            page,
+            *map(
+                partial(to_resolve_function_argument, known_types=known_types),
+                (
+                    argument
+                    for argument in field.arguments
+                    if argument.name.value not in PAGINATION_ARGUMENTS
+                ),
+            ),
+        ],
+        connection=connection,
+    )
+
+
 def to_resolve_function_argument(
     argument: ast.InputValueDefinitionNode, known_types: t.Mapping[str, str]
 ) -> ResolverFunctionArgument:
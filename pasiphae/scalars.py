@@ -0,0 +1,185 @@
+import dataclasses as d
+import typing as t
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from graphql import DocumentNode
+from graphql.language import ast
+
+from .domain import PythonType
+
+MODULE = ".scalar_codecs"
+
+build_in_types: t.Mapping[str, PythonType] = {
+    "ID": PythonType("UUID", "uuid"),
+    "String": PythonType("str"),
+    "Float": PythonType("Decimal", "decimal"),
+    "Int": PythonType("int"),
+    "Boolean": PythonType("bool"),
+}
+
+# custom scalars with common names are mapped without configuration
+known_types: t.Mapping[str, PythonType] = {
+    "DateTime": PythonType("datetime", "datetime"),
+    "Date": PythonType("date", "datetime"),
+    "Time": PythonType("time", "datetime"),
+    "UUID": PythonType("UUID", "uuid"),
+    "Decimal": PythonType("Decimal", "decimal"),
+}
+
+# python types which need to be converted from and to their json value
+CODECS: t.Mapping[t.Tuple[t.Optional[str], str], str] = {
+    ("datetime", "datetime"): "datetime",
+    ("datetime", "date"): "date",
+    ("datetime", "time"): "time",
+    ("uuid", "UUID"): "uuid",
+    ("decimal", "Decimal"): "decimal",
+}
+
+# equal values of these types have different json, e.g. datetimes in other
+# time zones or decimals with other exponent, their serializers are not cached
+UNCACHED_SERIALIZERS = {"datetime", "time", "decimal"}
+
+RUNTIME = '''# generated by pasiphae, please do not change manually
+import typing as t
+from datetime import date
+from datetime import datetime
+from datetime import time
+from decimal import Decimal
+from decimal import InvalidOperation
+from functools import lru_cache
+from uuid import UUID
+
+MEMOIZE_SIZE = 4096
+DATETIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+)
+
+Codec = t.Callable[[t.Any], t.Any]
+
+
+def memoized(codec: Codec) -> Codec:
+    """Cache results of codec, for scalars with many repeated values
+
+    Values are keyed by type too, `True` and `1.0` are equal but only one of
+    them is a valid decimal.
+    """
+    return lru_cache(maxsize=MEMOIZE_SIZE, typed=True)(codec)
+
+
+def to_str(value: t.Any) -> str:
+    if not isinstance(value, str):
+        raise ValueError(f"Expected string, got {value!r}")
+    return value
+
+
+def serialize_datetime(value: datetime) -> str:
+    return value.isoformat()
+
+
+def parse_datetime(value: t.Any) -> datetime:
+    value = to_str(value)
+    if value[-1:] in ("Z", "z"):
+        value = f"{value[:-1]}+00:00"
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    # fromisoformat of older pythons accepts only 3 or 6 digit fractions
+    for format_ in DATETIME_FORMATS:
+        try:
+            return datetime.strptime(value, format_)
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid ISO datetime {value!r}")
+
+
+def serialize_date(value: date) -> str:
+    return value.isoformat()
+
+
+def parse_date(value: t.Any) -> date:
+    return date.fromisoformat(to_str(value))
+
+
+def serialize_time(value: time) -> str:
+    return value.isoformat()
+
+
+def parse_time(value: t.Any) -> time:
+    return time.fromisoformat(to_str(value))
+
+
+def serialize_uuid(value: UUID) -> str:
+    return str(value)
+
+
+def parse_uuid(value: t.Any) -> UUID:
+    return UUID(to_str(value))
+
+
+def serialize_decimal(value: Decimal) -> str:
+    return str(value)
+
+
+def parse_decimal(value: t.Any) -> Decimal:
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise ValueError(f"Expected number, got {value!r}")
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        raise ValueError(f"Invalid decimal {value!r}")
+'''
+
+
+@d.dataclass(frozen=True)
+class Config:
+    types: t.Mapping[str, PythonType]
+    memoize: bool = False
+
+
+config: ContextVar[Config] = ContextVar(
+    "config", default=Config(types={**build_in_types, **known_types})
+)
+
+
+def to_python_type(path: str) -> PythonType:
+    """Type from its import path, e.g. `datetime.datetime` or builtin `float`"""
+    module, _, name = path.rpartition(".")
+    return PythonType(name, module or None)
+
+
+@contextmanager
+def configured(
+    overrides: t.Mapping[str, str], memoize: bool = False
+) -> t.Iterator[Config]:
+    """Map scalars to python types given by import path during generation"""
+    types = {
+        **config.get().types,
+        **{name: to_python_type(path) for name, path in overrides.items()},
+    }
+    token = config.set(Config(types=types, memoize=memoize))
+    try:
+        yield config.get()
+    finally:
+        config.reset(token)
+
+
+def get_type(name: str) -> t.Optional[PythonType]:
+    return config.get().types.get(name)
+
+
+def get_codec(name: str) -> t.Optional[str]:
+    type_ = get_type(name)
+    return CODECS.get((type_.module, type_.name)) if type_ else None
+
+
+def has_codecs(document: DocumentNode) -> bool:
+    return any(
+        isinstance(definition, ast.ScalarTypeDefinitionNode)
+        and get_codec(definition.name.value) is not None
+        for definition in document.definitions
+    )
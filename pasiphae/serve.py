@@ -0,0 +1,234 @@
+RUNTIME = '''# generated by pasiphae, please do not change manually
+"""Preforking server, run with `python -m <package>.serve`
+
+Schema is built once in the master process, forked workers share it with
+resolvers and types in copy-on-write memory.
+"""
+import argparse
+import gc
+import logging
+import os
+import select
+import signal
+import socket
+import typing as t
+from time import monotonic
+
+import uvicorn
+
+from .app import app
+
+logger = logging.getLogger(__name__)
+
+MIB = 1024 * 1024
+
+
+class Worker:
+    def __init__(self, pid: int, heartbeat: int) -> None:
+        self.pid = pid
+        self.heartbeat = heartbeat
+        self.seen = monotonic()
+
+
+def serve_worker(
+    sock: socket.socket, heartbeat: int, options: argparse.Namespace
+) -> int:
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, signal.SIG_DFL)
+
+    async def notify() -> None:
+        os.write(heartbeat, b".")
+
+    config = uvicorn.Config(
+        app,
+        log_level=options.log_level,
+        callback_notify=notify,
+        timeout_notify=options.timeout / 4,
+    )
+    server = uvicorn.Server(config)
+    server.run(sockets=[sock])
+    return 0 if server.started else 1
+
+
+def read_sizes(path: str) -> t.Dict[str, int]:
+    sizes = {}
+    with open(path) as lines:
+        for line in lines:
+            name, _, value = line.partition(":")
+            if value.strip().endswith("kB"):
+                sizes[name] = int(value.split()[0]) * 1024
+    return sizes
+
+
+def memory(pid: int) -> t.Dict[str, int]:
+    """Resident, proportional and shared memory of process in bytes, on linux"""
+    try:
+        sizes = read_sizes(f"/proc/{pid}/smaps_rollup")
+    except OSError:
+        try:
+            sizes = read_sizes(f"/proc/{pid}/status")
+        except OSError:
+            return {}
+        sizes["Rss"] = sizes.get("VmRSS", 0)
+    return {
+        "rss": sizes.get("Rss", 0),
+        "pss": sizes.get("Pss", 0),
+        "shared": sizes.get("Shared_Clean", 0) + sizes.get("Shared_Dirty", 0),
+    }
+
+
+def report(pid: int, role: str) -> None:
+    sizes = memory(pid)
+    if sizes:
+        logger.info(
+            "%s %d: rss %.1f MiB, pss %.1f MiB, shared %.1f MiB",
+            role,
+            pid,
+            sizes["rss"] / MIB,
+            sizes["pss"] / MIB,
+            sizes["shared"] / MIB,
+        )
+
+
+def exit_code(status: int) -> int:
+    return os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+
+
+class Master:
+    """Keeps `workers` processes serving, restarts dead and hanging ones"""
+
+    def __init__(self, sock: socket.socket, options: argparse.Namespace) -> None:
+        self.sock = sock
+        self.options = options
+        self.workers: t.Dict[int, Worker] = {}
+        self.running = True
+
+    def spawn(self) -> None:
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read)
+            for worker in self.workers.values():
+                os.close(worker.heartbeat)
+            code = 1
+            try:
+                code = serve_worker(self.sock, write, self.options)
+            except Exception:
+                logger.exception("worker %d failed", os.getpid())
+            finally:
+                os._exit(code)
+        os.close(write)
+        os.set_blocking(read, False)
+        self.workers[pid] = Worker(pid, read)
+        logger.info("worker %d started", pid)
+
+    def stop(self, signum: int, frame: t.Any) -> None:
+        self.running = False
+
+    def reap(self) -> None:
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            worker = self.workers.pop(pid, None)
+            if worker is not None:
+                os.close(worker.heartbeat)
+                logger.warning("worker %d exited with %d", pid, exit_code(status))
+
+    def check(self, timeout: float) -> None:
+        by_fd = {worker.heartbeat: worker for worker in self.workers.values()}
+        ready, _, _ = select.select(list(by_fd), [], [], timeout)
+        now = monotonic()
+        for fd in ready:
+            try:
+                os.read(fd, 1024)
+            except BlockingIOError:
+                continue
+            by_fd[fd].seen = now
+        for worker in self.workers.values():
+            if now - worker.seen > self.options.timeout:
+                logger.error("worker %d is not responding, killing it", worker.pid)
+                os.kill(worker.pid, signal.SIGKILL)
+                worker.seen = now
+
+    def run(self) -> None:
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, self.stop)
+        # move everything built so far out of reach of collections in workers,
+        # so they do not touch and copy shared pages
+        gc.collect()
+        gc.freeze()
+        report_at = monotonic() + self.options.report_interval
+        while self.running:
+            self.reap()
+            while self.running and len(self.workers) < self.options.workers:
+                self.spawn()
+            self.check(timeout=min(1.0, self.options.report_interval))
+            if monotonic() >= report_at:
+                report(os.getpid(), "master")
+                for pid in self.workers:
+                    report(pid, "worker")
+                report_at = monotonic() + self.options.report_interval
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        for pid in self.workers:
+            os.kill(pid, signal.SIGTERM)
+        deadline = monotonic() + self.options.timeout
+        while self.workers and monotonic() < deadline:
+            self.reap()
+            if self.workers:
+                select.select([], [], [], 0.1)
+        for pid in self.workers:
+            os.kill(pid, signal.SIGKILL)
+        logger.info("stopped")
+
+
+def parse_args(args: t.Optional[t.Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default=os.environ.get("HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8000)))
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30.0,
+        help="Seconds without heartbeat after which worker is killed",
+    )
+    parser.add_argument(
+        "--report-interval",
+        type=float,
+        default=60.0,
+        help="Seconds between memory reports",
+    )
+    parser.add_argument("--log-level", default="info")
+    return parser.parse_args(args)
+
+
+def main(args: t.Optional[t.Sequence[str]] = None) -> None:
+    options = parse_args(args)
+    logging.basicConfig(
+        level=options.log_level.upper(), format="[%(process)d] %(message)s"
+    )
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((options.host, options.port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    host, port = sock.getsockname()[:2]
+    logger.info(
+        "listening on http://%s:%d with %d workers", host, port, options.workers
+    )
+    Master(sock, options).run()
+
+
+if __name__ == "__main__":
+    main()
+'''
@@ -0,0 +1,147 @@
+import dataclasses as d
+import difflib
+import os
+import typing as t
+from pathlib import Path
+
+from . import api
+from . import file
+from . import loader
+from .api import Options
+
+
+def write(output: Path, generated: api.Generated) -> None:
+    for name, schema in generated.schemas.items():
+        (output / name).write_text(schema)
+    for name, source in generated.modules.items():
+        (output / f"{name}.py").write_text(source)
+    (output / "__init__.py").touch(exist_ok=True)
+
+
+@d.dataclass(frozen=True)
+class Drift:
+    """Generated file which is different from the one on disk"""
+
+    path: Path
+    current: t.Optional[str]
+    generated: str
+
+    def diff(self) -> str:
+        return "".join(
+            difflib.unified_diff(
+                (self.current or "").splitlines(keepends=True),
+                self.generated.splitlines(keepends=True),
+                fromfile=str(self.path),
+                tofile=str(self.path),
+            )
+        )
+
+
+def read(path: Path) -> t.Optional[str]:
+    return path.read_text() if path.exists() else None
+
+
+def generate_in_memory(
+    schema: Path,
+    output: t.Optional[Path],
+    options: Options,
+    cache: t.Optional[loader.ParseCache],
+    parallel: bool,
+    client: t.Optional[Path],
+    format: bool = True,
+    plans: t.Optional[Path] = None,
+) -> t.Tuple[Path, t.Dict[str, str], api.Generated]:
+    root, schema_files = loader.find_files(schema)
+    if not schema_files:
+        raise FileNotFoundError(f"No schema files found in {schema}")
+    output = output or root
+    operations = None
+    if client is not None:
+        _, operation_files = loader.find_files(client)
+        if not operation_files:
+            raise FileNotFoundError(f"No operation files found in {client}")
+        operations = loader.parse_files(operation_files, cache, parallel)
+    known_operations = None
+    if plans is not None:
+        _, plan_files = loader.find_files(plans)
+        if not plan_files:
+            raise FileNotFoundError(f"No operation files found in {plans}")
+        known_operations = loader.parse_files(plan_files, cache, parallel)
+    existing = {
+        name: source
+        for name in api.MERGED
+        if (source := read(output / f"{name}.py")) is not None
+    }
+    generated = api.generate(
+        loader.load(schema_files, cache, parallel),
+        options,
+        schema_names=[
+            Path(os.path.relpath(schema_file, output)).as_posix()
+            for schema_file in schema_files
+        ],
+        existing=existing,
+        isort_config=file.isort_config(output.resolve()) if format else None,
+        operations=operations,
+        format=format,
+        plans=known_operations,
+    )
+    return output, existing, generated
+
+
+def generate(
+    schema: Path,
+    output: t.Optional[Path] = None,
+    options: Options = Options(),
+    cache: t.Optional[loader.ParseCache] = None,
+    parallel: bool = True,
+    client: t.Optional[Path] = None,
+    plans: t.Optional[Path] = None,
+) -> t.List[str]:
+    """Generate service from schema files into output directory
+
+    Output defaults to directory with schema files, returns warnings. Typed
+    client is generated for operations in `client` file, directory or glob,
+    execution plans for known operations in `plans`.
+    """
+    output, _, generated = generate_in_memory(
+        schema, output, options, cache, parallel, client, plans=plans
+    )
+    output.mkdir(parents=True, exist_ok=True)
+    write(output, generated)
+    return generated.warnings
+
+
+def check(
+    schema: Path,
+    output: t.Optional[Path] = None,
+    options: Options = Options(),
+    cache: t.Optional[loader.ParseCache] = None,
+    parallel: bool = True,
+    client: t.Optional[Path] = None,
+    plans: t.Optional[Path] = None,
+) -> t.List[Drift]:
+    """Files which `generate` would change, without writing anything
+
+    Modules are formatted only when they differ from files on disk as rendered.
+    """
+    output, existing, generated = generate_in_memory(
+        schema, output, options, cache, parallel, client, format=False, plans=plans
+    )
+    drifts = []
+    for name, source in generated.schemas.items():
+        path = output / name
+        if (current := read(path)) != source:
+            drifts.append(Drift(path, current, source))
+    for name, code in generated.modules.items():
+        path = output / f"{name}.py"
+        current = read(path)
+        if current == code:
+            continue
+        source = api.format_module(
+            name, code, options, existing, file.isort_config(output.resolve())
+        )
+        if current != source:
+            drifts.append(Drift(path, current, source))
+    if not (output / "__init__.py").exists():
+        drifts.append(Drift(output / "__init__.py", None, ""))
+    return drifts
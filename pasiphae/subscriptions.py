@@ -0,0 +1,87 @@
+from graphql import DocumentNode
+from graphql.language import ast
+
+TYPE_NAME = "Subscription"
+
+RUNTIME = '''# generated by pasiphae, please do not change manually
+import asyncio
+import typing as t
+from collections import defaultdict
+
+
+class Broker:
+    """In-process pub/sub broker
+
+    Every subscriber owns a bounded queue, published event is put directly
+    into queues of all subscribers of the topic - no task is spawned per event.
+    `publish` waits for free space in slow subscribers queues (backpressure),
+    all of them at once and only until they unsubscribe, `publish_nowait`
+    never waits and drops the oldest queued event instead.
+    """
+
+    def __init__(self, max_queue_size: int = 100) -> None:
+        self.max_queue_size = max_queue_size
+        self.dropped = 0
+        # queues of subscribers with events set when they unsubscribe
+        self._topics: t.Dict[
+            str, t.Dict["asyncio.Queue[t.Any]", asyncio.Event]
+        ] = defaultdict(dict)
+
+    def subscribers(self, topic: str) -> int:
+        return len(self._topics.get(topic, ()))
+
+    async def publish(self, topic: str, event: t.Any) -> None:
+        waiting = []
+        for queue, left in tuple(self._topics.get(topic, {}).items()):
+            if queue.full():
+                waiting.append(self._put(queue, left, event))
+            else:
+                queue.put_nowait(event)
+        if waiting:
+            await asyncio.gather(*waiting)
+
+    async def _put(
+        self, queue: "asyncio.Queue[t.Any]", left: asyncio.Event, event: t.Any
+    ) -> None:
+        put = asyncio.ensure_future(queue.put(event))
+        unsubscribed = asyncio.ensure_future(left.wait())
+        try:
+            await asyncio.wait(
+                (put, unsubscribed), return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            put.cancel()
+            unsubscribed.cancel()
+
+    def publish_nowait(self, topic: str, event: t.Any) -> None:
+        for queue in self._topics.get(topic, ()):
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(event)
+
+    async def subscribe(self, topic: str) -> t.AsyncIterator[t.Any]:
+        queue: "asyncio.Queue[t.Any]" = asyncio.Queue(self.max_queue_size)
+        left = asyncio.Event()
+        queues = self._topics[topic]
+        queues[queue] = left
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            queues.pop(queue, None)
+            left.set()
+            if not queues and self._topics.get(topic) is queues:
+                del self._topics[topic]
+
+
+broker = Broker()
+'''
+
+
+def has_subscriptions(document: DocumentNode) -> bool:
+    return any(
+        isinstance(definition, ast.ObjectTypeDefinitionNode)
+        and definition.name.value == TYPE_NAME
+        for definition in document.definitions
+    )
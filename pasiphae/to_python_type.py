@@ -4,14 +4,7 @@ from functools import singledispatch
 from graphql.language import ast
 
 from pasiphae.domain import PythonType
-
-build_in_types: t.Mapping[str, PythonType] = {
-    "ID": PythonType("UUID", "uuid"),
-    "String": PythonType("str"),
-    "Float": PythonType("Decimal", "decimal"),
-    "Int": PythonType("int"),
-    "Boolean": PythonType("bool"),
-}
+from pasiphae.scalars import get_type
 
 
 @singledispatch
@@ -34,10 +27,10 @@ def named_type_mode(
         return optional(PythonType(name, module=known[name]))
     except KeyError:
         pass
-    try:
-        return optional(build_in_types[name])
-    except KeyError:
+    scalar_type = get_type(name)
+    if scalar_type is None:
         raise NotImplementedError(f"do not know {name}")
+    return optional(scalar_type)
 
 
 @to_python_type.register
@@ -6,6 +6,7 @@ from functools import singledispatch
 
 from graphql import DocumentNode
 from graphql.language import ast
+from graphql.utilities import value_from_ast_untyped
 
 from pasiphae.domain import CodeBlock
 
@@ -35,6 +36,22 @@ def input_has_arguments(_field: ast.InputValueDefinitionNode) -> bool:
     return False
 
 
+def get_directive(
+    node: t.Union[ast.FieldDefinitionNode, ast.TypeDefinitionNode], name: str
+) -> t.Optional[ast.DirectiveNode]:
+    return next(
+        (directive for directive in node.directives if directive.name.value == name),
+        None,
+    )
+
+
+def directive_arguments(directive: ast.DirectiveNode) -> t.Mapping[str, t.Any]:
+    return {
+        argument.name.value: value_from_ast_untyped(argument.value)
+        for argument in directive.arguments
+    }
+
+
 def chain_generators(
     sequence: t.Sequence[
         t.Tuple[
@@ -7,6 +7,7 @@ from graphql.language import ast
 
 from .domain import CodeBlock
 from .domain import PythonType
+from .scalars import get_type
 from .to_python_type import named_type_mode
 from .to_python_type import to_python_type
 from .tools import camel_to_snake
@@ -95,7 +96,7 @@ def process_object(
     ],
     known_types: t.Mapping[str, str],
 ) -> t.Optional[CodeBlock]:
-    if definition.name.value in ("Query", "Mutation"):
+    if definition.name.value in ("Query", "Mutation", "Subscription"):
         return None
 
     if interfaces := get_interfaces(definition):
@@ -126,6 +127,29 @@ def proess_interface(
     )
 
 
+Field = t.Union[ast.FieldDefinitionNode, ast.InputValueDefinitionNode]
+
+
+def class_fields(
+    definition: t.Union[
+        ast.ObjectTypeDefinitionNode,
+        ast.InputObjectTypeDefinitionNode,
+        ast.InterfaceTypeDefinitionNode,
+    ],
+    known_types: t.Mapping[str, str],
+) -> t.List[t.Tuple[Field, PythonType]]:
+    """Fields of generated class with their types, in order of attributes"""
+    fields: t.Iterable[Field] = definition.fields
+    return sorted(
+        (
+            (field, to_python_type(field.type, known_types))
+            for field in fields
+            if not has_arguments(field)
+        ),
+        key=lambda field: field[1].default,
+    )
+
+
 def process_interface_or_object(
     definition: t.Union[
         ast.ObjectTypeDefinitionNode,
@@ -137,31 +161,19 @@ def process_interface_or_object(
     weight: int,
     type_: PythonType,
 ) -> CodeBlock:
-    process_results: t.Mapping[str, PythonType] = {
-        field.name.value: to_python_type(field.type, known_types)
-        for field in definition.fields
-        if not has_arguments(field)
-    }
-
-    sorted_process_results = sorted(
-        (
-            (result.default, camel_to_snake(name), result.render(MODULE))
-            for name, result in process_results.items()
-        ),
-        key=operator.itemgetter(0),
-    )
-
+    fields = class_fields(definition, known_types)
     body = (
         *(header),
         *(
-            f"    {name}: {result}{f' = {default}' if default else ''}"
-            for default, name, result in sorted_process_results
+            f"    {camel_to_snake(field.name.value)}: {result.render(MODULE)}"
+            f"{f' = {result.default}' if result.default else ''}"
+            for field, result in fields
         ),
     )
     return CodeBlock(
         body="\n".join(body),
         used_types=(
-            *(result for result in process_results.values()),
+            *(result for _, result in fields),
             type_,
             PythonType(definition.name.value, module=MODULE),
         ),
@@ -209,14 +221,21 @@ def process_union(
 def process_scalar(
     definition: ast.ScalarTypeDefinitionNode, known: t.Mapping[str, str]
 ) -> CodeBlock:
-
+    name = definition.name.value
+    type_ = get_type(name)
+    if type_ is None:
+        return CodeBlock(
+            body="",
+            weight=SCALAR_WEIGHT,
+            used_types=[
+                PythonType(name, module=".scalars"),
+                PythonType(name, module=MODULE),
+            ],
+            warning=f"Scalar {name} defined. "
+            f"Make sure you provide scalar implementation in `scalars` module",
+        )
     return CodeBlock(
-        body="",
+        body="" if type_.name == name else f"{name} = {type_.render(MODULE)}",
         weight=SCALAR_WEIGHT,
-        used_types=[
-            PythonType(definition.name.value, module=".scalars"),
-            PythonType(definition.name.value, module=MODULE),
-        ],
-        warning=f"Scalar {definition.name.value} defined. "
-        f"Make sure you provide scalar implementation in `scalars` module",
+        used_types=[type_, PythonType(name, module=MODULE)],
     )
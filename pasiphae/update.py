@@ -0,0 +1,234 @@
+import ast
+import dataclasses as d
+import io
+import re
+import tokenize
+import typing as t
+
+GENERATED_FUNCTION = re.compile(r"^(resolve|subscribe)_")
+GENERATED_DECORATORS = {"field", "source", "paginated", "limited", "batch_reference"}
+REMOVED_MARKER = "# pasiphae: field is not defined in schema anymore"
+
+Key = t.Tuple[str, str]
+
+
+def normalize(code: str) -> str:
+    return "".join(code.split())
+
+
+@d.dataclass
+class Statement:
+    """Top level statement of a module with its position in source lines"""
+
+    node: ast.stmt
+    lines: t.Sequence[str]
+
+    @property
+    def start(self) -> int:
+        decorators = getattr(self.node, "decorator_list", [])
+        return min((self.node.lineno, *(node.lineno for node in decorators))) - 1
+
+    @property
+    def end(self) -> int:
+        assert self.node.end_lineno
+        return self.node.end_lineno
+
+    @property
+    def code(self) -> str:
+        return "".join(self.lines[self.start : self.end])
+
+    @property
+    def key(self) -> Key:
+        if isinstance(self.node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            return "def", self.node.name
+        if isinstance(self.node, ast.ClassDef):
+            return "class", self.node.name
+        if (
+            isinstance(self.node, ast.Assign)
+            and len(self.node.targets) == 1
+            and isinstance(self.node.targets[0], ast.Name)
+        ):
+            return "assign", self.node.targets[0].id
+        return "code", normalize(self.code)
+
+    @property
+    def decorators(self) -> t.List[str]:
+        return [
+            "".join(self.lines[decorator.lineno - 1 : decorator.end_lineno])
+            for decorator in getattr(self.node, "decorator_list", [])
+        ]
+
+    @property
+    def header_end(self) -> int:
+        """Line with the colon which ends function signature"""
+        source = "".join(self.lines[self.node.lineno - 1 : self.end])
+        depth = 0
+        tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+        for token in tokens:
+            if token.type != tokenize.OP:
+                continue
+            if token.string in "([{":
+                depth += 1
+            elif token.string in ")]}":
+                depth -= 1
+            elif token.string == ":" and depth == 0:
+                return self.node.lineno + token.start[0] - 1
+        raise ValueError(f"Cannot find signature end of {self.key[1]}")
+
+    @property
+    def header(self) -> str:
+        return "".join(self.lines[self.start : self.header_end])
+
+    @property
+    def signature(self) -> str:
+        return "".join(self.lines[self.node.lineno - 1 : self.header_end])
+
+    @property
+    def body(self) -> str:
+        return "".join(self.lines[self.header_end : self.end])
+
+
+def imported_names(statement: Statement) -> t.Set[t.Tuple[str, str]]:
+    node = statement.node
+    if isinstance(node, ast.ImportFrom):
+        module = "." * node.level + (node.module or "")
+        return {(module, alias.asname or alias.name) for alias in node.names}
+    if isinstance(node, ast.Import):
+        return {("", alias.asname or alias.name) for alias in node.names}
+    return set()
+
+
+def statements(source: str) -> t.Tuple[t.List[str], t.List[Statement]]:
+    lines = source.splitlines(keepends=True)
+    return lines, [Statement(node, lines) for node in ast.parse(source).body]
+
+
+def is_generated_decorator(decorator: ast.expr) -> bool:
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+    if isinstance(decorator, ast.Attribute):
+        return decorator.attr in GENERATED_DECORATORS
+    return isinstance(decorator, ast.Name) and decorator.id in GENERATED_DECORATORS
+
+
+def update_function(existing: Statement, generated: Statement) -> str:
+    """Rewrite decorators and signature of existing function, keep its body"""
+    node = existing.node
+    assert isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    user_decorators = [
+        code
+        for code, decorator in zip(existing.decorators, node.decorator_list)
+        if not is_generated_decorator(decorator)
+    ]
+    signature = existing.signature
+    generated_signature = generated.signature
+    if isinstance(node, ast.AsyncFunctionDef) and isinstance(
+        generated.node, ast.FunctionDef
+    ):
+        # implemented coroutine keeps awaiting in its body
+        generated_signature = re.sub(
+            r"^(\s*)def ", r"\1async def ", generated_signature
+        )
+    if normalize(signature) != normalize(generated_signature):
+        signature = generated_signature
+    header = "".join((*generated.decorators, *user_decorators, signature))
+    if normalize(header) == normalize(existing.header):
+        return existing.code
+    return header + existing.body
+
+
+def mark_removed(statement: Statement) -> str:
+    """Comment out decorators binding removed resolver, schema misses its field"""
+    commented: t.Set[int] = set()
+    for decorator in getattr(statement.node, "decorator_list", []):
+        if is_generated_decorator(decorator):
+            assert decorator.end_lineno
+            commented.update(range(decorator.lineno - 1, decorator.end_lineno))
+    return "".join(
+        f"# {statement.lines[index]}" if index in commented else statement.lines[index]
+        for index in range(statement.start, statement.end)
+    )
+
+
+def is_marked(gap: str) -> bool:
+    """Removed marker is followed only by comments, like decorators it disabled"""
+    _, marker, after = gap.rpartition(REMOVED_MARKER)
+    return bool(marker) and all(
+        line.lstrip().startswith("#") for line in after.splitlines() if line.strip()
+    )
+
+
+def blank_lines(lines: t.Sequence[str], start: int, end: t.Optional[int] = None) -> str:
+    return "".join(line for line in lines[start:end] if not line.strip())
+
+
+def merge(existing: str, generated: str) -> str:
+    """Merge freshly generated module into existing one
+
+    Functions are matched by name: changed decorators and signatures are
+    rewritten and bodies are kept, new statements are inserted after their
+    generated predecessor and removed resolvers are marked with a comment,
+    their binding decorators are commented out so the schema still builds.
+    Classes, matched by name too, and everything else keep their original text.
+    """
+    if existing == generated:
+        return existing
+    lines, old = statements(existing)
+    new_lines, new = statements(generated)
+    new_by_key = {statement.key: statement for statement in new}
+    old_keys = {statement.key for statement in old}
+    old_imports = set().union(*map(imported_names, old))
+
+    # statements missing in existing module, grouped by key of predecessor
+    inserts: t.Dict[t.Optional[Key], t.List[str]] = {}
+    anchor: t.Optional[Key] = None
+    for index, statement in enumerate(new):
+        if statement.key in old_keys:
+            anchor = statement.key
+        elif imported_names(statement) and imported_names(statement) <= old_imports:
+            continue
+        elif anchor is None:
+            # inserted before first existing statement, keep blank lines after
+            following = new[index + 1].start if index + 1 < len(new) else None
+            inserts.setdefault(anchor, []).append(
+                statement.code + blank_lines(new_lines, statement.end, following)
+            )
+        else:
+            previous = new[index - 1].end
+            inserts.setdefault(anchor, []).append(
+                blank_lines(new_lines, previous, statement.start) + statement.code
+            )
+
+    chunks: t.List[str] = []
+    position = 0
+    for statement in old:
+        gap = "".join(lines[position : statement.start])
+        marked = is_marked(gap)
+        generated_statement = new_by_key.get(statement.key)
+        if marked and generated_statement is not None:
+            # drop the marker with decorators it commented out, they are generated
+            gap = gap[: gap.rindex(REMOVED_MARKER)].rstrip(" ")
+        chunks.append(gap)
+        if position == 0:
+            chunks.extend(inserts.get(None, []))
+        if generated_statement is None:
+            if statement.key[0] == "def" and GENERATED_FUNCTION.match(statement.key[1]):
+                if not marked:
+                    chunks.append(f"{REMOVED_MARKER}\n")
+                chunks.append(mark_removed(statement))
+            else:
+                chunks.append(statement.code)
+        elif statement.key[0] == "def":
+            chunks.append(update_function(statement, generated_statement))
+        elif statement.key[0] == "class":
+            chunks.append(statement.code)
+        elif normalize(statement.code) != normalize(generated_statement.code):
+            chunks.append(generated_statement.code)
+        else:
+            chunks.append(statement.code)
+        chunks.extend(inserts.get(statement.key, []))
+        position = statement.end
+    if not old:
+        chunks.extend(inserts.get(None, []))
+    chunks.append("".join(lines[position:]))
+    return "".join(chunks)
@@ -0,0 +1,21 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from typing import Optional
+
+from ariadne import ObjectType
+from ariadne import QueryType
+from graphql import GraphQLResolveInfo
+
+from .types import User
+
+user = ObjectType("User")
+
+query = QueryType()
+
+
+@query.field("user")
+def resolve_query_user(_: None, info: GraphQLResolveInfo, id: int) -> Optional[User]:
+    ...
+
+
+resolvers = [user, query]
@@ -0,0 +1,8 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class User:
+    id: int
+    name: str
@@ -0,0 +1,55 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+from typing import Mapping
+from typing import Optional
+
+from .transport import Transport
+
+USER = """
+query User($id: Int!) {
+  user(id: $id) {
+    id
+    name
+  }
+}
+"""
+
+
+@dataclass(frozen=True)
+class UserResult:
+    user: Optional["UserResultUser"] = None
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "UserResult":
+        return cls(
+            user=None
+            if data["user"] is None
+            else UserResultUser.from_json(data["user"]),
+        )
+
+
+@dataclass(frozen=True)
+class UserResultUser:
+    id: int
+    name: str
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "UserResultUser":
+        return cls(
+            id=data["id"],
+            name=data["name"],
+        )
+
+
+class Client:
+    def __init__(self, transport: Transport) -> None:
+        self.transport = transport
+
+    async def user(self, id: int) -> UserResult:
+        variables: Dict[str, Any] = {
+            "id": id,
+        }
+        data = await self.transport.execute(USER, "User", variables)
+        return UserResult.from_json(data)
@@ -0,0 +1,202 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+from typing import Dict
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from uuid import UUID
+
+from .scalar_codecs import parse_datetime
+from .scalar_codecs import parse_decimal
+from .scalar_codecs import parse_uuid
+from .scalar_codecs import serialize_datetime
+from .transport import Transport
+from .types import DateTime
+from .types import Episode
+from .types import ReviewInput
+
+HERO = """
+query Hero($episode: Episode) {
+  hero(episode: $episode) {
+    __typename
+    ...CharacterName
+    ... on Human {
+      height
+    }
+    friends {
+      name
+    }
+  }
+}
+
+fragment CharacterName on Character {
+  id
+  name
+}
+"""
+
+REVIEWS = """
+query Reviews($episode: Episode!, $since: DateTime) {
+  reviews(episode: $episode, since: $since) {
+    stars
+    createdAt
+    text: commentary
+  }
+}
+"""
+
+CREATE_REVIEW = """
+mutation CreateReview($episode: Episode!, $review: ReviewInput!) {
+  createReview(episode: $episode, review: $review) {
+    episode
+    stars
+  }
+}
+"""
+
+
+@dataclass(frozen=True)
+class HeroResult:
+    hero: Optional["HeroResultHero"] = None
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "HeroResult":
+        return cls(
+            hero=None
+            if data["hero"] is None
+            else HeroResultHero.from_json(data["hero"]),
+        )
+
+
+@dataclass(frozen=True)
+class HeroResultHero:
+    typename: str
+    id: UUID
+    name: str
+    height: Optional[Decimal] = None
+    friends: Optional[Sequence[Optional["HeroResultHeroFriends"]]] = None
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "HeroResultHero":
+        return cls(
+            typename=data["__typename"],
+            id=parse_uuid(data["id"]),
+            name=data["name"],
+            height=None
+            if data.get("height") is None
+            else parse_decimal(data.get("height")),
+            friends=None
+            if data["friends"] is None
+            else [
+                None if item is None else HeroResultHeroFriends.from_json(item)
+                for item in data["friends"]
+            ],
+        )
+
+
+@dataclass(frozen=True)
+class HeroResultHeroFriends:
+    name: str
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "HeroResultHeroFriends":
+        return cls(
+            name=data["name"],
+        )
+
+
+@dataclass(frozen=True)
+class ReviewsResult:
+    reviews: Sequence["ReviewsResultReviews"]
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "ReviewsResult":
+        return cls(
+            reviews=[ReviewsResultReviews.from_json(item) for item in data["reviews"]],
+        )
+
+
+@dataclass(frozen=True)
+class ReviewsResultReviews:
+    stars: int
+    created_at: DateTime
+    text: Optional[str] = None
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "ReviewsResultReviews":
+        return cls(
+            stars=data["stars"],
+            created_at=parse_datetime(data["createdAt"]),
+            text=data["text"],
+        )
+
+
+@dataclass(frozen=True)
+class CreateReviewResult:
+    create_review: Optional["CreateReviewResultCreateReview"] = None
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "CreateReviewResult":
+        return cls(
+            create_review=None
+            if data["createReview"] is None
+            else CreateReviewResultCreateReview.from_json(data["createReview"]),
+        )
+
+
+@dataclass(frozen=True)
+class CreateReviewResultCreateReview:
+    episode: Episode
+    stars: int
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> "CreateReviewResultCreateReview":
+        return cls(
+            episode=Episode(data["episode"]),
+            stars=data["stars"],
+        )
+
+
+def encode_review_input(value: ReviewInput) -> Dict[str, Any]:
+    return {
+        "stars": value.stars,
+        "commentary": value.commentary,
+        "episodes": None
+        if value.episodes is None
+        else [item.value for item in value.episodes],
+    }
+
+
+class Client:
+    def __init__(self, transport: Transport) -> None:
+        self.transport = transport
+
+    async def hero(self, episode: Optional[Episode] = None) -> HeroResult:
+        variables: Dict[str, Any] = {}
+        if episode is not None:
+            variables["episode"] = episode.value
+        data = await self.transport.execute(HERO, "Hero", variables)
+        return HeroResult.from_json(data)
+
+    async def reviews(
+        self, episode: Episode, since: Optional[DateTime] = None
+    ) -> ReviewsResult:
+        variables: Dict[str, Any] = {
+            "episode": episode.value,
+        }
+        if since is not None:
+            variables["since"] = serialize_datetime(since)
+        data = await self.transport.execute(REVIEWS, "Reviews", variables)
+        return ReviewsResult.from_json(data)
+
+    async def create_review(
+        self, episode: Episode, review: ReviewInput
+    ) -> CreateReviewResult:
+        variables: Dict[str, Any] = {
+            "episode": episode.value,
+            "review": encode_review_input(review),
+        }
+        data = await self.transport.execute(CREATE_REVIEW, "CreateReview", variables)
+        return CreateReviewResult.from_json(data)
@@ -0,0 +1,60 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from typing import Optional
+from typing import Sequence
+
+from ariadne import EnumType
+from ariadne import MutationType
+from ariadne import ObjectType
+from ariadne import QueryType
+from ariadne import ScalarType
+from graphql import GraphQLResolveInfo
+
+from .scalar_codecs import parse_datetime
+from .scalar_codecs import serialize_datetime
+from .types import Character
+from .types import DateTime
+from .types import Episode
+from .types import Review
+from .types import ReviewInput
+
+date_time = ScalarType(
+    "DateTime", serializer=serialize_datetime, value_parser=parse_datetime
+)
+
+episode = EnumType("Episode", values=Episode)
+
+human = ObjectType("Human")
+
+droid = ObjectType("Droid")
+
+review = ObjectType("Review")
+
+query = QueryType()
+
+
+@query.field("hero")
+def resolve_query_hero(
+    _: None, info: GraphQLResolveInfo, episode: Optional[Episode]
+) -> Optional[Character]:
+    ...
+
+
+@query.field("reviews")
+def resolve_query_reviews(
+    _: None, info: GraphQLResolveInfo, episode: Episode, since: Optional[DateTime]
+) -> Sequence[Review]:
+    ...
+
+
+mutation = MutationType()
+
+
+@mutation.field("createReview")
+def resolve_mutation_create_review(
+    _: None, info: GraphQLResolveInfo, episode: Episode, review: ReviewInput
+) -> Optional[Review]:
+    ...
+
+
+resolvers = [date_time, episode, human, droid, review, query, mutation]
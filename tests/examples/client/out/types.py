@@ -0,0 +1,54 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+from typing import Protocol
+from typing import Sequence
+from uuid import UUID
+
+DateTime = datetime
+
+
+class Episode(Enum):
+    NEWHOPE = "NEWHOPE"
+    EMPIRE = "EMPIRE"
+    JEDI = "JEDI"
+
+
+class Character(Protocol):
+    id: UUID
+    name: str
+    friends: Optional[Sequence[Optional["Character"]]] = None
+
+
+@dataclass(frozen=True)
+class Human(Character):
+    id: UUID
+    name: str
+    friends: Optional[Sequence[Optional["Character"]]] = None
+    height: Optional[Decimal] = None
+
+
+@dataclass(frozen=True)
+class Droid(Character):
+    id: UUID
+    name: str
+    friends: Optional[Sequence[Optional["Character"]]] = None
+    primary_function: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Review:
+    episode: "Episode"
+    stars: int
+    created_at: "DateTime"
+    commentary: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ReviewInput:
+    stars: int
+    commentary: Optional[str] = None
+    episodes: Optional[Sequence["Episode"]] = None
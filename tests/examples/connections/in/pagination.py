@@ -0,0 +1,131 @@
+# generated by pasiphae, please do not change manually
+import base64
+import itertools as it
+import json
+import typing as t
+from dataclasses import dataclass
+from functools import wraps
+from inspect import isawaitable
+
+from graphql import GraphQLError
+
+from .types import PageInfo
+
+
+def encode_cursor(key: t.Any) -> str:
+    payload = json.dumps(key, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> t.Any:
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError as e:
+        raise GraphQLError(f"Invalid cursor: {cursor}") from e
+
+
+@dataclass(frozen=True)
+class Page:
+    """Keyset page requested by the client.
+
+    Resolver should fetch at most `fetch_size` nodes ordered by key, starting
+    right after `after` (or right before `before` when `backward` is set,
+    nearest to the cursor first).
+    """
+
+    limit: int
+    after: t.Any = None
+    before: t.Any = None
+    backward: bool = False
+
+    @property
+    def fetch_size(self) -> int:
+        return self.limit + 1
+
+    @classmethod
+    def from_arguments(
+        cls,
+        first: t.Optional[int],
+        after: t.Optional[str],
+        last: t.Optional[int],
+        before: t.Optional[str],
+        max_page_size: int,
+    ) -> "Page":
+        if first is not None and last is not None:
+            raise GraphQLError("Passing both `first` and `last` is not supported")
+        size = first if last is None else last
+        if size is None:
+            size = max_page_size
+        if size < 0:
+            raise GraphQLError("Page size cannot be negative")
+        if size > max_page_size:
+            raise GraphQLError(f"Page size cannot exceed {max_page_size}")
+        return cls(
+            limit=size,
+            after=None if after is None else decode_cursor(after),
+            before=None if before is None else decode_cursor(before),
+            backward=last is not None,
+        )
+
+
+def get_key(node: t.Any, key: str) -> t.Any:
+    if isinstance(node, t.Mapping):
+        return node[key]
+    return getattr(node, key)
+
+
+def build_connection(
+    nodes: t.Iterable[t.Any],
+    page: Page,
+    connection: t.Callable[..., t.Any],
+    edge: t.Callable[..., t.Any],
+    key: str,
+) -> t.Any:
+    fetched = list(it.islice(nodes, page.fetch_size))
+    has_more = len(fetched) > page.limit
+    del fetched[page.limit :]
+    if page.backward:
+        fetched.reverse()
+    edges = [
+        edge(cursor=encode_cursor(get_key(node, key)), node=node) for node in fetched
+    ]
+    # nodes exist beyond the cursor the page starts from
+    page_info = PageInfo(
+        has_next_page=has_more if not page.backward else page.before is not None,
+        has_previous_page=has_more if page.backward else page.after is not None,
+        start_cursor=edges[0].cursor if edges else None,
+        end_cursor=edges[-1].cursor if edges else None,
+    )
+    return connection(edges=edges, page_info=page_info)
+
+
+def paginated(
+    connection: t.Callable[..., t.Any],
+    edge: t.Callable[..., t.Any],
+    key: str = "id",
+    max_page_size: int = 100,
+) -> t.Callable[[t.Callable[..., t.Any]], t.Callable[..., t.Any]]:
+    def decorator(resolver: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
+        async def complete(nodes: t.Awaitable[t.Iterable[t.Any]], page: Page) -> t.Any:
+            return build_connection(await nodes, page, connection, edge, key)
+
+        @wraps(resolver)
+        def wrapper(
+            parent: t.Any,
+            info: t.Any,
+            *,
+            first: t.Optional[int] = None,
+            after: t.Optional[str] = None,
+            last: t.Optional[int] = None,
+            before: t.Optional[str] = None,
+            **kwargs: t.Any,
+        ) -> t.Any:
+            page = Page.from_arguments(first, after, last, before, max_page_size)
+            nodes = resolver(parent, info, page=page, **kwargs)
+            if isawaitable(nodes):
+                return complete(nodes, page)
+            return build_connection(nodes, page, connection, edge, key)
+
+        return wrapper
+
+    return decorator
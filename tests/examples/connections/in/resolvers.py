@@ -0,0 +1,75 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from typing import Iterable
+from typing import Optional
+
+from ariadne import EnumType
+from ariadne import ObjectType
+from ariadne import QueryType
+from graphql import GraphQLResolveInfo
+
+from .pagination import Page
+from .pagination import paginated
+from .types import Post
+from .types import PostConnection
+from .types import PostEdge
+from .types import Role
+from .types import User
+from .types import UserConnection
+from .types import UserEdge
+
+query = QueryType()
+
+
+@query.field("users")
+@paginated(UserConnection, UserEdge, key="id", max_page_size=50)
+def resolve_query_users(
+    _: None, info: GraphQLResolveInfo, page: Page, role: Optional[Role]
+) -> Iterable[User]:
+    ...
+
+
+@query.field("posts")
+@paginated(PostConnection, PostEdge, key="published_at", max_page_size=100)
+def resolve_query_posts(
+    _: None, info: GraphQLResolveInfo, page: Page
+) -> Iterable[Post]:
+    ...
+
+
+role = EnumType("Role", values=Role)
+
+user = ObjectType("User")
+
+
+@user.field("posts")
+@paginated(PostConnection, PostEdge, key="id", max_page_size=100)
+def resolve_user_posts(
+    user_: User, info: GraphQLResolveInfo, page: Page
+) -> Iterable[Post]:
+    ...
+
+
+post = ObjectType("Post")
+
+page_info = ObjectType("PageInfo")
+
+user_connection = ObjectType("UserConnection")
+
+user_edge = ObjectType("UserEdge")
+
+post_connection = ObjectType("PostConnection")
+
+post_edge = ObjectType("PostEdge")
+
+resolvers = [
+    query,
+    role,
+    user,
+    post,
+    page_info,
+    user_connection,
+    user_edge,
+    post_connection,
+    post_edge,
+]
@@ -0,0 +1,57 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+from typing import Sequence
+from uuid import UUID
+
+
+class Role(Enum):
+    ADMIN = "ADMIN"
+    MEMBER = "MEMBER"
+
+
+@dataclass(frozen=True)
+class User:
+    id: UUID
+    name: str
+    role: "Role"
+
+
+@dataclass(frozen=True)
+class Post:
+    id: UUID
+    title: str
+    published_at: str
+
+
+@dataclass(frozen=True)
+class PageInfo:
+    has_next_page: bool
+    has_previous_page: bool
+    start_cursor: Optional[str] = None
+    end_cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class UserConnection:
+    edges: Sequence["UserEdge"]
+    page_info: "PageInfo"
+
+
+@dataclass(frozen=True)
+class UserEdge:
+    cursor: str
+    node: "User"
+
+
+@dataclass(frozen=True)
+class PostConnection:
+    edges: Sequence["PostEdge"]
+    page_info: "PageInfo"
+
+
+@dataclass(frozen=True)
+class PostEdge:
+    cursor: str
+    node: "Post"
@@ -0,0 +1,9 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class User:
+    id: UUID
+    name: str
@@ -0,0 +1,17 @@
+from pathlib import Path
+
+from ariadne import load_schema_from_path
+from ariadne import make_executable_schema
+
+from .context import Context
+from .context import open_resources
+from .lifespan import DEBUG
+from .lifespan import ContextGraphQL
+from .resolvers import resolvers
+
+type_defs = load_schema_from_path(Path(__file__).parent / "schema.graphql")
+
+schema = make_executable_schema(type_defs, resolvers)
+app = ContextGraphQL(
+    schema, debug=DEBUG, open_resources=open_resources, context_class=Context
+)
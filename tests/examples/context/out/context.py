@@ -0,0 +1,22 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from contextlib import AsyncExitStack
+
+from .lifespan import RequestContext
+
+
+class Resources:
+    """Pooled resources, opened once on startup and shared by all requests"""
+
+
+class Context(RequestContext[Resources]):
+    """Context of a request, passed to resolvers as `info.context`
+
+    Per-request objects, like loaders and caches, are `cached_property`:
+    they are created on first access and dropped with the request.
+    """
+
+
+async def open_resources(stack: AsyncExitStack) -> Resources:
+    """Open pooled resources on startup, `stack` closes them on shutdown"""
+    return Resources()
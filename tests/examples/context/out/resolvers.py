@@ -0,0 +1,22 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from typing import Optional
+from uuid import UUID
+
+from ariadne import ObjectType
+from ariadne import QueryType
+from graphql import GraphQLResolveInfo
+
+from .types import User
+
+query = QueryType()
+
+
+@query.field("user")
+def resolve_query_user(_: None, info: GraphQLResolveInfo, id: UUID) -> Optional[User]:
+    ...
+
+
+user = ObjectType("User")
+
+resolvers = [query, user]
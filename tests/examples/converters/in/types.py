@@ -0,0 +1,46 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+from typing import Protocol
+from typing import Sequence
+from uuid import UUID
+
+DateTime = datetime
+
+
+class Status(Enum):
+    PLACED = "PLACED"
+    PAID = "PAID"
+    SHIPPED = "SHIPPED"
+
+
+class Node(Protocol):
+    id: UUID
+
+
+@dataclass(frozen=True)
+class Order(Node):
+    id: UUID
+    status: "Status"
+    placed_at: "DateTime"
+    lines: Sequence["OrderLine"]
+    customer: Optional["Customer"] = None
+    tags: Optional[Sequence[str]] = None
+    previous_statuses: Optional[Sequence[Optional["Status"]]] = None
+    related: Optional[Sequence["Node"]] = None
+
+
+@dataclass(frozen=True)
+class OrderLine:
+    product: str
+    quantity: int
+    price: Optional[Decimal] = None
+
+
+@dataclass(frozen=True)
+class Customer:
+    name: str
+    tier: Optional["Status"] = None
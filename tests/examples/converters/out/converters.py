@@ -0,0 +1,123 @@
+# generated by pasiphae, please do not change manually
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Sequence
+
+from .types import Customer
+from .types import Order
+from .types import OrderLine
+from .types import Status
+
+
+def order_from_row(row: Sequence[Any]) -> Order:
+    """Order from values in order of its fields"""
+    return Order(
+        row[0],
+        Status(row[1]),
+        row[2],
+        [order_line_from_row(item) for item in row[3]],
+        None if (value_4 := row[4]) is None else customer_from_row(value_4),
+        row[5],
+        None
+        if (value_6 := row[6]) is None
+        else [None if item is None else Status(item) for item in value_6],
+        row[7],
+    )
+
+
+def order_from_rows(rows: Iterable[Sequence[Any]]) -> List[Order]:
+    return [
+        Order(
+            row[0],
+            Status(row[1]),
+            row[2],
+            [order_line_from_row(item) for item in row[3]],
+            None if (value_4 := row[4]) is None else customer_from_row(value_4),
+            row[5],
+            None
+            if (value_6 := row[6]) is None
+            else [None if item is None else Status(item) for item in value_6],
+            row[7],
+        )
+        for row in rows
+    ]
+
+
+def order_from_mapping(mapping: Mapping[str, Any]) -> Order:
+    return Order(
+        mapping["id"],
+        Status(mapping["status"]),
+        mapping["placed_at"],
+        [order_line_from_mapping(item) for item in mapping["lines"]],
+        None
+        if (value_4 := mapping.get("customer")) is None
+        else customer_from_mapping(value_4),
+        mapping.get("tags"),
+        None
+        if (value_6 := mapping.get("previous_statuses")) is None
+        else [None if item is None else Status(item) for item in value_6],
+        mapping.get("related"),
+    )
+
+
+def order_to_dict(value: Order) -> Dict[str, Any]:
+    return {
+        "id": value.id,
+        "status": value.status.value,
+        "placed_at": value.placed_at,
+        "lines": [order_line_to_dict(item) for item in value.lines],
+        "customer": None
+        if value.customer is None
+        else customer_to_dict(value.customer),
+        "tags": value.tags,
+        "previous_statuses": None
+        if value.previous_statuses is None
+        else [None if item is None else item.value for item in value.previous_statuses],
+        "related": value.related,
+    }
+
+
+def order_line_from_row(row: Sequence[Any]) -> OrderLine:
+    """OrderLine from values in order of its fields"""
+    return OrderLine(row[0], row[1], row[2])
+
+
+def order_line_from_rows(rows: Iterable[Sequence[Any]]) -> List[OrderLine]:
+    return [OrderLine(row[0], row[1], row[2]) for row in rows]
+
+
+def order_line_from_mapping(mapping: Mapping[str, Any]) -> OrderLine:
+    return OrderLine(mapping["product"], mapping["quantity"], mapping.get("price"))
+
+
+def order_line_to_dict(value: OrderLine) -> Dict[str, Any]:
+    return {"product": value.product, "quantity": value.quantity, "price": value.price}
+
+
+def customer_from_row(row: Sequence[Any]) -> Customer:
+    """Customer from values in order of its fields"""
+    return Customer(row[0], None if (value_1 := row[1]) is None else Status(value_1))
+
+
+def customer_from_rows(rows: Iterable[Sequence[Any]]) -> List[Customer]:
+    return [
+        Customer(row[0], None if (value_1 := row[1]) is None else Status(value_1))
+        for row in rows
+    ]
+
+
+def customer_from_mapping(mapping: Mapping[str, Any]) -> Customer:
+    return Customer(
+        mapping["name"],
+        None if (value_1 := mapping.get("tier")) is None else Status(value_1),
+    )
+
+
+def customer_to_dict(value: Customer) -> Dict[str, Any]:
+    return {
+        "name": value.name,
+        "tier": None if value.tier is None else value.tier.value,
+    }
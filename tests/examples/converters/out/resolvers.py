@@ -0,0 +1,48 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from decimal import Decimal
+from typing import Sequence
+from uuid import UUID
+
+from ariadne import EnumType
+from ariadne import ObjectType
+from ariadne import QueryType
+from ariadne import ScalarType
+from graphql import GraphQLResolveInfo
+
+from .scalar_codecs import parse_datetime
+from .scalar_codecs import serialize_datetime
+from .types import Order
+from .types import Status
+
+date_time = ScalarType(
+    "DateTime", serializer=serialize_datetime, value_parser=parse_datetime
+)
+
+query = QueryType()
+
+
+@query.field("orders")
+def resolve_query_orders(
+    _: None, info: GraphQLResolveInfo, customer: UUID
+) -> Sequence[Order]:
+    ...
+
+
+order = ObjectType("Order")
+
+
+@order.field("total")
+def resolve_order_total(
+    order_: Order, info: GraphQLResolveInfo, currency: str
+) -> Decimal:
+    ...
+
+
+order_line = ObjectType("OrderLine")
+
+customer = ObjectType("Customer")
+
+status = EnumType("Status", values=Status)
+
+resolvers = [date_time, query, order, order_line, customer, status]
@@ -0,0 +1,28 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from typing import Optional
+
+from ariadne import QueryType
+from graphql import GraphQLResolveInfo
+
+from .types import ADate
+from .types import SomeString
+
+query = QueryType()
+
+
+@query.field("string")
+def resolve_query_string(
+    _: None, info: GraphQLResolveInfo, something: str
+) -> Optional[SomeString]:
+    ...
+
+
+@query.field("date")
+def resolve_query_date(
+    _: None, info: GraphQLResolveInfo, param: SomeString
+) -> Optional[ADate]:
+    ...
+
+
+resolvers = [query]
@@ -0,0 +1,4 @@
+# generated by pasiphae, please do not change manually
+from .scalars import ADate
+from .scalars import Number
+from .scalars import SomeString
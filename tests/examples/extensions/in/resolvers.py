@@ -0,0 +1,44 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from typing import Optional
+from typing import Sequence
+from uuid import UUID
+
+from ariadne import EnumType
+from ariadne import ObjectType
+from ariadne import QueryType
+from graphql import GraphQLResolveInfo
+
+from .types import Post
+from .types import Role
+from .types import User
+
+post = ObjectType("Post")
+
+query = QueryType()
+
+
+@query.field("user")
+def resolve_query_user(_: None, info: GraphQLResolveInfo, id: UUID) -> Optional[User]:
+    ...
+
+
+@query.field("posts")
+def resolve_query_posts(
+    _: None, info: GraphQLResolveInfo, author_id: UUID
+) -> Sequence[Post]:
+    ...
+
+
+@query.field("users")
+def resolve_query_users(
+    _: None, info: GraphQLResolveInfo, role: Role
+) -> Sequence[User]:
+    ...
+
+
+user = ObjectType("User")
+
+role = EnumType("Role", values=Role)
+
+resolvers = [post, query, user, role]
@@ -0,0 +1,26 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+from enum import Enum
+from typing import Sequence
+from uuid import UUID
+
+
+class Role(Enum):
+    READER = "READER"
+    EDITOR = "EDITOR"
+    ADMIN = "ADMIN"
+
+
+@dataclass(frozen=True)
+class Post:
+    id: UUID
+    title: str
+    author: "User"
+
+
+@dataclass(frozen=True)
+class User:
+    id: UUID
+    name: str
+    posts: Sequence["Post"]
+    role: "Role"
@@ -0,0 +1,14 @@
+from pathlib import Path
+
+from ariadne import load_schema_from_path
+from ariadne.asgi import GraphQL
+from ariadne.contrib.federation import make_federated_schema
+
+from .federation import batch_entities
+from .resolvers import resolvers
+
+type_defs = load_schema_from_path(Path(__file__).parent / "schema.graphql")
+
+schema = make_federated_schema(type_defs, resolvers)
+batch_entities(schema)
+app = GraphQL(schema, debug=True)
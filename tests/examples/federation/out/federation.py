@@ -0,0 +1,90 @@
+# generated by pasiphae, please do not change manually
+import asyncio
+import typing as t
+from inspect import isawaitable
+
+from graphql import GraphQLError
+from graphql import GraphQLResolveInfo
+from graphql import GraphQLSchema
+from graphql import GraphQLUnionType
+
+Representation = t.Mapping[str, t.Any]
+ReferenceResolver = t.Callable[[GraphQLResolveInfo, t.Sequence[Representation]], t.Any]
+
+references: t.Dict[str, ReferenceResolver] = {}
+
+
+def batch_reference(
+    type_name: str,
+) -> t.Callable[[ReferenceResolver], ReferenceResolver]:
+    def decorator(resolver: ReferenceResolver) -> ReferenceResolver:
+        references[type_name] = resolver
+        return resolver
+
+    return decorator
+
+
+async def resolve_references(
+    info: GraphQLResolveInfo,
+    type_name: str,
+    representations: t.Sequence[Representation],
+) -> t.Sequence[t.Any]:
+    entity = t.cast(GraphQLUnionType, info.schema.get_type("_Entity"))
+    if all(type_.name != type_name for type_ in entity.types):
+        raise GraphQLError(f"{type_name} is not an entity of this service")
+    resolver = references.get(type_name)
+    if resolver is None:
+        return representations
+    entities = resolver(info, representations)
+    if isawaitable(entities):
+        entities = await entities
+    entities = list(entities)
+    if len(entities) != len(representations):
+        raise GraphQLError(
+            f"{type_name} references resolver returned {len(entities)} entities"
+            f" for {len(representations)} representations"
+        )
+    return entities
+
+
+async def resolve_entities(
+    _: None, info: GraphQLResolveInfo, representations: t.Sequence[Representation]
+) -> t.List[t.Any]:
+    """Resolve representations of every entity type with one batched call
+
+    Results are returned in order of representations.
+    """
+    groups: t.Dict[str, t.List[int]] = {}
+    for index, representation in enumerate(representations):
+        groups.setdefault(representation["__typename"], []).append(index)
+    batches = await asyncio.gather(
+        *(
+            resolve_references(
+                info, type_name, [representations[index] for index in indexes]
+            )
+            for type_name, indexes in groups.items()
+        )
+    )
+    results: t.List[t.Any] = [None] * len(representations)
+    for (type_name, indexes), entities in zip(groups.items(), batches):
+        for index, entity in zip(indexes, entities):
+            if isinstance(entity, t.Mapping):
+                entity = {**entity, "__typename": type_name}
+            results[index] = entity
+    return results
+
+
+def resolve_entity_type(entity: t.Any, *_: t.Any) -> str:
+    # generated types are named after schema types
+    if isinstance(entity, t.Mapping):
+        return entity["__typename"]
+    return type(entity).__name__
+
+
+def batch_entities(schema: GraphQLSchema) -> None:
+    query = schema.query_type
+    if query is None or "_entities" not in query.fields:
+        return
+    query.fields["_entities"].resolve = resolve_entities
+    entity = t.cast(GraphQLUnionType, schema.get_type("_Entity"))
+    entity.resolve_type = resolve_entity_type
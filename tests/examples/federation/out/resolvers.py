@@ -0,0 +1,48 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from typing import Any
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+
+from ariadne import ObjectType
+from ariadne import QueryType
+from graphql import GraphQLResolveInfo
+
+from .federation import batch_reference
+from .types import Product
+from .types import Review
+
+query = QueryType()
+
+
+@query.field("product")
+def resolve_query_product(
+    _: None, info: GraphQLResolveInfo, upc: str
+) -> Optional[Product]:
+    ...
+
+
+product = ObjectType("Product")
+
+
+@batch_reference("Product")
+def resolve_product_references(
+    info: GraphQLResolveInfo, representations: Sequence[Mapping[str, Any]]
+) -> Sequence[Optional[Product]]:
+    ...
+
+
+review = ObjectType("Review")
+
+
+@batch_reference("Review")
+def resolve_review_references(
+    info: GraphQLResolveInfo, representations: Sequence[Mapping[str, Any]]
+) -> Sequence[Optional[Review]]:
+    ...
+
+
+user = ObjectType("User")
+
+resolvers = [query, product, review, user]
@@ -0,0 +1,25 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+from typing import Optional
+from typing import Sequence
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class Product:
+    upc: str
+    name: str
+    reviews: Sequence["Review"]
+    price: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class Review:
+    id: UUID
+    body: str
+    product: "Product"
+
+
+@dataclass(frozen=True)
+class User:
+    name: str
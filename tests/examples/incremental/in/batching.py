@@ -0,0 +1,66 @@
+# generated by pasiphae, please do not change manually
+import asyncio
+import os
+import typing as t
+
+from ariadne import graphql
+from ariadne.asgi import GraphQL
+from ariadne.exceptions import HttpError
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.responses import PlainTextResponse
+from starlette.responses import Response
+
+MAX_BATCH_SIZE = int(os.environ.get("GRAPHQL_MAX_BATCH_SIZE", "20"))
+
+
+class BatchGraphQL(GraphQL):
+    """GraphQL app which also accepts a list of operations in one request
+
+    Operations are executed concurrently and share the request context, so
+    loaders cached in it deduplicate between them. Results keep the order of
+    operations.
+    """
+
+    def __init__(
+        self, *args: t.Any, max_batch_size: int = MAX_BATCH_SIZE, **kwargs: t.Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.max_batch_size = max_batch_size
+
+    async def graphql_http_server(self, request: Request) -> Response:
+        try:
+            data = await self.extract_data_from_request(request)
+        except HttpError as error:
+            return PlainTextResponse(error.message or error.status, status_code=400)
+        if not isinstance(data, list):
+            # request body is cached, single operation is not parsed again
+            return await super().graphql_http_server(request)
+        if not 0 < len(data) <= self.max_batch_size:
+            return PlainTextResponse(
+                f"Batch should have 1 to {self.max_batch_size} operations",
+                status_code=400,
+            )
+
+        context_value = await self.get_context_for_request(request)
+        extensions = await self.get_extensions_for_request(request, context_value)
+        middleware = await self.get_middleware_for_request(request, context_value)
+        results = await asyncio.gather(
+            *(
+                graphql(
+                    self.schema,
+                    operation,
+                    context_value=context_value,
+                    root_value=self.root_value,
+                    validation_rules=self.validation_rules,
+                    debug=self.debug,
+                    introspection=self.introspection,
+                    logger=self.logger,
+                    error_formatter=self.error_formatter,
+                    extensions=extensions,
+                    middleware=middleware,
+                )
+                for operation in data
+            )
+        )
+        return JSONResponse([result for _, result in results])
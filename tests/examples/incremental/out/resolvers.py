@@ -0,0 +1,44 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from typing import AsyncIterator
+from typing import Optional
+
+from ariadne import ObjectType
+from ariadne import QueryType
+from graphql import GraphQLResolveInfo
+
+from .types import Product
+from .types import Review
+
+query = QueryType()
+
+
+@query.field("products")
+async def resolve_query_products(
+    _: None, info: GraphQLResolveInfo, category: Optional[str]
+) -> AsyncIterator[Product]:
+    for item in ():
+        yield item
+
+
+@query.field("product")
+def resolve_query_product(
+    _: None, info: GraphQLResolveInfo, id: int
+) -> Optional[Product]:
+    ...
+
+
+product = ObjectType("Product")
+
+
+@product.field("reviews")
+async def resolve_product_reviews(
+    product_: Product, info: GraphQLResolveInfo
+) -> AsyncIterator[Review]:
+    for item in ():
+        yield item
+
+
+review = ObjectType("Review")
+
+resolvers = [query, product, review]
@@ -0,0 +1,17 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+from typing import Optional
+from typing import Sequence
+
+
+@dataclass(frozen=True)
+class Product:
+    id: int
+    name: str
+    reviews: Optional[Sequence["Review"]] = None
+
+
+@dataclass(frozen=True)
+class Review:
+    stars: int
+    text: Optional[str] = None
@@ -0,0 +1,460 @@
+# generated by pasiphae, please do not change manually
+import asyncio
+import itertools as it
+import json
+import typing as t
+from contextvars import ContextVar
+
+from ariadne.asgi import GraphQL
+from ariadne.exceptions import HttpError
+from ariadne.extensions import ExtensionManager
+from ariadne.graphql import parse_query
+from ariadne.graphql import validate_query
+from graphql import DirectiveLocation
+from graphql import ExecutionContext
+from graphql import FieldNode
+from graphql import FragmentDefinitionNode
+from graphql import GraphQLArgument
+from graphql import GraphQLBoolean
+from graphql import GraphQLDirective
+from graphql import GraphQLError
+from graphql import GraphQLInt
+from graphql import GraphQLList
+from graphql import GraphQLNonNull
+from graphql import GraphQLObjectType
+from graphql import GraphQLOutputType
+from graphql import GraphQLResolveInfo
+from graphql import GraphQLSchema
+from graphql import GraphQLString
+from graphql import InlineFragmentNode
+from graphql import OperationType
+from graphql import SelectionSetNode
+from graphql import is_non_null_type
+from graphql import located_error
+from graphql.execution.collect_fields import does_fragment_condition_match
+from graphql.execution.collect_fields import get_field_entry_key
+from graphql.execution.collect_fields import should_include_node
+from graphql.execution.values import get_directive_values
+from graphql.pyutils import Path
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.responses import StreamingResponse
+
+# graphql-core 3.2 does not define incremental delivery directives
+GraphQLDeferDirective = GraphQLDirective(
+    name="defer",
+    locations=[DirectiveLocation.FRAGMENT_SPREAD, DirectiveLocation.INLINE_FRAGMENT],
+    args={
+        "if": GraphQLArgument(GraphQLNonNull(GraphQLBoolean), default_value=True),
+        "label": GraphQLArgument(GraphQLString),
+    },
+    description="Deliver fragment after the rest of the response",
+)
+GraphQLStreamDirective = GraphQLDirective(
+    name="stream",
+    locations=[DirectiveLocation.FIELD],
+    args={
+        "if": GraphQLArgument(GraphQLNonNull(GraphQLBoolean), default_value=True),
+        "label": GraphQLArgument(GraphQLString),
+        "initialCount": GraphQLArgument(GraphQLNonNull(GraphQLInt), default_value=0),
+    },
+    description="Deliver list items after the first `initialCount` one by one",
+)
+
+CONTENT_TYPE = 'multipart/mixed; boundary="-"; deferSpec=20220824'
+PART = b"\r\n---\r\nContent-Type: application/json; charset=utf-8\r\n\r\n"
+END = b"\r\n-----\r\n"
+
+Fields = t.Dict[str, t.List[FieldNode]]
+Deferred = t.List[t.Tuple[t.Optional[str], Fields]]
+Payload = t.Dict[str, t.Any]
+FormatError = t.Callable[[GraphQLError], t.Dict[str, t.Any]]
+
+# errors of payload which is being executed, each payload has its own list
+field_errors: ContextVar[t.List[GraphQLError]] = ContextVar("field_errors")
+
+
+def add_directives(schema: GraphQLSchema) -> None:
+    """Allow `@defer` and `@stream` in operations"""
+    names = {directive.name for directive in schema.directives}
+    schema.directives = (
+        *schema.directives,
+        *(
+            directive
+            for directive in (GraphQLDeferDirective, GraphQLStreamDirective)
+            if directive.name not in names
+        ),
+    )
+
+
+class IncrementalExecutionContext(ExecutionContext):
+    """Execution which leaves deferred fragments and streamed items for later
+
+    Later payloads are produced by tasks started during execution and are
+    read from `results` as soon as they are ready.
+    """
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.payloads: "asyncio.Queue[t.Optional[Payload]]" = asyncio.Queue()
+        self.tasks: t.Set["asyncio.Future[None]"] = set()
+        self.subfields: t.Dict[t.Tuple[t.Any, ...], t.Tuple[Fields, Deferred]] = {}
+
+    def handle_field_error(
+        self, error: GraphQLError, return_type: GraphQLOutputType, path: Path
+    ) -> None:
+        if is_non_null_type(return_type):
+            raise error
+        field_errors.get().append(error)
+        return None
+
+    def collect(
+        self,
+        runtime_type: GraphQLObjectType,
+        selection_set: SelectionSetNode,
+        fields: Fields,
+        deferred: Deferred,
+        visited: t.Set[str],
+    ) -> None:
+        for selection in selection_set.selections:
+            if not should_include_node(self.variable_values, selection):
+                continue
+            if isinstance(selection, FieldNode):
+                fields.setdefault(get_field_entry_key(selection), []).append(selection)
+                continue
+            fragment: t.Union[InlineFragmentNode, FragmentDefinitionNode]
+            if isinstance(selection, InlineFragmentNode):
+                fragment = selection
+            else:
+                name = selection.name.value  # type: ignore
+                if name in visited or name not in self.fragments:
+                    continue
+                visited.add(name)
+                fragment = self.fragments[name]
+            if not does_fragment_condition_match(self.schema, fragment, runtime_type):
+                continue
+            defer = get_directive_values(
+                GraphQLDeferDirective, selection, self.variable_values
+            )
+            if defer and defer["if"]:
+                deferred_fields: Fields = {}
+                self.collect(
+                    runtime_type,
+                    fragment.selection_set,
+                    deferred_fields,
+                    deferred,
+                    set(),
+                )
+                deferred.append((defer.get("label"), deferred_fields))
+            else:
+                self.collect(
+                    runtime_type, fragment.selection_set, fields, deferred, visited
+                )
+
+    def collect_incremental(
+        self, runtime_type: GraphQLObjectType, field_nodes: t.Sequence[FieldNode]
+    ) -> t.Tuple[Fields, Deferred]:
+        key = (runtime_type, *map(id, field_nodes))
+        if key not in self.subfields:
+            fields: Fields = {}
+            deferred: Deferred = []
+            visited: t.Set[str] = set()
+            for node in field_nodes:
+                if node.selection_set:
+                    self.collect(
+                        runtime_type, node.selection_set, fields, deferred, visited
+                    )
+            self.subfields[key] = fields, deferred
+        return self.subfields[key]
+
+    def collect_subfields(
+        self, return_type: GraphQLObjectType, field_nodes: t.List[FieldNode]
+    ) -> Fields:
+        return self.collect_incremental(return_type, field_nodes)[0]
+
+    def execute_operation(self, operation: t.Any, root_value: t.Any) -> t.Any:
+        root_type = self.schema.get_root_type(operation.operation)
+        if root_type is None:
+            return super().execute_operation(operation, root_value)
+        fields: Fields = {}
+        deferred: Deferred = []
+        self.collect(root_type, operation.selection_set, fields, deferred, set())
+        self.defer(root_type, root_value, None, deferred)
+        if operation.operation == OperationType.MUTATION:
+            return self.execute_fields_serially(root_type, root_value, None, fields)
+        return self.execute_fields(root_type, root_value, None, fields)
+
+    def complete_object_value(
+        self,
+        return_type: GraphQLObjectType,
+        field_nodes: t.List[FieldNode],
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: t.Any,
+    ) -> t.Any:
+        _, deferred = self.collect_incremental(return_type, field_nodes)
+        self.defer(return_type, result, path, deferred)
+        return super().complete_object_value(
+            return_type, field_nodes, info, path, result
+        )
+
+    def complete_list_value(
+        self,
+        return_type: GraphQLList[GraphQLOutputType],
+        field_nodes: t.List[FieldNode],
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: t.Any,
+    ) -> t.Any:
+        stream = get_directive_values(
+            GraphQLStreamDirective, field_nodes[0], self.variable_values
+        )
+        # only the list returned by field, not lists nested in it
+        if not stream or not stream["if"] or not isinstance(path.key, str):
+            return super().complete_list_value(
+                return_type, field_nodes, info, path, result
+            )
+        initial_count = stream["initialCount"]
+        if initial_count < 0:
+            raise GraphQLError("initialCount has to be non-negative", field_nodes)
+
+        def stream_rest(items: t.AsyncIterator[t.Any], index: int) -> None:
+            self.schedule(
+                self.stream_items(
+                    items, index, return_type.of_type, field_nodes, info, path, stream
+                )
+            )
+
+        if not hasattr(result, "__aiter__"):
+            items = iter(result)
+            initial = list(it.islice(items, initial_count))
+            stream_rest(from_iterable(items), initial_count)
+            return super().complete_list_value(
+                return_type, field_nodes, info, path, initial
+            )
+
+        async def complete_initial() -> t.Any:
+            iterator = result.__aiter__()
+            initial = []
+            try:
+                while len(initial) < initial_count:
+                    initial.append(await iterator.__anext__())
+            except StopAsyncIteration:
+                pass
+            else:
+                stream_rest(iterator, initial_count)
+            completed = super(IncrementalExecutionContext, self).complete_list_value(
+                return_type, field_nodes, info, path, initial
+            )
+            return await completed if self.is_awaitable(completed) else completed
+
+        return complete_initial()
+
+    def defer(
+        self,
+        parent_type: GraphQLObjectType,
+        source: t.Any,
+        path: t.Optional[Path],
+        deferred: Deferred,
+    ) -> None:
+        for label, fields in deferred:
+            self.schedule(
+                self.execute_deferred(parent_type, source, path, label, fields)
+            )
+
+    def schedule(self, payloads: t.Awaitable[None]) -> None:
+        task = asyncio.ensure_future(payloads)
+        self.tasks.add(task)
+        task.add_done_callback(self.finished)
+
+    def finished(self, task: "asyncio.Future[None]") -> None:
+        self.tasks.discard(task)
+        self.payloads.put_nowait(None)  # wake up results reader
+
+    def push(self, payload: Payload, label: t.Optional[str]) -> None:
+        if label is not None:
+            payload["label"] = label
+        errors = field_errors.get()
+        if errors:
+            payload["errors"] = errors
+        field_errors.set([])
+        self.payloads.put_nowait(payload)
+
+    async def execute_deferred(
+        self,
+        parent_type: GraphQLObjectType,
+        source: t.Any,
+        path: t.Optional[Path],
+        label: t.Optional[str],
+        fields: Fields,
+    ) -> None:
+        field_errors.set([])
+        try:
+            data = self.execute_fields(parent_type, source, path, fields)
+            if self.is_awaitable(data):
+                data = await data
+        except GraphQLError as error:
+            field_errors.get().append(error)
+            data = None
+        self.push({"data": data, "path": path.as_list() if path else []}, label)
+
+    async def stream_items(
+        self,
+        items: t.AsyncIterator[t.Any],
+        index: int,
+        item_type: GraphQLOutputType,
+        field_nodes: t.List[FieldNode],
+        info: GraphQLResolveInfo,
+        path: Path,
+        stream: t.Mapping[str, t.Any],
+    ) -> None:
+        field_errors.set([])
+        while True:
+            item_path = path.add_key(index, None)
+            try:
+                item = await items.__anext__()
+            except StopAsyncIteration:
+                return
+            except Exception as raw_error:
+                field_errors.get().append(
+                    located_error(raw_error, field_nodes, path.as_list())
+                )
+                self.push(
+                    {"items": None, "path": item_path.as_list()}, stream.get("label")
+                )
+                return
+            try:
+                completed = self.complete_value(
+                    item_type, field_nodes, info, item_path, item
+                )
+                if self.is_awaitable(completed):
+                    completed = await completed
+            except Exception as raw_error:
+                error = located_error(raw_error, field_nodes, item_path.as_list())
+                field_errors.get().append(error)
+                completed = None
+            self.push(
+                {"items": [completed], "path": item_path.as_list()}, stream.get("label")
+            )
+            index += 1
+
+    async def results(self, format_error: FormatError) -> t.AsyncIterator[Payload]:
+        """Initial result followed by incremental payloads"""
+        errors: t.List[GraphQLError] = []
+        field_errors.set(errors)
+        try:
+            try:
+                data = self.execute_operation(self.operation, self.root_value)
+                if self.is_awaitable(data):
+                    data = await data
+            except GraphQLError as error:
+                errors.append(error)
+                data = None
+            initial: Payload = {"data": data}
+            if errors:
+                initial["errors"] = list(map(format_error, errors))
+            has_next = data is not None and self.has_next
+            yield {**initial, "hasNext": has_next}
+            while has_next:
+                incremental = [await self.payloads.get()]
+                while not self.payloads.empty():
+                    incremental.append(self.payloads.get_nowait())
+                has_next = self.has_next
+                payloads = [
+                    formatted(payload, format_error)
+                    for payload in incremental
+                    if payload is not None
+                ]
+                if payloads:
+                    yield {"incremental": payloads, "hasNext": has_next}
+                elif not has_next:
+                    yield {"hasNext": False}
+        finally:
+            for task in self.tasks:
+                task.cancel()
+
+    @property
+    def has_next(self) -> bool:
+        return bool(self.tasks) or not self.payloads.empty()
+
+
+def formatted(payload: Payload, format_error: FormatError) -> Payload:
+    if "errors" in payload:
+        return {**payload, "errors": list(map(format_error, payload["errors"]))}
+    return payload
+
+
+async def from_iterable(items: t.Iterable[t.Any]) -> t.AsyncIterator[t.Any]:
+    for item in items:
+        yield item
+
+
+class IncrementalGraphQL(GraphQL):
+    """GraphQL app serving `@defer` and `@stream` as multipart responses
+
+    Clients have to accept `multipart/mixed`, others get complete results in
+    one response. Every payload is sent as soon as it is ready.
+    """
+
+    async def graphql_http_server(self, request: Request) -> Response:
+        if "multipart/mixed" not in request.headers.get("accept", ""):
+            return await super().graphql_http_server(request)
+        try:
+            data = await self.extract_data_from_request(request)
+        except HttpError:
+            return await super().graphql_http_server(request)
+        query = data.get("query") if isinstance(data, dict) else None
+        if not isinstance(query, str) or not ("@defer" in query or "@stream" in query):
+            return await super().graphql_http_server(request)
+
+        # requests with errors are answered by ariadne
+        try:
+            document = parse_query(query)
+        except GraphQLError:
+            return await super().graphql_http_server(request)
+        context_value = await self.get_context_for_request(request)
+        validation_rules = self.validation_rules
+        if callable(validation_rules):
+            validation_rules = validation_rules(context_value, document, data)
+        if validate_query(
+            self.schema,
+            document,
+            validation_rules,
+            enable_introspection=self.introspection,
+        ):
+            return await super().graphql_http_server(request)
+
+        extensions = await self.get_extensions_for_request(request, context_value)
+        middleware = await self.get_middleware_for_request(request, context_value)
+        root_value = self.root_value
+        if callable(root_value):
+            root_value = root_value(context_value, document)
+            if asyncio.iscoroutine(root_value):
+                root_value = await root_value
+        context = IncrementalExecutionContext.build(
+            self.schema,
+            document,
+            root_value,
+            context_value,
+            data.get("variables"),
+            data.get("operationName"),
+            middleware=ExtensionManager(
+                extensions, context_value
+            ).as_middleware_manager(middleware),
+        )
+        if isinstance(context, list):
+            return await super().graphql_http_server(request)
+        return StreamingResponse(
+            self.multipart(context.results(self.format_error)),
+            media_type=CONTENT_TYPE,
+        )
+
+    def format_error(self, error: GraphQLError) -> t.Dict[str, t.Any]:
+        return self.error_formatter(error, self.debug)
+
+    async def multipart(
+        self, results: t.AsyncIterator[Payload]
+    ) -> t.AsyncIterator[bytes]:
+        async for payload in results:
+            yield PART + json.dumps(payload).encode()
+        yield END
@@ -0,0 +1,27 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+from typing import Sequence
+from uuid import UUID
+
+
+class Kind(Enum):
+    PHYSICAL = "PHYSICAL"
+    DIGITAL = "DIGITAL"
+
+
+@dataclass(frozen=True)
+class Product:
+    id: UUID
+    name: str
+    prices: Sequence["Price"]
+    kind: "Kind"
+    price: Optional[Decimal] = None
+
+
+@dataclass(frozen=True)
+class Price:
+    amount: Decimal
+    currency: str
@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from ariadne import load_schema_from_path
+from ariadne import make_executable_schema
+
+from .incremental import IncrementalGraphQL
+from .incremental import add_directives
+from .introspection import IntrospectionGraphQL
+from .resolvers import resolvers
+
+
+class GraphQL(IncrementalGraphQL, IntrospectionGraphQL):
+    """Ariadne app with all generated request handling features"""
+
+
+type_defs = load_schema_from_path(Path(__file__).parent / "schema.graphql")
+
+schema = make_executable_schema(type_defs, resolvers)
+add_directives(schema)
+app = GraphQL(schema, debug=True)
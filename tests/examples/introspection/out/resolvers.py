@@ -0,0 +1,39 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from typing import AsyncIterator
+from typing import Optional
+from uuid import UUID
+
+from ariadne import EnumType
+from ariadne import ObjectType
+from ariadne import QueryType
+from graphql import GraphQLResolveInfo
+
+from .types import Kind
+from .types import Product
+
+query = QueryType()
+
+
+@query.field("products")
+async def resolve_query_products(
+    _: None, info: GraphQLResolveInfo, category: Optional[str], first: Optional[int]
+) -> AsyncIterator[Product]:
+    for item in ():
+        yield item
+
+
+@query.field("product")
+def resolve_query_product(
+    _: None, info: GraphQLResolveInfo, id: UUID
+) -> Optional[Product]:
+    ...
+
+
+product = ObjectType("Product")
+
+price = ObjectType("Price")
+
+kind = EnumType("Kind", values=Kind)
+
+resolvers = [query, product, price, kind]
@@ -0,0 +1,11 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Sequence
+
+
+@dataclass(frozen=True)
+class Quote:
+    symbol: str
+    price: Decimal
+    history: Sequence[Decimal]
@@ -0,0 +1,77 @@
+# generated by pasiphae, please do not change manually
+import asyncio
+import typing as t
+from functools import wraps
+from inspect import isawaitable
+
+from graphql import GraphQLError
+
+
+class Limit:
+    """Concurrency limit and deadline shared by all calls of one field
+
+    Call waiting for a free slot longer than the deadline is rejected, call
+    running longer than what is left of the deadline is timed out.
+    """
+
+    def __init__(
+        self, name: str, concurrency: int, timeout_ms: t.Optional[int] = None
+    ) -> None:
+        self.name = name
+        self.concurrency = concurrency
+        self.timeout = timeout_ms / 1000 if timeout_ms else None
+        self.rejected = 0
+        self.timed_out = 0
+        self._semaphore: t.Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # created lazily, so it is bound to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    async def run(self, call: t.Callable[[], t.Any]) -> t.Any:
+        loop = asyncio.get_running_loop()
+        deadline = None if self.timeout is None else loop.time() + self.timeout
+        semaphore = self.semaphore
+        if semaphore.locked():
+            try:
+                await asyncio.wait_for(semaphore.acquire(), self.timeout)
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                raise GraphQLError(f"{self.name} is overloaded, try again later")
+        else:
+            await semaphore.acquire()
+        try:
+            result = call()
+            if isawaitable(result):
+                timeout = None if deadline is None else deadline - loop.time()
+                result = await asyncio.wait_for(result, timeout)
+            return result
+        except asyncio.TimeoutError:
+            # resolvers may time out on their own, their errors are kept
+            if deadline is None or loop.time() < deadline:
+                raise
+            self.timed_out += 1
+            raise GraphQLError(f"{self.name} timed out")
+        finally:
+            semaphore.release()
+
+
+limits: t.Dict[str, Limit] = {}
+
+
+def limited(
+    name: str, concurrency: int, timeout_ms: t.Optional[int] = None
+) -> t.Callable[[t.Callable[..., t.Any]], t.Callable[..., t.Any]]:
+    limit = limits[name] = Limit(name, concurrency, timeout_ms)
+
+    def decorator(resolver: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
+        @wraps(resolver)
+        async def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            return await limit.run(lambda: resolver(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,36 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from decimal import Decimal
+from typing import Optional
+from typing import Sequence
+
+from ariadne import ObjectType
+from ariadne import QueryType
+from graphql import GraphQLResolveInfo
+
+from .limits import limited
+from .types import Quote
+
+query = QueryType()
+
+
+@query.field("quote")
+@limited("Query.quote", concurrency=20, timeout_ms=300)
+async def resolve_query_quote(
+    _: None, info: GraphQLResolveInfo, symbol: str
+) -> Optional[Quote]:
+    ...
+
+
+quote = ObjectType("Quote")
+
+
+@quote.field("history")
+@limited("Quote.history", concurrency=5)
+async def resolve_quote_history(
+    quote_: Quote, info: GraphQLResolveInfo
+) -> Sequence[Decimal]:
+    ...
+
+
+resolvers = [query, quote]
@@ -0,0 +1,122 @@
+# generated by pasiphae, please do not change manually
+import argparse
+import asyncio
+import json
+import typing as t
+from time import perf_counter
+
+from .transport import Connection
+from .transport import Send
+from .transport import in_process
+
+OPERATIONS = {
+    "hero": "query Hero { hero(episode: NEWHOPE) { id name friends { id name appearsIn } friendsConnection { totalCount } appearsIn } }",
+    "reviews": "query Reviews { reviews(episode: NEWHOPE) { stars commentary } }",
+    "search": 'query Search { search(text: "loadtest") { __typename } }',
+    "character": 'query Character { character(id: "1") { id name friends { id name appearsIn } friendsConnection { totalCount } appearsIn } }',
+    "droid": 'query Droid { droid(id: "1") { id name friends { id name appearsIn } friendsConnection { totalCount } appearsIn primaryFunction } }',
+    "human": 'query Human { human(id: "1") { id name height mass friends { id name appearsIn } friendsConnection { totalCount } appearsIn starships { id name length } } }',
+    "starship": 'query Starship { starship(id: "1") { id name length } }',
+}
+
+
+def percentile(latencies: t.Sequence[float], fraction: float) -> float:
+    if not latencies:
+        return 0.0
+    return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+
+async def run_operation(
+    senders: t.Sequence[Send], query: str, requests: int
+) -> t.Dict[str, float]:
+    body = json.dumps({"query": query}).encode()
+    latencies: t.List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker(send: Send) -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = perf_counter()
+            status, response = await send(body)
+            latencies.append(perf_counter() - start)
+            if status != 200 or b'"errors"' in response:
+                errors += 1
+
+    start = perf_counter()
+    await asyncio.gather(*map(worker, senders))
+    elapsed = perf_counter() - start
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "rps": requests / elapsed,
+        "p50": percentile(latencies, 0.50) * 1000,
+        "p95": percentile(latencies, 0.95) * 1000,
+        "p99": percentile(latencies, 0.99) * 1000,
+    }
+
+
+async def run(
+    operations: t.Mapping[str, str],
+    concurrency: int,
+    requests: int,
+    url: t.Optional[str],
+) -> t.Dict[str, t.Dict[str, float]]:
+    if url is None:
+        from .app import app
+
+        send = in_process(app)
+        return {
+            name: await run_operation([send] * concurrency, query, requests)
+            for name, query in operations.items()
+        }
+    connections = [Connection(url) for _ in range(concurrency)]
+    try:
+        return {
+            name: await run_operation(
+                [connection.send for connection in connections], query, requests
+            )
+            for name, query in operations.items()
+        }
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def report(results: t.Mapping[str, t.Mapping[str, float]]) -> str:
+    width = max(map(len, ("operation", *results)))
+    lines = [
+        f"{'operation':<{width}} {'requests':>9} {'errors':>9} {'rps':>9}"
+        f" {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    ]
+    for name, result in results.items():
+        lines.append(
+            f"{name:<{width}} {result['requests']:>9.0f} {result['errors']:>9.0f}"
+            f" {result['rps']:>9.0f} {result['p50']:>9.2f} {result['p95']:>9.2f}"
+            f" {result['p99']:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test generated service")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument(
+        "--url", help="service url, app is called in-process when not provided"
+    )
+    parser.add_argument("--operation", action="append", choices=sorted(OPERATIONS))
+    args = parser.parse_args()
+    operations = {
+        name: query
+        for name, query in OPERATIONS.items()
+        if not args.operation or name in args.operation
+    }
+    results = asyncio.run(run(operations, args.concurrency, args.requests, args.url))
+    print(report(results))
+
+
+if __name__ == "__main__":
+    main()
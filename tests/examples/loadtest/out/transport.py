@@ -0,0 +1,264 @@
+# generated by pasiphae, please do not change manually
+import asyncio
+import json
+import typing as t
+from urllib.parse import urlsplit
+
+Send = t.Callable[[bytes], t.Awaitable[t.Tuple[int, bytes]]]
+Result = t.Dict[str, t.Any]
+
+
+class GraphQLError(Exception):
+    def __init__(self, errors: t.Sequence[t.Mapping[str, t.Any]]) -> None:
+        super().__init__("; ".join(error.get("message", "") for error in errors))
+        self.errors = errors
+
+
+def in_process(app: t.Any, path: str = "/") -> Send:
+    """Call ASGI app directly, without network"""
+
+    async def send(body: bytes) -> t.Tuple[int, bytes]:
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [
+                (b"host", b"localhost"),
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+            "client": ("127.0.0.1", 0),
+            "server": ("127.0.0.1", 80),
+        }
+        requests = [{"type": "http.request", "body": body, "more_body": False}]
+        status = 0
+        chunks: t.List[bytes] = []
+
+        async def receive() -> t.Dict[str, t.Any]:
+            if requests:
+                return requests.pop()
+            await asyncio.Future()  # wait until response is sent
+            return {"type": "http.disconnect"}
+
+        async def respond(message: t.Dict[str, t.Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await app(scope, receive, respond)
+        return status, b"".join(chunks)
+
+    return send
+
+
+class ConnectionClosed(ConnectionResetError):
+    """Connection was closed by server without response"""
+
+
+class Connection:
+    """Keep-alive HTTP/1.1 connection, used by one request at a time
+
+    Servers close idle keep-alive connections, request which got no response
+    on a reused connection is sent again on a new one. Other connection errors
+    are raised, the server might have processed the request.
+    """
+
+    def __init__(self, url: str, headers: t.Mapping[str, str] = {}) -> None:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme {parts.scheme!r}")
+        self.ssl = parts.scheme == "https"
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or (443 if self.ssl else 80)
+        self.path = parts.path or "/"
+        self.headers = "".join(
+            f"{name}: {value}\r\n" for name, value in headers.items()
+        )
+        self.reader: t.Optional[asyncio.StreamReader] = None
+        self.writer: t.Optional[asyncio.StreamWriter] = None
+
+    async def send(self, body: bytes) -> t.Tuple[int, bytes]:
+        if self.writer is None:
+            return await self.exchange(body)
+        try:
+            return await self.exchange(body)
+        except ConnectionClosed:
+            self.close()
+        return await self.exchange(body)
+
+    async def exchange(self, body: bytes) -> t.Tuple[int, bytes]:
+        if self.reader is None or self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port, ssl=self.ssl
+            )
+        head = (
+            f"POST {self.path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            "Content-Type: application/json\r\n"
+            f"{self.headers}"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        )
+        self.writer.write(head.encode() + body)
+        await self.writer.drain()
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionClosed("Connection closed by server")
+        status = int(status_line.split()[1])
+        length, chunked, keep_alive = 0, False, True
+        while (line := await self.reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+            elif name.lower() == "transfer-encoding":
+                chunked = "chunked" in value.lower()
+            elif name.lower() == "connection":
+                keep_alive = "close" not in value.lower()
+        if chunked:
+            chunks = []
+            while size := int((await self.reader.readline()).strip(), 16):
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            await self.reader.readline()
+            content = b"".join(chunks)
+        else:
+            content = await self.reader.readexactly(length)
+        if not keep_alive:
+            self.close()
+        return status, content
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+class Pool:
+    """Keep-alive connections reused by concurrent requests"""
+
+    def __init__(
+        self, url: str, size: int = 10, headers: t.Mapping[str, str] = {}
+    ) -> None:
+        self.connections = [Connection(url, headers) for _ in range(size)]
+        self.idle: "asyncio.Queue[Connection]" = asyncio.Queue()
+        for connection in self.connections:
+            self.idle.put_nowait(connection)
+
+    async def send(self, body: bytes) -> t.Tuple[int, bytes]:
+        connection = await self.idle.get()
+        try:
+            return await connection.send(body)
+        except BaseException:
+            connection.close()
+            raise
+        finally:
+            self.idle.put_nowait(connection)
+
+    def close(self) -> None:
+        for connection in self.connections:
+            connection.close()
+
+
+class Transport:
+    """Execute operations, concurrent calls are sent in one request with `batch`"""
+
+    def __init__(
+        self,
+        send: Send,
+        batch: bool = False,
+        max_batch_size: int = 100,
+        close: t.Callable[[], None] = lambda: None,
+    ) -> None:
+        self.send = send
+        self.batch = batch
+        self.max_batch_size = max_batch_size
+        self.close = close
+        self.pending: t.List[t.Tuple[Result, "asyncio.Future[Result]"]] = []
+
+    @classmethod
+    def connect(
+        cls,
+        url: str,
+        pool_size: int = 10,
+        headers: t.Mapping[str, str] = {},
+        **kwargs: t.Any,
+    ) -> "Transport":
+        """Send requests over pool of keep-alive connections"""
+        pool = Pool(url, pool_size, headers)
+        return cls(pool.send, close=pool.close, **kwargs)
+
+    async def __aenter__(self) -> "Transport":
+        return self
+
+    async def __aexit__(self, *_: t.Any) -> None:
+        self.close()
+
+    async def execute(
+        self, query: str, operation_name: str, variables: t.Mapping[str, t.Any]
+    ) -> Result:
+        payload = {
+            "query": query,
+            "operationName": operation_name,
+            "variables": variables,
+        }
+        if not self.batch:
+            return data(await self.post(payload))
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((payload, future))
+        if len(self.pending) == 1:
+            asyncio.get_running_loop().call_soon(self.flush)
+        elif len(self.pending) >= self.max_batch_size:
+            self.flush()
+        return data(await future)
+
+    def flush(self) -> None:
+        pending, self.pending = self.pending, []
+        if pending:
+            asyncio.ensure_future(self.send_batch(pending))
+
+    async def send_batch(
+        self, pending: t.Sequence[t.Tuple[Result, "asyncio.Future[Result]"]]
+    ) -> None:
+        try:
+            if len(pending) == 1:
+                results = [await self.post(pending[0][0])]
+            else:
+                results = await self.post([payload for payload, _ in pending])
+                if not isinstance(results, list) or len(results) != len(pending):
+                    raise batch_error(results, len(pending))
+        except BaseException as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def post(self, payload: t.Any) -> t.Any:
+        status, body = await self.send(json.dumps(payload).encode())
+        try:
+            return json.loads(body)
+        except ValueError:
+            raise GraphQLError([{"message": f"HTTP {status}: {body[:200]!r}"}])
+
+
+def batch_error(results: t.Any, size: int) -> GraphQLError:
+    """Batch answered with other shape than list of all results"""
+    if isinstance(results, dict) and results.get("errors"):
+        return GraphQLError(results["errors"])
+    message = f"Expected list of {size} results, got {json.dumps(results)[:200]}"
+    return GraphQLError([{"message": message}])
+
+
+def data(result: Result) -> Result:
+    if result.get("errors"):
+        raise GraphQLError(result["errors"])
+    return result["data"]
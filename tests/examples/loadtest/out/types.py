@@ -0,0 +1,87 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+from typing import Protocol
+from typing import Sequence
+from typing import Union
+from uuid import UUID
+
+SearchResult = Union["Human", "Droid", "Starship"]
+
+
+class Episode(Enum):
+    NEWHOPE = "NEWHOPE"
+    EMPIRE = "EMPIRE"
+    JEDI = "JEDI"
+
+
+class LengthUnit(Enum):
+    METER = "METER"
+    FOOT = "FOOT"
+
+
+class Character(Protocol):
+    id: UUID
+    name: str
+    appears_in: Sequence["Episode"]
+    friends: Optional[Sequence[Optional["Character"]]] = None
+
+
+@dataclass(frozen=True)
+class Human(Character):
+    id: UUID
+    name: str
+    appears_in: Sequence["Episode"]
+    mass: Optional[Decimal] = None
+    friends: Optional[Sequence[Optional["Character"]]] = None
+    starships: Optional[Sequence[Optional["Starship"]]] = None
+
+
+@dataclass(frozen=True)
+class Droid(Character):
+    id: UUID
+    name: str
+    appears_in: Sequence["Episode"]
+    friends: Optional[Sequence[Optional["Character"]]] = None
+    primary_function: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class FriendsConnection:
+    total_count: int
+    page_info: "PageInfo"
+    edges: Optional[Sequence[Optional["FriendsEdge"]]] = None
+    friends: Optional[Sequence[Optional["Character"]]] = None
+
+
+@dataclass(frozen=True)
+class FriendsEdge:
+    cursor: UUID
+    node: Optional["Character"] = None
+
+
+@dataclass(frozen=True)
+class PageInfo:
+    has_next_page: bool
+    start_cursor: Optional[UUID] = None
+    end_cursor: Optional[UUID] = None
+
+
+@dataclass(frozen=True)
+class Review:
+    stars: int
+    commentary: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ReviewInput:
+    stars: int
+    commentary: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Starship:
+    id: UUID
+    name: str
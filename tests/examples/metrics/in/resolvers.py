@@ -0,0 +1,30 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from typing import Optional
+from typing import Sequence
+from uuid import UUID
+
+from ariadne import ObjectType
+from ariadne import QueryType
+from graphql import GraphQLResolveInfo
+
+from .types import Book
+
+query = QueryType()
+
+
+@query.field("book")
+def resolve_query_book(_: None, info: GraphQLResolveInfo, id: UUID) -> Optional[Book]:
+    ...
+
+
+@query.field("books")
+def resolve_query_books(
+    _: None, info: GraphQLResolveInfo, author: Optional[str]
+) -> Sequence[Book]:
+    ...
+
+
+book = ObjectType("Book")
+
+resolvers = [query, book]
@@ -0,0 +1,17 @@
+from pathlib import Path
+
+from ariadne import load_schema_from_path
+from ariadne import make_executable_schema
+from ariadne.asgi import GraphQL
+
+from .metrics import ResolverMetrics
+from .metrics import metrics_endpoint
+from .metrics import registry
+from .resolvers import resolvers
+
+type_defs = load_schema_from_path(Path(__file__).parent / "schema.graphql")
+
+schema = make_executable_schema(type_defs, resolvers)
+registry.register(schema)
+app = GraphQL(schema, debug=True, extensions=[ResolverMetrics])
+app = metrics_endpoint(app)
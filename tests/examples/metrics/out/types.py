@@ -0,0 +1,10 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class Book:
+    id: UUID
+    title: str
+    author: str
@@ -0,0 +1,14 @@
+from pathlib import Path
+
+from ariadne import load_schema_from_path
+from ariadne import make_executable_schema
+from ariadne.asgi import GraphQL
+
+from .mock import mock_schema
+from .resolvers import resolvers
+
+type_defs = load_schema_from_path(Path(__file__).parent / "schema.graphql")
+
+schema = make_executable_schema(type_defs, resolvers)
+mock_schema(schema)
+app = GraphQL(schema, debug=True)
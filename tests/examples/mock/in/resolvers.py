@@ -0,0 +1,46 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from typing import Sequence
+
+from ariadne import EnumType
+from ariadne import ObjectType
+from ariadne import QueryType
+from ariadne import ScalarType
+from graphql import GraphQLResolveInfo
+
+from .scalar_codecs import parse_datetime
+from .scalar_codecs import serialize_datetime
+from .types import Character
+from .types import Episode
+from .types import SearchResult
+
+query = QueryType()
+
+
+@query.field("hero")
+def resolve_query_hero(
+    _: None, info: GraphQLResolveInfo, episode: Episode
+) -> Character:
+    ...
+
+
+@query.field("search")
+def resolve_query_search(
+    _: None, info: GraphQLResolveInfo, text: str
+) -> Sequence[SearchResult]:
+    ...
+
+
+episode = EnumType("Episode", values=Episode)
+
+human = ObjectType("Human")
+
+droid = ObjectType("Droid")
+
+starship = ObjectType("Starship")
+
+date_time = ScalarType(
+    "DateTime", serializer=serialize_datetime, value_parser=parse_datetime
+)
+
+resolvers = [query, episode, human, droid, starship, date_time]
@@ -0,0 +1,92 @@
+# generated by pasiphae, please do not change manually
+import typing as t
+from datetime import date
+from datetime import datetime
+from datetime import time
+from decimal import Decimal
+from decimal import InvalidOperation
+from functools import lru_cache
+from uuid import UUID
+
+MEMOIZE_SIZE = 4096
+DATETIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+)
+
+Codec = t.Callable[[t.Any], t.Any]
+
+
+def memoized(codec: Codec) -> Codec:
+    """Cache results of codec, for scalars with many repeated values
+
+    Values are keyed by type too, `True` and `1.0` are equal but only one of
+    them is a valid decimal.
+    """
+    return lru_cache(maxsize=MEMOIZE_SIZE, typed=True)(codec)
+
+
+def to_str(value: t.Any) -> str:
+    if not isinstance(value, str):
+        raise ValueError(f"Expected string, got {value!r}")
+    return value
+
+
+def serialize_datetime(value: datetime) -> str:
+    return value.isoformat()
+
+
+def parse_datetime(value: t.Any) -> datetime:
+    value = to_str(value)
+    if value[-1:] in ("Z", "z"):
+        value = f"{value[:-1]}+00:00"
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    # fromisoformat of older pythons accepts only 3 or 6 digit fractions
+    for format_ in DATETIME_FORMATS:
+        try:
+            return datetime.strptime(value, format_)
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid ISO datetime {value!r}")
+
+
+def serialize_date(value: date) -> str:
+    return value.isoformat()
+
+
+def parse_date(value: t.Any) -> date:
+    return date.fromisoformat(to_str(value))
+
+
+def serialize_time(value: time) -> str:
+    return value.isoformat()
+
+
+def parse_time(value: t.Any) -> time:
+    return time.fromisoformat(to_str(value))
+
+
+def serialize_uuid(value: UUID) -> str:
+    return str(value)
+
+
+def parse_uuid(value: t.Any) -> UUID:
+    return UUID(to_str(value))
+
+
+def serialize_decimal(value: Decimal) -> str:
+    return str(value)
+
+
+def parse_decimal(value: t.Any) -> Decimal:
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise ValueError(f"Expected number, got {value!r}")
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        raise ValueError(f"Invalid decimal {value!r}")
@@ -0,0 +1,53 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+from typing import Protocol
+from typing import Sequence
+from typing import Union
+from uuid import UUID
+
+DateTime = datetime
+
+SearchResult = Union["Human", "Droid", "Starship"]
+
+
+class Episode(Enum):
+    NEWHOPE = "NEWHOPE"
+    EMPIRE = "EMPIRE"
+    JEDI = "JEDI"
+
+
+class Character(Protocol):
+    id: UUID
+    name: str
+    appears_in: Sequence["Episode"]
+
+
+@dataclass(frozen=True)
+class Human(Character):
+    id: UUID
+    name: str
+    appears_in: Sequence["Episode"]
+    friends: Sequence["Character"]
+    mass: Optional[Decimal] = None
+
+
+@dataclass(frozen=True)
+class Droid(Character):
+    id: UUID
+    name: str
+    appears_in: Sequence["Episode"]
+    primary_function: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Starship:
+    id: UUID
+    name: str
+    length: Decimal
+    crew: int
+    operational: bool
+    launched_at: "DateTime"
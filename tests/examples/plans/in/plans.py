@@ -0,0 +1,1361 @@
+# generated by pasiphae, please do not change manually
+import asyncio
+import typing as t
+from collections.abc import Mapping
+
+from ariadne.asgi import GraphQL
+from ariadne.exceptions import HttpError
+from ariadne.graphql import handle_query_result
+from graphql import DocumentNode
+from graphql import ExecutionResult
+from graphql import FieldNode
+from graphql import GraphQLError
+from graphql import GraphQLResolveInfo as Info
+from graphql import GraphQLSchema
+from graphql import OperationDefinitionNode
+from graphql import Undefined
+from graphql import located_error
+from graphql import parse
+from graphql import validate
+from graphql.execution.values import get_argument_values
+from graphql.execution.values import get_variable_values
+from graphql.pyutils import Path
+from graphql.pyutils import inspect
+from graphql.pyutils import is_awaitable
+from graphql.pyutils import is_iterable
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+class Errors:
+    """Field errors of execution, without errors below already nulled fields"""
+
+    def __init__(self) -> None:
+        self.errors: t.List[GraphQLError] = []
+        self.nulled: t.Set[t.Optional[Path]] = set()
+
+    def add(self, error: GraphQLError, path: t.Optional[Path]) -> None:
+        position = path
+        while position is not None:
+            if position in self.nulled:
+                return
+            position = position.prev
+        if None in self.nulled:
+            return
+        self.nulled.add(path)
+        self.errors.append(error)
+
+
+class Execution:
+    """State of one execution of a plan"""
+
+    __slots__ = ("root", "variables", "info", "errors")
+
+    def __init__(
+        self, root: t.Any, variables: t.Dict[str, t.Any], info: t.Tuple, errors: Errors
+    ) -> None:
+        self.root = root
+        self.variables = variables
+        # resolve info values which are the same for all fields
+        self.info = info
+        self.errors = errors
+
+
+class Plan:
+    """Known operation with the function executing it"""
+
+    def __init__(
+        self,
+        source: str,
+        document: DocumentNode,
+        execute: t.Callable[[Execution], t.Awaitable[t.Any]],
+    ) -> None:
+        self.source = source
+        self.document = document
+        self.operation = t.cast(OperationDefinitionNode, document.definitions[0])
+        assert self.operation.name is not None
+        self.name = self.operation.name.value
+        self.fragments = {
+            definition.name.value: definition for definition in document.definitions[1:]
+        }
+        self.execute = execute
+
+
+def field_nodes(document: DocumentNode) -> t.List[FieldNode]:
+    """Field nodes of document in order of appearance"""
+    nodes = []
+    pending = list(reversed(document.definitions))
+    while pending:
+        node = pending.pop()
+        if isinstance(node, FieldNode):
+            nodes.append(node)
+        selection_set = getattr(node, "selection_set", None)
+        if selection_set is not None:
+            pending.extend(reversed(selection_set.selections))
+    return nodes
+
+
+def load(source: str) -> t.Tuple[DocumentNode, t.List[FieldNode]]:
+    document = parse(source)
+    return document, field_nodes(document)
+
+
+def field_error(
+    state: Execution,
+    error: Exception,
+    nodes: t.List[FieldNode],
+    path: Path,
+    nullable: bool,
+) -> None:
+    located = located_error(error, nodes, path.as_list())
+    if not nullable:
+        raise located
+    state.errors.add(located, path)
+    return None
+
+
+def leaf_error(type_: t.Any, value: t.Any, serialized: t.Any) -> TypeError:
+    return TypeError(
+        f"Expected `{inspect(type_)}.serialize({inspect(value)})`"
+        f" to return non-nullable value, returned: {inspect(serialized)}"
+    )
+
+
+async def settle(
+    state: Execution,
+    value: t.Awaitable[t.Any],
+    complete: t.Optional[t.Callable[[Execution, t.Any, Path], t.Any]],
+    nodes: t.List[FieldNode],
+    path: Path,
+    nullable: bool,
+) -> t.Any:
+    """Awaited value of field or list item, completed when `complete` is given"""
+    try:
+        result = await value
+        if complete is not None:
+            result = complete(state, result, path)
+            if is_awaitable(result):
+                result = await result
+        return result
+    except Exception as error:
+        return field_error(state, error, nodes, path, nullable)
+
+
+async def gather_values(
+    data: t.Dict[str, t.Any], keys: t.List[str]
+) -> t.Dict[str, t.Any]:
+    data.update(zip(keys, await asyncio.gather(*(data[key] for key in keys))))
+    return data
+
+
+async def gather_items(items: t.List[t.Any], indexes: t.List[int]) -> t.List[t.Any]:
+    values = await asyncio.gather(*(items[index] for index in indexes))
+    for index, value in zip(indexes, values):
+        items[index] = value
+    return items
+
+
+async def run(
+    plan: Plan,
+    schema: GraphQLSchema,
+    variables: t.Optional[t.Dict[str, t.Any]],
+    context: t.Any,
+    root: t.Any,
+) -> ExecutionResult:
+    coerced = get_variable_values(
+        schema, plan.operation.variable_definitions or (), variables or {}
+    )
+    if isinstance(coerced, list):
+        return ExecutionResult(None, coerced)
+    info = (schema, plan.fragments, root, plan.operation, coerced, context)
+    state = Execution(root, coerced, (*info, is_awaitable), Errors())
+    try:
+        data = await plan.execute(state)
+    except GraphQLError as error:
+        state.errors.add(error, None)
+        data = None
+    errors = state.errors.errors
+    if not errors:
+        return ExecutionResult(data, None)
+    errors.sort(
+        key=lambda error: (error.locations or [], error.path or [], error.message)
+    )
+    return ExecutionResult(data, errors)
+
+
+class PlansGraphQL(GraphQL):
+    """GraphQL app executing known operations with plans compiled by pasiphae
+
+    Operations are found by their query text, or by their name sent as `id`
+    without query.
+    They are not parsed or validated again and their resolvers are called
+    directly, without graphql-core executor, only custom validation rules are
+    checked. Other operations, operations failing the rules and all operations
+    of apps with extensions or middleware are executed as usual.
+    """
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.plans = {}
+        self.queries = {}
+        for build in PLANS:
+            plan = build(self.schema)
+            self.plans[plan.name] = plan
+            self.queries[" ".join(plan.source.split())] = plan
+
+    async def extract_data_from_request(self, request: Request) -> t.Any:
+        data = await super().extract_data_from_request(request)
+        # operations sent by id are executed as usual when plan is not used
+        if isinstance(data, dict) and isinstance(data.get("id"), str):
+            plan = self.plans.get(data["id"])
+            if plan is not None and "query" not in data:
+                data = {**data, "query": plan.source}
+        return data
+
+    def find_plan(self, data: t.Any) -> t.Optional[Plan]:
+        if not isinstance(data, dict):
+            return None
+        if not isinstance(data.get("variables") or {}, dict):
+            return None
+        plan = None
+        id_ = data.get("id")
+        if isinstance(data.get("query"), str):
+            plan = self.queries.get(" ".join(data["query"].split()))
+            # query sent with id has to be the operation of that id
+            if plan is not None and id_ is not None and id_ != plan.name:
+                return None
+        elif isinstance(id_, str):
+            plan = self.plans.get(id_)
+        if plan is None or data.get("operationName") not in (None, plan.name):
+            return None
+        return plan
+
+    async def graphql_http_server(self, request: Request) -> Response:
+        if self.extensions or self.middleware:
+            return await super().graphql_http_server(request)
+        try:
+            data = await self.extract_data_from_request(request)
+        except HttpError:
+            return await super().graphql_http_server(request)
+        plan = self.find_plan(data)
+        if plan is None:
+            # request body is cached, it is not read again
+            return await super().graphql_http_server(request)
+        context_value = await self.get_context_for_request(request)
+        validation_rules = self.validation_rules
+        if callable(validation_rules):
+            validation_rules = validation_rules(context_value, plan.document, data)
+        # custom rules, like depth or cost limits, are checked on every request
+        if validation_rules and validate(self.schema, plan.document, validation_rules):
+            return await super().graphql_http_server(request)
+        root_value = self.root_value
+        if callable(root_value):
+            root_value = root_value(context_value, plan.document)
+            if is_awaitable(root_value):
+                root_value = await root_value
+        result = await run(
+            plan, self.schema, data.get("variables"), context_value, root_value
+        )
+        success, response = handle_query_result(
+            result,
+            logger=self.logger,
+            error_formatter=self.error_formatter,
+            debug=self.debug,
+        )
+        return await self.create_json_response(request, response, success)
+
+
+GET_USER = """
+query GetUser($id: ID!) {
+  user(id: $id) {
+    ...UserFields
+    friends(first: 2) {
+      id
+      name
+    }
+    posts {
+      title
+      tags
+      author {
+        name
+      }
+    }
+  }
+}
+
+fragment UserFields on User {
+  id
+  name
+  status
+}
+"""
+
+
+def build_get_user(schema: GraphQLSchema) -> Plan:
+    document, fields = load(GET_USER)
+    types = schema.type_map
+    field_1 = types["Query"].fields["user"]
+    nodes_1 = [fields[0]]
+    resolve_1 = field_1.resolve
+    info_1 = ("user", nodes_1, field_1.type, types["Query"])
+    field_4 = types["User"].fields["id"]
+    nodes_4 = [fields[9]]
+    resolve_4 = field_4.resolve
+    info_4 = ("id", nodes_4, field_4.type, types["User"])
+    serialize_ID = types["ID"].serialize
+    field_6 = types["User"].fields["name"]
+    nodes_6 = [fields[10]]
+    resolve_6 = field_6.resolve
+    info_6 = ("name", nodes_6, field_6.type, types["User"])
+    serialize_String = types["String"].serialize
+    field_8 = types["User"].fields["status"]
+    nodes_8 = [fields[11]]
+    resolve_8 = field_8.resolve
+    info_8 = ("status", nodes_8, field_8.type, types["User"])
+    serialize_Status = types["Status"].serialize
+    field_10 = types["User"].fields["friends"]
+    nodes_10 = [fields[1]]
+    resolve_10 = field_10.resolve
+    info_10 = ("friends", nodes_10, field_10.type, types["User"])
+    args_10 = get_argument_values(field_10, nodes_10[0], {})
+    field_14 = types["User"].fields["id"]
+    nodes_14 = [fields[2]]
+    resolve_14 = field_14.resolve
+    info_14 = ("id", nodes_14, field_14.type, types["User"])
+    field_15 = types["User"].fields["name"]
+    nodes_15 = [fields[3]]
+    resolve_15 = field_15.resolve
+    info_15 = ("name", nodes_15, field_15.type, types["User"])
+    field_16 = types["User"].fields["posts"]
+    nodes_16 = [fields[4]]
+    resolve_16 = field_16.resolve
+    info_16 = ("posts", nodes_16, field_16.type, types["User"])
+    field_20 = types["Post"].fields["title"]
+    nodes_20 = [fields[5]]
+    resolve_20 = field_20.resolve
+    info_20 = ("title", nodes_20, field_20.type, types["Post"])
+    field_22 = types["Post"].fields["tags"]
+    nodes_22 = [fields[6]]
+    resolve_22 = field_22.resolve
+    info_22 = ("tags", nodes_22, field_22.type, types["Post"])
+    field_25 = types["Post"].fields["author"]
+    nodes_25 = [fields[7]]
+    resolve_25 = field_25.resolve
+    info_25 = ("author", nodes_25, field_25.type, types["Post"])
+    field_28 = types["User"].fields["name"]
+    nodes_28 = [fields[8]]
+    resolve_28 = field_28.resolve
+    info_28 = ("name", nodes_28, field_28.type, types["User"])
+
+    def complete_5(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            raise TypeError("Cannot return null for non-nullable field User.id.")
+        serialized = serialize_ID(value)
+        if serialized is None or serialized is Undefined:
+            raise leaf_error(types["ID"], value, serialized)
+        return serialized
+
+    def complete_7(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            raise TypeError("Cannot return null for non-nullable field User.name.")
+        serialized = serialize_String(value)
+        if serialized is None or serialized is Undefined:
+            raise leaf_error(types["String"], value, serialized)
+        return serialized
+
+    def complete_9(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            raise TypeError("Cannot return null for non-nullable field User.status.")
+        serialized = serialize_Status(value)
+        if serialized is None or serialized is Undefined:
+            raise leaf_error(types["Status"], value, serialized)
+        return serialized
+
+    def object_13(state: Execution, parent: t.Any, path: t.Optional[Path]) -> t.Any:
+        data: t.Dict[str, t.Any] = {}
+        pending: t.List[str] = []
+        try:
+            if resolve_14 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("id")
+                else:
+                    value = getattr(parent, "id", None)
+                if callable(value):
+                    value = value(Info(*info_14, Path(path, "id", "User"), *state.info))
+            else:
+                value = resolve_14(
+                    parent, Info(*info_14, Path(path, "id", "User"), *state.info)
+                )
+            if is_awaitable(value):
+                value = settle(
+                    state, value, complete_5, nodes_14, Path(path, "id", "User"), False
+                )
+            else:
+                if isinstance(value, Exception):
+                    raise value
+                if value is None or value is Undefined:
+                    raise TypeError(
+                        "Cannot return null for non-nullable field User.id."
+                    )
+                else:
+                    serialized = serialize_ID(value)
+                    if serialized is None or serialized is Undefined:
+                        raise leaf_error(types["ID"], value, serialized)
+                    value = serialized
+        except Exception as error:
+            value = field_error(state, error, nodes_14, Path(path, "id", "User"), False)
+        if is_awaitable(value):
+            pending.append("id")
+        data["id"] = value
+        try:
+            if resolve_15 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("name")
+                else:
+                    value = getattr(parent, "name", None)
+                if callable(value):
+                    value = value(
+                        Info(*info_15, Path(path, "name", "User"), *state.info)
+                    )
+            else:
+                value = resolve_15(
+                    parent, Info(*info_15, Path(path, "name", "User"), *state.info)
+                )
+            if is_awaitable(value):
+                value = settle(
+                    state,
+                    value,
+                    complete_7,
+                    nodes_15,
+                    Path(path, "name", "User"),
+                    False,
+                )
+            else:
+                if isinstance(value, Exception):
+                    raise value
+                if value is None or value is Undefined:
+                    raise TypeError(
+                        "Cannot return null for non-nullable field User.name."
+                    )
+                else:
+                    serialized = serialize_String(value)
+                    if serialized is None or serialized is Undefined:
+                        raise leaf_error(types["String"], value, serialized)
+                    value = serialized
+        except Exception as error:
+            value = field_error(
+                state, error, nodes_15, Path(path, "name", "User"), False
+            )
+        if is_awaitable(value):
+            pending.append("name")
+        data["name"] = value
+        return gather_values(data, pending) if pending else data
+
+    def complete_12(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            raise TypeError("Cannot return null for non-nullable field User.friends.")
+        return object_13(state, value, path)
+
+    def complete_11(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            raise TypeError("Cannot return null for non-nullable field User.friends.")
+        if not is_iterable(value):
+            raise GraphQLError(
+                "Expected Iterable, but did not find one for field 'User.friends'."
+            )
+        items = []
+        pending = []
+        for index, item in enumerate(value):
+            item_path = Path(path, index, None)
+            try:
+                if is_awaitable(item):
+                    item = settle(state, item, complete_12, nodes_10, item_path, False)
+                else:
+                    item = complete_12(state, item, item_path)
+                    if is_awaitable(item):
+                        item = settle(state, item, None, nodes_10, item_path, False)
+            except Exception as error:
+                item = field_error(state, error, nodes_10, item_path, False)
+            if is_awaitable(item):
+                pending.append(index)
+            items.append(item)
+        return gather_items(items, pending) if pending else items
+
+    def complete_21(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            raise TypeError("Cannot return null for non-nullable field Post.title.")
+        serialized = serialize_String(value)
+        if serialized is None or serialized is Undefined:
+            raise leaf_error(types["String"], value, serialized)
+        return serialized
+
+    def complete_24(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            raise TypeError("Cannot return null for non-nullable field Post.tags.")
+        serialized = serialize_String(value)
+        if serialized is None or serialized is Undefined:
+            raise leaf_error(types["String"], value, serialized)
+        return serialized
+
+    def complete_23(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            return None
+        if not is_iterable(value):
+            raise GraphQLError(
+                "Expected Iterable, but did not find one for field 'Post.tags'."
+            )
+        items = []
+        pending = []
+        for index, item in enumerate(value):
+            item_path = Path(path, index, None)
+            try:
+                if is_awaitable(item):
+                    item = settle(state, item, complete_24, nodes_22, item_path, False)
+                else:
+                    item = complete_24(state, item, item_path)
+                    if is_awaitable(item):
+                        item = settle(state, item, None, nodes_22, item_path, False)
+            except Exception as error:
+                item = field_error(state, error, nodes_22, item_path, False)
+            if is_awaitable(item):
+                pending.append(index)
+            items.append(item)
+        return gather_items(items, pending) if pending else items
+
+    def object_27(state: Execution, parent: t.Any, path: t.Optional[Path]) -> t.Any:
+        data: t.Dict[str, t.Any] = {}
+        pending: t.List[str] = []
+        try:
+            if resolve_28 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("name")
+                else:
+                    value = getattr(parent, "name", None)
+                if callable(value):
+                    value = value(
+                        Info(*info_28, Path(path, "name", "User"), *state.info)
+                    )
+            else:
+                value = resolve_28(
+                    parent, Info(*info_28, Path(path, "name", "User"), *state.info)
+                )
+            if is_awaitable(value):
+                value = settle(
+                    state,
+                    value,
+                    complete_7,
+                    nodes_28,
+                    Path(path, "name", "User"),
+                    False,
+                )
+            else:
+                if isinstance(value, Exception):
+                    raise value
+                if value is None or value is Undefined:
+                    raise TypeError(
+                        "Cannot return null for non-nullable field User.name."
+                    )
+                else:
+                    serialized = serialize_String(value)
+                    if serialized is None or serialized is Undefined:
+                        raise leaf_error(types["String"], value, serialized)
+                    value = serialized
+        except Exception as error:
+            value = field_error(
+                state, error, nodes_28, Path(path, "name", "User"), False
+            )
+        if is_awaitable(value):
+            pending.append("name")
+        data["name"] = value
+        return gather_values(data, pending) if pending else data
+
+    def complete_26(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            raise TypeError("Cannot return null for non-nullable field Post.author.")
+        return object_27(state, value, path)
+
+    def object_19(state: Execution, parent: t.Any, path: t.Optional[Path]) -> t.Any:
+        data: t.Dict[str, t.Any] = {}
+        pending: t.List[str] = []
+        try:
+            if resolve_20 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("title")
+                else:
+                    value = getattr(parent, "title", None)
+                if callable(value):
+                    value = value(
+                        Info(*info_20, Path(path, "title", "Post"), *state.info)
+                    )
+            else:
+                value = resolve_20(
+                    parent, Info(*info_20, Path(path, "title", "Post"), *state.info)
+                )
+            if is_awaitable(value):
+                value = settle(
+                    state,
+                    value,
+                    complete_21,
+                    nodes_20,
+                    Path(path, "title", "Post"),
+                    False,
+                )
+            else:
+                if isinstance(value, Exception):
+                    raise value
+                if value is None or value is Undefined:
+                    raise TypeError(
+                        "Cannot return null for non-nullable field Post.title."
+                    )
+                else:
+                    serialized = serialize_String(value)
+                    if serialized is None or serialized is Undefined:
+                        raise leaf_error(types["String"], value, serialized)
+                    value = serialized
+        except Exception as error:
+            value = field_error(
+                state, error, nodes_20, Path(path, "title", "Post"), False
+            )
+        if is_awaitable(value):
+            pending.append("title")
+        data["title"] = value
+        field_path = Path(path, "tags", "Post")
+        try:
+            if resolve_22 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("tags")
+                else:
+                    value = getattr(parent, "tags", None)
+                if callable(value):
+                    value = value(Info(*info_22, field_path, *state.info))
+            else:
+                value = resolve_22(parent, Info(*info_22, field_path, *state.info))
+            if is_awaitable(value):
+                value = settle(state, value, complete_23, nodes_22, field_path, True)
+            else:
+                value = complete_23(state, value, field_path)
+                if is_awaitable(value):
+                    value = settle(state, value, None, nodes_22, field_path, True)
+        except Exception as error:
+            value = field_error(state, error, nodes_22, field_path, True)
+        if is_awaitable(value):
+            pending.append("tags")
+        data["tags"] = value
+        field_path = Path(path, "author", "Post")
+        try:
+            if resolve_25 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("author")
+                else:
+                    value = getattr(parent, "author", None)
+                if callable(value):
+                    value = value(Info(*info_25, field_path, *state.info))
+            else:
+                value = resolve_25(parent, Info(*info_25, field_path, *state.info))
+            if is_awaitable(value):
+                value = settle(state, value, complete_26, nodes_25, field_path, False)
+            else:
+                value = complete_26(state, value, field_path)
+                if is_awaitable(value):
+                    value = settle(state, value, None, nodes_25, field_path, False)
+        except Exception as error:
+            value = field_error(state, error, nodes_25, field_path, False)
+        if is_awaitable(value):
+            pending.append("author")
+        data["author"] = value
+        return gather_values(data, pending) if pending else data
+
+    def complete_18(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            return None
+        return object_19(state, value, path)
+
+    def complete_17(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            return None
+        if not is_iterable(value):
+            raise GraphQLError(
+                "Expected Iterable, but did not find one for field 'User.posts'."
+            )
+        items = []
+        pending = []
+        for index, item in enumerate(value):
+            item_path = Path(path, index, None)
+            try:
+                if is_awaitable(item):
+                    item = settle(state, item, complete_18, nodes_16, item_path, True)
+                else:
+                    item = complete_18(state, item, item_path)
+                    if is_awaitable(item):
+                        item = settle(state, item, None, nodes_16, item_path, True)
+            except Exception as error:
+                item = field_error(state, error, nodes_16, item_path, True)
+            if is_awaitable(item):
+                pending.append(index)
+            items.append(item)
+        return gather_items(items, pending) if pending else items
+
+    def object_3(state: Execution, parent: t.Any, path: t.Optional[Path]) -> t.Any:
+        data: t.Dict[str, t.Any] = {}
+        pending: t.List[str] = []
+        try:
+            if resolve_4 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("id")
+                else:
+                    value = getattr(parent, "id", None)
+                if callable(value):
+                    value = value(Info(*info_4, Path(path, "id", "User"), *state.info))
+            else:
+                value = resolve_4(
+                    parent, Info(*info_4, Path(path, "id", "User"), *state.info)
+                )
+            if is_awaitable(value):
+                value = settle(
+                    state, value, complete_5, nodes_4, Path(path, "id", "User"), False
+                )
+            else:
+                if isinstance(value, Exception):
+                    raise value
+                if value is None or value is Undefined:
+                    raise TypeError(
+                        "Cannot return null for non-nullable field User.id."
+                    )
+                else:
+                    serialized = serialize_ID(value)
+                    if serialized is None or serialized is Undefined:
+                        raise leaf_error(types["ID"], value, serialized)
+                    value = serialized
+        except Exception as error:
+            value = field_error(state, error, nodes_4, Path(path, "id", "User"), False)
+        if is_awaitable(value):
+            pending.append("id")
+        data["id"] = value
+        try:
+            if resolve_6 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("name")
+                else:
+                    value = getattr(parent, "name", None)
+                if callable(value):
+                    value = value(
+                        Info(*info_6, Path(path, "name", "User"), *state.info)
+                    )
+            else:
+                value = resolve_6(
+                    parent, Info(*info_6, Path(path, "name", "User"), *state.info)
+                )
+            if is_awaitable(value):
+                value = settle(
+                    state, value, complete_7, nodes_6, Path(path, "name", "User"), False
+                )
+            else:
+                if isinstance(value, Exception):
+                    raise value
+                if value is None or value is Undefined:
+                    raise TypeError(
+                        "Cannot return null for non-nullable field User.name."
+                    )
+                else:
+                    serialized = serialize_String(value)
+                    if serialized is None or serialized is Undefined:
+                        raise leaf_error(types["String"], value, serialized)
+                    value = serialized
+        except Exception as error:
+            value = field_error(
+                state, error, nodes_6, Path(path, "name", "User"), False
+            )
+        if is_awaitable(value):
+            pending.append("name")
+        data["name"] = value
+        try:
+            if resolve_8 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("status")
+                else:
+                    value = getattr(parent, "status", None)
+                if callable(value):
+                    value = value(
+                        Info(*info_8, Path(path, "status", "User"), *state.info)
+                    )
+            else:
+                value = resolve_8(
+                    parent, Info(*info_8, Path(path, "status", "User"), *state.info)
+                )
+            if is_awaitable(value):
+                value = settle(
+                    state,
+                    value,
+                    complete_9,
+                    nodes_8,
+                    Path(path, "status", "User"),
+                    False,
+                )
+            else:
+                if isinstance(value, Exception):
+                    raise value
+                if value is None or value is Undefined:
+                    raise TypeError(
+                        "Cannot return null for non-nullable field User.status."
+                    )
+                else:
+                    serialized = serialize_Status(value)
+                    if serialized is None or serialized is Undefined:
+                        raise leaf_error(types["Status"], value, serialized)
+                    value = serialized
+        except Exception as error:
+            value = field_error(
+                state, error, nodes_8, Path(path, "status", "User"), False
+            )
+        if is_awaitable(value):
+            pending.append("status")
+        data["status"] = value
+        field_path = Path(path, "friends", "User")
+        try:
+            if resolve_10 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("friends")
+                else:
+                    value = getattr(parent, "friends", None)
+                if callable(value):
+                    value = value(Info(*info_10, field_path, *state.info), **args_10)
+            else:
+                value = resolve_10(
+                    parent, Info(*info_10, field_path, *state.info), **args_10
+                )
+            if is_awaitable(value):
+                value = settle(state, value, complete_11, nodes_10, field_path, False)
+            else:
+                value = complete_11(state, value, field_path)
+                if is_awaitable(value):
+                    value = settle(state, value, None, nodes_10, field_path, False)
+        except Exception as error:
+            value = field_error(state, error, nodes_10, field_path, False)
+        if is_awaitable(value):
+            pending.append("friends")
+        data["friends"] = value
+        field_path = Path(path, "posts", "User")
+        try:
+            if resolve_16 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("posts")
+                else:
+                    value = getattr(parent, "posts", None)
+                if callable(value):
+                    value = value(Info(*info_16, field_path, *state.info))
+            else:
+                value = resolve_16(parent, Info(*info_16, field_path, *state.info))
+            if is_awaitable(value):
+                value = settle(state, value, complete_17, nodes_16, field_path, True)
+            else:
+                value = complete_17(state, value, field_path)
+                if is_awaitable(value):
+                    value = settle(state, value, None, nodes_16, field_path, True)
+        except Exception as error:
+            value = field_error(state, error, nodes_16, field_path, True)
+        if is_awaitable(value):
+            pending.append("posts")
+        data["posts"] = value
+        return gather_values(data, pending) if pending else data
+
+    def complete_2(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            return None
+        return object_3(state, value, path)
+
+    def object_0(state: Execution, parent: t.Any, path: t.Optional[Path]) -> t.Any:
+        data: t.Dict[str, t.Any] = {}
+        pending: t.List[str] = []
+        field_path = Path(path, "user", "Query")
+        try:
+            if resolve_1 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("user")
+                else:
+                    value = getattr(parent, "user", None)
+                if callable(value):
+                    value = value(
+                        Info(*info_1, field_path, *state.info),
+                        **get_argument_values(field_1, nodes_1[0], state.variables),
+                    )
+            else:
+                value = resolve_1(
+                    parent,
+                    Info(*info_1, field_path, *state.info),
+                    **get_argument_values(field_1, nodes_1[0], state.variables),
+                )
+            if is_awaitable(value):
+                value = settle(state, value, complete_2, nodes_1, field_path, True)
+            else:
+                value = complete_2(state, value, field_path)
+                if is_awaitable(value):
+                    value = settle(state, value, None, nodes_1, field_path, True)
+        except Exception as error:
+            value = field_error(state, error, nodes_1, field_path, True)
+        if is_awaitable(value):
+            pending.append("user")
+        data["user"] = value
+        return gather_values(data, pending) if pending else data
+
+    async def execute(state: Execution) -> t.Any:
+        data = object_0(state, state.root, None)
+        return await data if is_awaitable(data) else data
+
+    return Plan(GET_USER, document, execute)
+
+
+LIST_USERS = """
+query ListUsers($ids: [ID!]!) {
+  users(ids: $ids) {
+    __typename
+    id
+    status
+    joined
+  }
+}
+"""
+
+
+def build_list_users(schema: GraphQLSchema) -> Plan:
+    document, fields = load(LIST_USERS)
+    types = schema.type_map
+    field_1 = types["Query"].fields["users"]
+    nodes_1 = [fields[0]]
+    resolve_1 = field_1.resolve
+    info_1 = ("users", nodes_1, field_1.type, types["Query"])
+    field_5 = types["User"].fields["id"]
+    nodes_5 = [fields[2]]
+    resolve_5 = field_5.resolve
+    info_5 = ("id", nodes_5, field_5.type, types["User"])
+    serialize_ID = types["ID"].serialize
+    field_7 = types["User"].fields["status"]
+    nodes_7 = [fields[3]]
+    resolve_7 = field_7.resolve
+    info_7 = ("status", nodes_7, field_7.type, types["User"])
+    serialize_Status = types["Status"].serialize
+    field_9 = types["User"].fields["joined"]
+    nodes_9 = [fields[4]]
+    resolve_9 = field_9.resolve
+    info_9 = ("joined", nodes_9, field_9.type, types["User"])
+    serialize_DateTime = types["DateTime"].serialize
+
+    def complete_6(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            raise TypeError("Cannot return null for non-nullable field User.id.")
+        serialized = serialize_ID(value)
+        if serialized is None or serialized is Undefined:
+            raise leaf_error(types["ID"], value, serialized)
+        return serialized
+
+    def complete_8(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            raise TypeError("Cannot return null for non-nullable field User.status.")
+        serialized = serialize_Status(value)
+        if serialized is None or serialized is Undefined:
+            raise leaf_error(types["Status"], value, serialized)
+        return serialized
+
+    def complete_10(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            return None
+        serialized = serialize_DateTime(value)
+        if serialized is None or serialized is Undefined:
+            raise leaf_error(types["DateTime"], value, serialized)
+        return serialized
+
+    def object_4(state: Execution, parent: t.Any, path: t.Optional[Path]) -> t.Any:
+        data: t.Dict[str, t.Any] = {}
+        pending: t.List[str] = []
+        data["__typename"] = "User"
+        try:
+            if resolve_5 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("id")
+                else:
+                    value = getattr(parent, "id", None)
+                if callable(value):
+                    value = value(Info(*info_5, Path(path, "id", "User"), *state.info))
+            else:
+                value = resolve_5(
+                    parent, Info(*info_5, Path(path, "id", "User"), *state.info)
+                )
+            if is_awaitable(value):
+                value = settle(
+                    state, value, complete_6, nodes_5, Path(path, "id", "User"), False
+                )
+            else:
+                if isinstance(value, Exception):
+                    raise value
+                if value is None or value is Undefined:
+                    raise TypeError(
+                        "Cannot return null for non-nullable field User.id."
+                    )
+                else:
+                    serialized = serialize_ID(value)
+                    if serialized is None or serialized is Undefined:
+                        raise leaf_error(types["ID"], value, serialized)
+                    value = serialized
+        except Exception as error:
+            value = field_error(state, error, nodes_5, Path(path, "id", "User"), False)
+        if is_awaitable(value):
+            pending.append("id")
+        data["id"] = value
+        try:
+            if resolve_7 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("status")
+                else:
+                    value = getattr(parent, "status", None)
+                if callable(value):
+                    value = value(
+                        Info(*info_7, Path(path, "status", "User"), *state.info)
+                    )
+            else:
+                value = resolve_7(
+                    parent, Info(*info_7, Path(path, "status", "User"), *state.info)
+                )
+            if is_awaitable(value):
+                value = settle(
+                    state,
+                    value,
+                    complete_8,
+                    nodes_7,
+                    Path(path, "status", "User"),
+                    False,
+                )
+            else:
+                if isinstance(value, Exception):
+                    raise value
+                if value is None or value is Undefined:
+                    raise TypeError(
+                        "Cannot return null for non-nullable field User.status."
+                    )
+                else:
+                    serialized = serialize_Status(value)
+                    if serialized is None or serialized is Undefined:
+                        raise leaf_error(types["Status"], value, serialized)
+                    value = serialized
+        except Exception as error:
+            value = field_error(
+                state, error, nodes_7, Path(path, "status", "User"), False
+            )
+        if is_awaitable(value):
+            pending.append("status")
+        data["status"] = value
+        try:
+            if resolve_9 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("joined")
+                else:
+                    value = getattr(parent, "joined", None)
+                if callable(value):
+                    value = value(
+                        Info(*info_9, Path(path, "joined", "User"), *state.info)
+                    )
+            else:
+                value = resolve_9(
+                    parent, Info(*info_9, Path(path, "joined", "User"), *state.info)
+                )
+            if is_awaitable(value):
+                value = settle(
+                    state,
+                    value,
+                    complete_10,
+                    nodes_9,
+                    Path(path, "joined", "User"),
+                    True,
+                )
+            else:
+                if isinstance(value, Exception):
+                    raise value
+                if value is None or value is Undefined:
+                    value = None
+                else:
+                    serialized = serialize_DateTime(value)
+                    if serialized is None or serialized is Undefined:
+                        raise leaf_error(types["DateTime"], value, serialized)
+                    value = serialized
+        except Exception as error:
+            value = field_error(
+                state, error, nodes_9, Path(path, "joined", "User"), True
+            )
+        if is_awaitable(value):
+            pending.append("joined")
+        data["joined"] = value
+        return gather_values(data, pending) if pending else data
+
+    def complete_3(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            return None
+        return object_4(state, value, path)
+
+    def complete_2(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            raise TypeError("Cannot return null for non-nullable field Query.users.")
+        if not is_iterable(value):
+            raise GraphQLError(
+                "Expected Iterable, but did not find one for field 'Query.users'."
+            )
+        items = []
+        pending = []
+        for index, item in enumerate(value):
+            item_path = Path(path, index, None)
+            try:
+                if is_awaitable(item):
+                    item = settle(state, item, complete_3, nodes_1, item_path, True)
+                else:
+                    item = complete_3(state, item, item_path)
+                    if is_awaitable(item):
+                        item = settle(state, item, None, nodes_1, item_path, True)
+            except Exception as error:
+                item = field_error(state, error, nodes_1, item_path, True)
+            if is_awaitable(item):
+                pending.append(index)
+            items.append(item)
+        return gather_items(items, pending) if pending else items
+
+    def object_0(state: Execution, parent: t.Any, path: t.Optional[Path]) -> t.Any:
+        data: t.Dict[str, t.Any] = {}
+        pending: t.List[str] = []
+        field_path = Path(path, "users", "Query")
+        try:
+            if resolve_1 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("users")
+                else:
+                    value = getattr(parent, "users", None)
+                if callable(value):
+                    value = value(
+                        Info(*info_1, field_path, *state.info),
+                        **get_argument_values(field_1, nodes_1[0], state.variables),
+                    )
+            else:
+                value = resolve_1(
+                    parent,
+                    Info(*info_1, field_path, *state.info),
+                    **get_argument_values(field_1, nodes_1[0], state.variables),
+                )
+            if is_awaitable(value):
+                value = settle(state, value, complete_2, nodes_1, field_path, False)
+            else:
+                value = complete_2(state, value, field_path)
+                if is_awaitable(value):
+                    value = settle(state, value, None, nodes_1, field_path, False)
+        except Exception as error:
+            value = field_error(state, error, nodes_1, field_path, False)
+        if is_awaitable(value):
+            pending.append("users")
+        data["users"] = value
+        return gather_values(data, pending) if pending else data
+
+    async def execute(state: Execution) -> t.Any:
+        data = object_0(state, state.root, None)
+        return await data if is_awaitable(data) else data
+
+    return Plan(LIST_USERS, document, execute)
+
+
+RENAME = """
+mutation Rename($id: ID!, $name: String!) {
+  renamed: rename(id: $id, name: $name) {
+    id
+    name
+  }
+}
+"""
+
+
+def build_rename(schema: GraphQLSchema) -> Plan:
+    document, fields = load(RENAME)
+    types = schema.type_map
+    field_0 = types["Mutation"].fields["rename"]
+    nodes_0 = [fields[0]]
+    resolve_0 = field_0.resolve
+    info_0 = ("rename", nodes_0, field_0.type, types["Mutation"])
+    field_3 = types["User"].fields["id"]
+    nodes_3 = [fields[1]]
+    resolve_3 = field_3.resolve
+    info_3 = ("id", nodes_3, field_3.type, types["User"])
+    serialize_ID = types["ID"].serialize
+    field_5 = types["User"].fields["name"]
+    nodes_5 = [fields[2]]
+    resolve_5 = field_5.resolve
+    info_5 = ("name", nodes_5, field_5.type, types["User"])
+    serialize_String = types["String"].serialize
+
+    def complete_4(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            raise TypeError("Cannot return null for non-nullable field User.id.")
+        serialized = serialize_ID(value)
+        if serialized is None or serialized is Undefined:
+            raise leaf_error(types["ID"], value, serialized)
+        return serialized
+
+    def complete_6(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            raise TypeError("Cannot return null for non-nullable field User.name.")
+        serialized = serialize_String(value)
+        if serialized is None or serialized is Undefined:
+            raise leaf_error(types["String"], value, serialized)
+        return serialized
+
+    def object_2(state: Execution, parent: t.Any, path: t.Optional[Path]) -> t.Any:
+        data: t.Dict[str, t.Any] = {}
+        pending: t.List[str] = []
+        try:
+            if resolve_3 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("id")
+                else:
+                    value = getattr(parent, "id", None)
+                if callable(value):
+                    value = value(Info(*info_3, Path(path, "id", "User"), *state.info))
+            else:
+                value = resolve_3(
+                    parent, Info(*info_3, Path(path, "id", "User"), *state.info)
+                )
+            if is_awaitable(value):
+                value = settle(
+                    state, value, complete_4, nodes_3, Path(path, "id", "User"), False
+                )
+            else:
+                if isinstance(value, Exception):
+                    raise value
+                if value is None or value is Undefined:
+                    raise TypeError(
+                        "Cannot return null for non-nullable field User.id."
+                    )
+                else:
+                    serialized = serialize_ID(value)
+                    if serialized is None or serialized is Undefined:
+                        raise leaf_error(types["ID"], value, serialized)
+                    value = serialized
+        except Exception as error:
+            value = field_error(state, error, nodes_3, Path(path, "id", "User"), False)
+        if is_awaitable(value):
+            pending.append("id")
+        data["id"] = value
+        try:
+            if resolve_5 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("name")
+                else:
+                    value = getattr(parent, "name", None)
+                if callable(value):
+                    value = value(
+                        Info(*info_5, Path(path, "name", "User"), *state.info)
+                    )
+            else:
+                value = resolve_5(
+                    parent, Info(*info_5, Path(path, "name", "User"), *state.info)
+                )
+            if is_awaitable(value):
+                value = settle(
+                    state, value, complete_6, nodes_5, Path(path, "name", "User"), False
+                )
+            else:
+                if isinstance(value, Exception):
+                    raise value
+                if value is None or value is Undefined:
+                    raise TypeError(
+                        "Cannot return null for non-nullable field User.name."
+                    )
+                else:
+                    serialized = serialize_String(value)
+                    if serialized is None or serialized is Undefined:
+                        raise leaf_error(types["String"], value, serialized)
+                    value = serialized
+        except Exception as error:
+            value = field_error(
+                state, error, nodes_5, Path(path, "name", "User"), False
+            )
+        if is_awaitable(value):
+            pending.append("name")
+        data["name"] = value
+        return gather_values(data, pending) if pending else data
+
+    def complete_1(state: Execution, value: t.Any, path: Path) -> t.Any:
+        if isinstance(value, Exception):
+            raise value
+        if value is None or value is Undefined:
+            raise TypeError(
+                "Cannot return null for non-nullable field Mutation.rename."
+            )
+        return object_2(state, value, path)
+
+    async def execute(state: Execution) -> t.Any:
+        parent, path = state.root, None
+        data: t.Dict[str, t.Any] = {}
+        field_path = Path(path, "renamed", "Mutation")
+        try:
+            if resolve_0 is None:
+                if isinstance(parent, Mapping):
+                    value = parent.get("rename")
+                else:
+                    value = getattr(parent, "rename", None)
+                if callable(value):
+                    value = value(
+                        Info(*info_0, field_path, *state.info),
+                        **get_argument_values(field_0, nodes_0[0], state.variables),
+                    )
+            else:
+                value = resolve_0(
+                    parent,
+                    Info(*info_0, field_path, *state.info),
+                    **get_argument_values(field_0, nodes_0[0], state.variables),
+                )
+            if is_awaitable(value):
+                value = settle(state, value, complete_1, nodes_0, field_path, False)
+            else:
+                value = complete_1(state, value, field_path)
+                if is_awaitable(value):
+                    value = settle(state, value, None, nodes_0, field_path, False)
+        except Exception as error:
+            value = field_error(state, error, nodes_0, field_path, False)
+        if is_awaitable(value):
+            value = await value
+        data["renamed"] = value
+        return data
+
+    return Plan(RENAME, document, execute)
+
+
+PLANS = [build_get_user, build_list_users, build_rename]
@@ -0,0 +1,68 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from typing import Optional
+from typing import Sequence
+from uuid import UUID
+
+from ariadne import EnumType
+from ariadne import MutationType
+from ariadne import ObjectType
+from ariadne import QueryType
+from ariadne import ScalarType
+from graphql import GraphQLResolveInfo
+
+from .scalar_codecs import parse_datetime
+from .scalar_codecs import serialize_datetime
+from .types import Node
+from .types import Status
+from .types import User
+
+date_time = ScalarType(
+    "DateTime", serializer=serialize_datetime, value_parser=parse_datetime
+)
+
+status = EnumType("Status", values=Status)
+
+user = ObjectType("User")
+
+
+@user.field("friends")
+def resolve_user_friends(
+    user_: User, info: GraphQLResolveInfo, first: Optional[int]
+) -> Sequence[User]:
+    ...
+
+
+post = ObjectType("Post")
+
+query = QueryType()
+
+
+@query.field("user")
+def resolve_query_user(_: None, info: GraphQLResolveInfo, id: UUID) -> Optional[User]:
+    ...
+
+
+@query.field("users")
+def resolve_query_users(
+    _: None, info: GraphQLResolveInfo, ids: Sequence[UUID]
+) -> Sequence[Optional[User]]:
+    ...
+
+
+@query.field("node")
+def resolve_query_node(_: None, info: GraphQLResolveInfo, id: UUID) -> Optional[Node]:
+    ...
+
+
+mutation = MutationType()
+
+
+@mutation.field("rename")
+def resolve_mutation_rename(
+    _: None, info: GraphQLResolveInfo, id: UUID, name: str
+) -> User:
+    ...
+
+
+resolvers = [date_time, status, user, post, query, mutation]
@@ -0,0 +1,36 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from typing import Protocol
+from typing import Sequence
+from uuid import UUID
+
+DateTime = datetime
+
+
+class Status(Enum):
+    ACTIVE = "ACTIVE"
+    BANNED = "BANNED"
+
+
+class Node(Protocol):
+    id: UUID
+
+
+@dataclass(frozen=True)
+class User(Node):
+    id: UUID
+    name: str
+    status: "Status"
+    joined: Optional["DateTime"] = None
+    posts: Optional[Sequence[Optional["Post"]]] = None
+
+
+@dataclass(frozen=True)
+class Post(Node):
+    id: UUID
+    title: str
+    author: "User"
+    tags: Optional[Sequence[str]] = None
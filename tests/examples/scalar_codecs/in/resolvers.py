@@ -0,0 +1,60 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from typing import Optional
+from typing import Sequence
+
+from ariadne import ObjectType
+from ariadne import QueryType
+from ariadne import ScalarType
+from graphql import GraphQLResolveInfo
+
+from .scalar_codecs import memoized
+from .scalar_codecs import parse_date
+from .scalar_codecs import parse_datetime
+from .scalar_codecs import parse_decimal
+from .scalar_codecs import parse_uuid
+from .scalar_codecs import serialize_date
+from .scalar_codecs import serialize_datetime
+from .scalar_codecs import serialize_decimal
+from .scalar_codecs import serialize_uuid
+from .types import UUID
+from .types import Date
+from .types import DateTime
+from .types import Event
+
+date_time = ScalarType(
+    "DateTime", serializer=serialize_datetime, value_parser=memoized(parse_datetime)
+)
+
+date = ScalarType(
+    "Date", serializer=memoized(serialize_date), value_parser=memoized(parse_date)
+)
+
+uuid = ScalarType(
+    "UUID", serializer=memoized(serialize_uuid), value_parser=memoized(parse_uuid)
+)
+
+money = ScalarType(
+    "Money", serializer=serialize_decimal, value_parser=memoized(parse_decimal)
+)
+
+event = ObjectType("Event")
+
+query = QueryType()
+
+
+@query.field("event")
+def resolve_query_event(
+    _: None, info: GraphQLResolveInfo, uuid: UUID
+) -> Optional[Event]:
+    ...
+
+
+@query.field("events")
+def resolve_query_events(
+    _: None, info: GraphQLResolveInfo, after: Optional[DateTime], day: Optional[Date]
+) -> Sequence[Event]:
+    ...
+
+
+resolvers = [date_time, date, uuid, money, event, query]
@@ -0,0 +1,23 @@
+# generated by pasiphae, please do not change manually
+from dataclasses import dataclass
+from datetime import date
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+DateTime = datetime
+
+Date = date
+
+Money = Decimal
+
+
+@dataclass(frozen=True)
+class Event:
+    id: str
+    uuid: "UUID"
+    start: "DateTime"
+    day: Optional["Date"] = None
+    price: Optional["Money"] = None
+    rating: Optional[float] = None
@@ -0,0 +1,14 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from ariadne import QueryType
+from graphql import GraphQLResolveInfo
+
+query = QueryType()
+
+
+@query.field("hello")
+def resolve_query_hello(_: None, info: GraphQLResolveInfo, name: str) -> str:
+    ...
+
+
+resolvers = [query]
@@ -0,0 +1 @@
+# generated by pasiphae, please do not change manually
@@ -1,4 +1,5 @@
-# generated by pasiphae, please do not change manually
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
 from decimal import Decimal
 from typing import Optional
 from typing import Sequence
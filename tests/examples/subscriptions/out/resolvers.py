@@ -0,0 +1,71 @@
+# implemented by the service, pasiphae keeps this code and merges new
+# definitions into it when the service is regenerated
+from typing import AsyncIterator
+from typing import Optional
+from typing import Sequence
+
+from ariadne import MutationType
+from ariadne import ObjectType
+from ariadne import QueryType
+from ariadne import SubscriptionType
+from graphql import GraphQLResolveInfo
+
+from .broker import broker
+from .types import Message
+
+query = QueryType()
+
+
+@query.field("messages")
+def resolve_query_messages(
+    _: None, info: GraphQLResolveInfo, room: str
+) -> Sequence[Message]:
+    ...
+
+
+mutation = MutationType()
+
+
+@mutation.field("sendMessage")
+def resolve_mutation_send_message(
+    _: None, info: GraphQLResolveInfo, room: str, text: str
+) -> Message:
+    ...
+
+
+subscription = SubscriptionType()
+
+
+@subscription.source("messageSent")
+async def subscribe_subscription_message_sent(
+    _: None, info: GraphQLResolveInfo, room: str
+) -> AsyncIterator[Message]:
+    async for event in broker.subscribe("messageSent"):
+        yield event
+
+
+@subscription.field("messageSent")
+def resolve_subscription_message_sent(
+    event: Message, info: GraphQLResolveInfo, room: str
+) -> Message:
+    return event
+
+
+@subscription.source("heartbeat")
+async def subscribe_subscription_heartbeat(
+    _: None, info: GraphQLResolveInfo
+) -> AsyncIterator[Optional[int]]:
+    async for event in broker.subscribe("heartbeat"):
+        yield event
+
+
+@subscription.field("heartbeat")
+def resolve_subscription_heartbeat(
+    event: Optional[int], info: GraphQLResolveInfo
+) -> Optional[int]:
+    return event
+
+
+message = ObjectType("Message")
+
+resolvers = [query, mutation, subscription, message]
@@ -0,0 +1,62 @@
+import builtins
+import io
+from pathlib import Path
+
+import black  # noqa: F401 - imported by api on first use, it reads grammar files
+import isort
+
+from pasiphae.api import Options
+from pasiphae.api import generate
+
+examples_dir = Path(__file__).parent / "examples"
+isort_config = isort.Config(force_single_line=True, profile="hug")
+
+
+def forbid_files(monkeypatch):
+    def open_(*args, **kwargs):
+        raise AssertionError("api should not touch filesystem")
+
+    monkeypatch.setattr(builtins, "open", open_)
+    monkeypatch.setattr(io, "open", open_)
+
+
+def read_example(name, file_name):
+    return (examples_dir / name / "out" / file_name).read_text()
+
+
+def test_generate_modules_from_sdl(monkeypatch):
+    schema = read_example("connections", "schema.graphql")
+    expected = {
+        name: read_example("connections", f"{name}.py")
+        for name in ("app", "pagination", "resolvers", "types")
+    }
+    generated_schema = read_example("connections", "schema.generated.graphql")
+
+    forbid_files(monkeypatch)
+    generated = generate(schema, Options(app=True), isort_config=isort_config)
+
+    assert generated.modules == expected
+    assert generated.schemas == {"schema.generated.graphql": generated_schema}
+    assert generated.warnings == []
+
+
+def test_generate_merges_resolvers_into_existing_module():
+    schema = "type Query { user(id: ID!): String }"
+    resolvers = generate(schema).modules["resolvers"]
+    implemented = resolvers.replace("    ...", '    return "user"')
+
+    generated = generate(
+        f"{schema} extend type Query {{ users(ids: [ID!]!): [String!]! }}",
+        existing={"resolvers": implemented},
+    )
+
+    assert 'return "user"' in generated.modules["resolvers"]
+    assert "def resolve_query_users(" in generated.modules["resolvers"]
+    assert generate(schema, Options(update=False)).modules["resolvers"] == resolvers
+
+
+def test_only_merged_modules_are_marked_as_service_code():
+    modules = generate("type Query { user: String }").modules
+
+    assert modules["resolvers"].startswith("# implemented by the service")
+    assert modules["types"].startswith("# generated by pasiphae")
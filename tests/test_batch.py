@@ -0,0 +1,85 @@
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pasiphae import batch
+from pasiphae.cli import pasiphae
+
+examples_dir = Path(__file__).parent / "examples"
+
+
+def write_manifest(tmp_path, services):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps(services))
+    return manifest
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_generates_all_services(tmp_path, workers):
+    # modules are sorted with isort settings of the project they are written to
+    (tmp_path / ".isort.cfg").write_text(
+        "[settings]\nforce_single_line = true\nprofile = hug\n"
+    )
+    names = ["simple_query", "limits", "connections"]
+    manifest = write_manifest(
+        tmp_path,
+        [
+            {
+                "schema": str(examples_dir / name / "in" / "schema.graphql"),
+                "output": name,
+            }
+            for name in names
+        ],
+    )
+
+    results = batch.run(batch.load_manifest(manifest), workers)
+
+    assert [result.name for result in results] == names
+    assert all(result.error is None for result in results)
+    for name in names:
+        for module in ("types.py", "resolvers.py"):
+            assert (tmp_path / name / module).read_text() == (
+                examples_dir / name / "out" / module
+            ).read_text()
+
+
+def test_batch_reports_failed_services(tmp_path):
+    manifest = write_manifest(
+        tmp_path, [{"name": "missing", "schema": "missing/*.graphql", "app": True}]
+    )
+
+    [result] = batch.run(batch.load_manifest(manifest))
+
+    assert result.error is not None
+    assert "missing" in batch.report([result], elapsed=0.1)
+
+
+@pytest.mark.parametrize(
+    "services, message",
+    [
+        ([{"schema": "schema.graphql", "apps": True}], "entry 0: apps"),
+        ([{"schema": "schema.graphql"}, {"name": "users"}], "entry 1 has no schema"),
+        ([["schema.graphql"]], "entry 0 has to be an object"),
+        ({"schema": "schema.graphql"}, "has to be a list"),
+    ],
+)
+def test_invalid_manifest_is_rejected(tmp_path, services, message):
+    manifest = write_manifest(tmp_path, services)
+
+    with pytest.raises(ValueError, match=message):
+        batch.load_manifest(manifest)
+
+
+@pytest.mark.parametrize("content", [None, "[{", '[{"output": "users"}]'])
+def test_batch_command_reports_invalid_manifest(tmp_path, content):
+    manifest = tmp_path / "manifest.json"
+    if content is not None:
+        manifest.write_text(content)
+
+    result = CliRunner().invoke(pasiphae, ["batch", str(manifest)])
+
+    assert result.exit_code == 1
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+    assert result.output.strip()
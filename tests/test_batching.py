@@ -0,0 +1,70 @@
+import asyncio
+import json
+from pathlib import Path
+
+from ariadne import QueryType
+from ariadne import load_schema_from_path
+from ariadne import make_executable_schema
+from tests.examples.batching.out.batching import BatchGraphQL
+from tests.examples.batching.out.client import Client
+from tests.examples.batching.out.transport import Transport
+from tests.examples.batching.out.transport import in_process
+
+schema_path = Path(__file__).parent / "examples" / "batching" / "out" / "schema.graphql"
+
+QUERY = "query User($id: Int!) { user(id: $id) { name } }"
+
+
+def make_app(contexts, **kwargs):
+    query = QueryType()
+
+    @query.field("user")
+    async def resolve_user(_, info, id):
+        contexts.append(info.context)
+        await asyncio.sleep(0.01 * (3 - id % 3))  # finish out of order
+        return {"id": id, "name": f"user {id}"}
+
+    schema = make_executable_schema(load_schema_from_path(schema_path), [query])
+    return BatchGraphQL(schema, **kwargs)
+
+
+def post(app, payload):
+    status, body = asyncio.run(in_process(app)(json.dumps(payload).encode()))
+    return status, json.loads(body) if status == 200 else body.decode()
+
+
+def test_batched_operations_share_context_and_keep_order():
+    contexts = []
+    requests = []
+    send = in_process(make_app(contexts))
+
+    async def counted(body):
+        requests.append(body)
+        return await send(body)
+
+    client = Client(Transport(counted, batch=True))
+
+    async def call():
+        return await asyncio.gather(*(client.user(id) for id in range(6)))
+
+    results = asyncio.run(call())
+
+    assert len(requests) == 1
+    assert [result.user.name for result in results] == [f"user {id}" for id in range(6)]
+    assert len(contexts) == 6 and all(c is contexts[0] for c in contexts)
+
+
+def test_single_operation_is_served():
+    status, result = post(make_app([]), {"query": QUERY, "variables": {"id": 1}})
+
+    assert status == 200
+    assert result == {"data": {"user": {"name": "user 1"}}}
+
+
+def test_batch_size_is_limited():
+    operation = {"query": QUERY, "variables": {"id": 1}}
+
+    status, result = post(make_app([], max_batch_size=2), [operation] * 3)
+
+    assert status == 400
+    assert result == "Batch should have 1 to 2 operations"
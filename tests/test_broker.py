@@ -0,0 +1,111 @@
+import asyncio
+
+from tests.examples.subscriptions.out.broker import Broker
+
+
+async def take(iterator, count):
+    return [await iterator.__anext__() for _ in range(count)]
+
+
+def test_broker_fans_out_events_to_every_subscriber():
+    async def scenario():
+        broker = Broker()
+        first, second = broker.subscribe("topic"), broker.subscribe("topic")
+        pending = [asyncio.ensure_future(take(it, 2)) for it in (first, second)]
+        await asyncio.sleep(0)
+        assert broker.subscribers("topic") == 2
+
+        await broker.publish("topic", 1)
+        broker.publish_nowait("topic", 2)
+        broker.publish_nowait("other", 3)
+
+        assert await asyncio.gather(*pending) == [[1, 2], [1, 2]]
+        await first.aclose()
+        await second.aclose()
+        assert broker.subscribers("topic") == 0
+
+    asyncio.run(scenario())
+
+
+def test_broker_publish_waits_for_slow_subscriber():
+    async def scenario():
+        broker = Broker(max_queue_size=1)
+        subscriber = broker.subscribe("topic")
+        pending = asyncio.ensure_future(take(subscriber, 1))
+        await asyncio.sleep(0)
+
+        broker.publish_nowait("topic", 1)
+        blocked = asyncio.ensure_future(broker.publish("topic", 2))
+        blocked_2 = asyncio.ensure_future(broker.publish("topic", 3))
+        await asyncio.sleep(0)
+        assert not blocked_2.done()
+
+        assert await pending == [1]
+        assert await take(subscriber, 1) == [2]
+        await blocked
+        await blocked_2
+        await subscriber.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_broker_publish_nowait_drops_oldest_event():
+    async def scenario():
+        broker = Broker(max_queue_size=2)
+        subscriber = broker.subscribe("topic")
+        pending = asyncio.ensure_future(take(subscriber, 1))
+        await asyncio.sleep(0)
+
+        for event in range(5):
+            broker.publish_nowait("topic", event)
+
+        assert await pending == [3]
+        assert await take(subscriber, 1) == [4]
+        assert broker.dropped == 3
+        await subscriber.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_broker_publish_stops_waiting_for_unsubscribed():
+    async def scenario():
+        broker = Broker(max_queue_size=1)
+        subscriber = broker.subscribe("topic")
+        pending = asyncio.ensure_future(take(subscriber, 1))
+        await asyncio.sleep(0)
+        await broker.publish("topic", 1)
+        assert await pending == [1]
+
+        broker.publish_nowait("topic", 2)
+        blocked = asyncio.ensure_future(broker.publish("topic", 3))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+        await subscriber.aclose()
+
+        assert broker.subscribers("topic") == 0
+        await asyncio.wait_for(blocked, 1)
+
+    asyncio.run(scenario())
+
+
+def test_broker_slow_subscriber_does_not_delay_others():
+    async def scenario():
+        broker = Broker(max_queue_size=1)
+        slow, fast = broker.subscribe("topic"), broker.subscribe("topic")
+        started = asyncio.ensure_future(take(slow, 1))
+        received = asyncio.ensure_future(take(fast, 3))
+        await asyncio.sleep(0)
+
+        await broker.publish("topic", 1)
+        assert await started == [1]
+        await broker.publish("topic", 2)
+        blocked = asyncio.ensure_future(broker.publish("topic", 3))
+
+        assert await asyncio.wait_for(received, 1) == [1, 2, 3]
+        assert not blocked.done()
+        assert await take(slow, 2) == [2, 3]
+        await blocked
+        await slow.aclose()
+        await fast.aclose()
+
+    asyncio.run(scenario())
@@ -0,0 +1,88 @@
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pasiphae.cli import pasiphae
+
+examples_dir = Path(__file__).parent / "examples"
+
+RESOLVER = """    ...
+"""
+IMPLEMENTED = """    return {"name": "implemented"}
+"""
+
+
+@pytest.fixture
+def service(tmp_path):
+    shutil.copy(examples_dir / "simple_query" / "in" / "schema.graphql", tmp_path)
+    result = CliRunner().invoke(pasiphae, [str(tmp_path), "--app"])
+    assert result.exit_code == 0
+    return tmp_path
+
+
+def invoke(*args):
+    return CliRunner().invoke(pasiphae, list(map(str, args)))
+
+
+def contents(path):
+    return {file: file.read_text() for file in path.iterdir() if file.is_file()}
+
+
+def test_formatters_are_imported_when_needed():
+    script = (
+        "import sys\n"
+        "import pasiphae.cli\n"
+        "assert not {'black', 'isort', 'graphql'} & set(sys.modules)\n"
+    )
+
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True)
+
+    assert result.returncode == 0, result.stderr.decode()
+
+
+def test_up_to_date_service_passes(service):
+    before = contents(service)
+
+    result = invoke(service, "--app", "--check")
+
+    assert result.exit_code == 0, result.output
+    assert contents(service) == before
+
+
+def test_implemented_resolvers_are_up_to_date(service):
+    resolvers = service / "resolvers.py"
+    resolvers.write_text(resolvers.read_text().replace(RESOLVER, IMPLEMENTED, 1))
+
+    result = invoke(service, "--app", "--check")
+
+    assert result.exit_code == 0, result.output
+
+
+def test_drift_fails_without_writing(service):
+    (service / "types.py").write_text("# changed\n")
+    (service / "app.py").unlink()
+    before = contents(service)
+
+    result = invoke(service, "--app", "--check")
+
+    assert result.exit_code == 1
+    assert result.output.splitlines() == [
+        f"would update {service / 'types.py'}",
+        f"would update {service / 'app.py'}",
+    ]
+    assert contents(service) == before
+
+
+def test_diff_shows_changes(service):
+    (service / "types.py").write_text("# changed\n")
+
+    result = invoke(service, "--app", "--diff")
+
+    assert result.exit_code == 1
+    assert f"--- {service / 'types.py'}" in result.output
+    assert "-# changed\n" in result.output
+    assert "+# generated by pasiphae, please do not change manually\n" in result.output
@@ -0,0 +1,298 @@
+import asyncio
+import json
+import socket
+import struct
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+from ariadne import InterfaceType
+from ariadne import MutationType
+from ariadne import QueryType
+from ariadne import load_schema_from_path
+from ariadne import make_executable_schema
+from ariadne import snake_case_fallback_resolvers
+from ariadne.asgi import GraphQL
+from tests.examples.client.out.client import Client
+from tests.examples.client.out.resolvers import date_time
+from tests.examples.client.out.resolvers import episode
+from tests.examples.client.out.transport import Connection
+from tests.examples.client.out.transport import GraphQLError
+from tests.examples.client.out.transport import Transport
+from tests.examples.client.out.transport import in_process
+from tests.examples.client.out.types import Droid
+from tests.examples.client.out.types import Episode
+from tests.examples.client.out.types import Human
+from tests.examples.client.out.types import Review
+from tests.examples.client.out.types import ReviewInput
+
+from pasiphae.api import generate
+
+schema_path = Path(__file__).parent / "examples" / "client" / "out" / "schema.graphql"
+
+LUKE = Human(id=UUID(int=1), name="Luke", friends=[], height=None)
+R2D2 = Droid(id=UUID(int=2), name="R2-D2", friends=[LUKE])
+CREATED_AT = datetime(2020, 1, 2, tzinfo=timezone.utc)
+
+
+def make_app():
+    query = QueryType()
+    mutation = MutationType()
+    character = InterfaceType(
+        "Character", lambda obj, *_: obj.__class__.__name__  # type: ignore
+    )
+
+    @query.field("hero")
+    def resolve_hero(_, info, episode=None):
+        if episode == Episode.EMPIRE:
+            raise ValueError("No hero")
+        return R2D2
+
+    @query.field("reviews")
+    def resolve_reviews(_, info, episode, since=None):
+        assert since == CREATED_AT
+        return [Review(episode, 5, CREATED_AT, commentary="great")]
+
+    @mutation.field("createReview")
+    def resolve_create_review(_, info, episode, review):
+        assert review == {"stars": 4, "commentary": None, "episodes": [Episode.JEDI]}
+        return Review(episode, review["stars"], CREATED_AT)
+
+    schema = make_executable_schema(
+        load_schema_from_path(schema_path),
+        [date_time, episode, character, query, mutation]
+        + [snake_case_fallback_resolvers],
+    )
+    return GraphQL(schema)
+
+
+def test_results_are_typed():
+    client = Client(Transport(in_process(make_app())))
+
+    async def call():
+        return await asyncio.gather(
+            client.hero(),
+            client.reviews(Episode.JEDI, since=CREATED_AT),
+            client.create_review(
+                Episode.JEDI, ReviewInput(stars=4, episodes=[Episode.JEDI])
+            ),
+        )
+
+    hero, reviews, review = asyncio.run(call())
+
+    assert hero.hero.typename == "Droid"
+    assert hero.hero.id == UUID(int=2)
+    assert hero.hero.height is None
+    assert [friend.name for friend in hero.hero.friends] == ["Luke"]
+    assert reviews.reviews[0].created_at == CREATED_AT
+    assert reviews.reviews[0].text == "great"
+    assert review.create_review.episode is Episode.JEDI
+
+
+def test_errors_are_raised():
+    client = Client(Transport(in_process(make_app())))
+
+    with pytest.raises(GraphQLError, match="No hero"):
+        asyncio.run(client.hero(Episode.EMPIRE))
+
+
+def test_concurrent_calls_are_batched():
+    requests = []
+    send = in_process(make_app())
+
+    async def send_batch(body):
+        payload = json.loads(body)
+        requests.append(payload)
+        results = []
+        for operation in payload:
+            _, result = await send(json.dumps(operation).encode())
+            results.append(json.loads(result))
+        return 200, json.dumps(results).encode()
+
+    client = Client(Transport(send_batch, batch=True))
+
+    async def call():
+        return await asyncio.gather(
+            client.hero(), client.reviews(Episode.JEDI, since=CREATED_AT)
+        )
+
+    hero, reviews = asyncio.run(call())
+
+    assert len(requests) == 1
+    assert [operation["operationName"] for operation in requests[0]] == [
+        "Hero",
+        "Reviews",
+    ]
+    assert hero.hero.name == "R2-D2"
+    assert reviews.reviews[0].stars == 5
+
+
+def test_pool_keeps_connections_alive():
+    connections = 0
+    body = b'{"data": {"hero": null}}'
+
+    async def handle(reader, writer):
+        nonlocal connections
+        connections += 1
+        while await reader.readline():
+            length = 0
+            while (line := await reader.readline()) != b"\r\n":
+                name, _, value = line.decode().partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body)
+            )
+            await writer.drain()
+        writer.close()
+
+    async def call():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with Transport.connect(f"http://127.0.0.1:{port}/", 2) as transport:
+            client = Client(transport)
+            results = await asyncio.gather(*(client.hero() for _ in range(20)))
+        server.close()
+        return results
+
+    results = asyncio.run(call())
+
+    assert [result.hero for result in results] == [None] * 20
+    assert connections == 2
+
+
+@pytest.mark.parametrize(
+    "response, message",
+    [
+        ({"errors": [{"message": "Batching is disabled"}]}, "Batching is disabled"),
+        ([{"data": {"hero": None}}], "Expected list of 2 results"),
+    ],
+)
+def test_unexpected_batch_responses_fail_every_call(response, message):
+    async def send(body):
+        return 400, json.dumps(response).encode()
+
+    client = Client(Transport(send, batch=True))
+
+    async def call():
+        return await asyncio.wait_for(
+            asyncio.gather(client.hero(), client.hero(), return_exceptions=True), 1
+        )
+
+    errors = asyncio.run(call())
+
+    assert len(errors) == 2
+    for error in errors:
+        assert isinstance(error, GraphQLError)
+        assert str(error).startswith(message)
+
+
+@pytest.mark.parametrize("header", [b"", b"Connection: close\r\n"])
+def test_connections_closed_by_server_are_reopened(header):
+    connections = 0
+    body = b'{"data": {"hero": null}}'
+
+    async def handle(reader, writer):
+        nonlocal connections
+        connections += 1
+        await reader.readline()
+        length = 0
+        while (line := await reader.readline()) != b"\r\n":
+            name, _, value = line.decode().partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        await reader.readexactly(length)
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n%sContent-Length: %d\r\n\r\n%s"
+            % (header, len(body), body)
+        )
+        await writer.drain()
+        writer.close()
+
+    async def call():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with Transport.connect(f"http://127.0.0.1:{port}/", 1) as transport:
+            client = Client(transport)
+            results = []
+            for _ in range(3):
+                results.append(await client.hero())
+                await asyncio.sleep(0.01)  # let server close idle connection
+        server.close()
+        return results
+
+    results = asyncio.run(call())
+
+    assert [result.hero for result in results] == [None] * 3
+    assert connections == 3
+
+
+def test_requests_which_server_may_have_processed_are_not_sent_again():
+    connections, requests = 0, 0
+    body = b'{"data": {"hero": null}}'
+
+    async def handle(reader, writer):
+        nonlocal connections, requests
+        connections += 1
+        while await reader.readline():
+            requests += 1
+            length = 0
+            while (line := await reader.readline()) != b"\r\n":
+                name, _, value = line.decode().partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            if requests == 2:
+                # reset connection after the request was read
+                writer.get_extra_info("socket").setsockopt(
+                    socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+                )
+                break
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body)
+            )
+            await writer.drain()
+        writer.close()
+
+    async def call():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            async with Transport.connect(f"http://127.0.0.1:{port}/", 1) as transport:
+                client = Client(transport)
+                await client.hero()
+                await client.hero()
+        finally:
+            server.close()
+
+    with pytest.raises(ConnectionResetError):
+        asyncio.run(call())
+
+    assert (connections, requests) == (1, 2)
+
+
+@pytest.mark.parametrize(
+    "url, ssl, port",
+    [
+        ("http://localhost/graphql", False, 80),
+        ("https://localhost/graphql", True, 443),
+        ("https://localhost:8443/graphql", True, 8443),
+    ],
+)
+def test_connection_scheme_and_default_port(url, ssl, port):
+    connection = Connection(url)
+
+    assert (connection.ssl, connection.port) == (ssl, port)
+
+
+def test_connection_rejects_unsupported_schemes():
+    with pytest.raises(ValueError, match="Unsupported URL scheme 'ws'"):
+        Connection("ws://localhost/graphql")
+
+
+def test_invalid_operations_are_rejected():
+    with pytest.raises(ValueError, match="Cannot query field 'villain'"):
+        generate("type Query { hero: String }", operations="query Villain { villain }")
@@ -0,0 +1,146 @@
+import asyncio
+from uuid import UUID
+
+import pytest
+from graphql import GraphQLError
+from tests.examples.connections.out.pagination import Page
+from tests.examples.connections.out.pagination import build_connection
+from tests.examples.connections.out.pagination import decode_cursor
+from tests.examples.connections.out.pagination import encode_cursor
+from tests.examples.connections.out.pagination import paginated
+from tests.examples.connections.out.types import Post
+from tests.examples.connections.out.types import PostConnection
+from tests.examples.connections.out.types import PostEdge
+
+from pasiphae.api import generate
+
+POSTS = [Post(UUID(int=id), f"post {id}", f"2022-01-0{id}") for id in range(1, 6)]
+
+
+def fetch(page):
+    """Keyset query the resolver would run, nearest to the cursor first"""
+    if page.backward:
+        nodes = [
+            post
+            for post in reversed(POSTS)
+            if page.before is None or post.published_at < page.before
+        ]
+    else:
+        nodes = [
+            post
+            for post in POSTS
+            if page.after is None or post.published_at > page.after
+        ]
+    return nodes[: page.fetch_size]
+
+
+def paginate(**arguments):
+    page = Page.from_arguments(
+        arguments.get("first"),
+        arguments.get("after"),
+        arguments.get("last"),
+        arguments.get("before"),
+        max_page_size=3,
+    )
+    return build_connection(fetch(page), page, PostConnection, PostEdge, "published_at")
+
+
+def ids(connection):
+    return [edge.node.id.int for edge in connection.edges]
+
+
+def cursor(id):
+    return encode_cursor(f"2022-01-0{id}")
+
+
+def test_cursors_are_opaque_round_trips():
+    key = {"published_at": "2022-01-01", "id": 1}
+
+    assert decode_cursor(encode_cursor(key)) == key
+    assert encode_cursor(UUID(int=1)) == encode_cursor(str(UUID(int=1)))
+
+
+@pytest.mark.parametrize("cursor_", ["not a cursor", "e30"])
+def test_invalid_cursors_are_rejected(cursor_):
+    with pytest.raises(GraphQLError, match="Invalid cursor"):
+        decode_cursor(cursor_)
+
+
+@pytest.mark.parametrize(
+    "arguments, message",
+    [
+        ({"first": 1, "last": 1}, "both `first` and `last`"),
+        ({"first": -1}, "cannot be negative"),
+        ({"last": 4}, "cannot exceed 3"),
+    ],
+)
+def test_invalid_page_arguments_are_rejected(arguments, message):
+    with pytest.raises(GraphQLError, match=message):
+        paginate(**arguments)
+
+
+def test_first_page():
+    connection = paginate(first=2)
+
+    assert ids(connection) == [1, 2]
+    assert connection.page_info.has_next_page
+    assert not connection.page_info.has_previous_page
+    assert connection.page_info.start_cursor == cursor(1)
+    assert connection.page_info.end_cursor == cursor(2)
+
+
+def test_page_after_cursor_has_previous_page():
+    connection = paginate(first=2, after=cursor(2))
+
+    assert ids(connection) == [3, 4]
+    assert connection.page_info.has_next_page
+    assert connection.page_info.has_previous_page
+
+
+def test_last_page_forward():
+    connection = paginate(after=cursor(3))
+
+    assert ids(connection) == [4, 5]
+    assert not connection.page_info.has_next_page
+    assert connection.page_info.has_previous_page
+
+
+def test_page_before_cursor_is_ordered_forward():
+    connection = paginate(last=2, before=cursor(5))
+
+    assert ids(connection) == [3, 4]
+    assert connection.page_info.has_next_page
+    assert connection.page_info.has_previous_page
+
+
+def test_empty_page():
+    connection = paginate(first=0)
+
+    assert ids(connection) == []
+    assert connection.page_info.start_cursor is None
+    assert connection.page_info.has_next_page
+
+
+def test_paginated_resolvers_get_page_and_may_be_async():
+    pages = []
+
+    @paginated(PostConnection, PostEdge, key="published_at", max_page_size=3)
+    async def resolve_posts(parent, info, page):
+        pages.append(page)
+        return fetch(page)
+
+    connection = asyncio.run(resolve_posts(None, None, first=1, after=cursor(1)))
+
+    assert pages == [Page(limit=1, after="2022-01-01")]
+    assert ids(connection) == [2]
+
+
+def test_connection_fields_have_to_be_lists():
+    schema = """
+    directive @connection(key: String, maxPageSize: Int) on FIELD_DEFINITION
+    type User { id: ID! }
+    type Query { author: User @connection }
+    """
+
+    with pytest.raises(ValueError, match="@connection field author has to be a list"):
+        generate(schema)
@@ -0,0 +1,232 @@
+import asyncio
+import importlib
+import json
+import sqlite3
+from functools import cached_property
+from pathlib import Path
+
+import pytest
+from ariadne import QueryType
+from ariadne import load_schema_from_path
+from ariadne import make_executable_schema
+from click.testing import CliRunner
+from tests.examples.context.out import lifespan
+from tests.examples.context.out.lifespan import ContextGraphQL
+from tests.examples.context.out.lifespan import RequestContext
+
+from pasiphae.cli import pasiphae
+
+examples_dir = Path(__file__).parent / "examples"
+
+QUERY = '{ a: user(id: "1") { name } b: user(id: "1") { name } }'
+
+IMPLEMENTED = '''import sqlite3
+from contextlib import AsyncExitStack
+from functools import cached_property
+
+from .lifespan import RequestContext
+
+
+class Resources:
+    """Pooled resources, opened once on startup and shared by all requests"""
+
+    def __init__(self, db: sqlite3.Connection) -> None:
+        self.db = db
+
+
+class Context(RequestContext[Resources]):
+    """Context of a request, passed to resolvers as `info.context`"""
+
+    @cached_property
+    def users(self) -> dict:
+        return {}
+
+
+async def open_resources(stack: AsyncExitStack) -> Resources:
+    """Open pooled resources on startup, `stack` closes them on shutdown"""
+    db = sqlite3.connect(":memory:")
+    stack.callback(db.close)
+    return Resources(db)
+'''
+
+
+class Resources:
+    def __init__(self, db):
+        self.db = db
+        self.statements = []
+        db.set_trace_callback(self.statements.append)
+
+
+class Users:
+    def __init__(self, db):
+        self.db = db
+        self.cache = {}
+
+    def get(self, id):
+        if id not in self.cache:
+            self.cache[id] = self.db.execute(
+                "SELECT id, name FROM users WHERE id = ?", (id,)
+            ).fetchone()
+        return self.cache[id]
+
+
+class Context(RequestContext[Resources]):
+    loaders = 0
+
+    @cached_property
+    def users(self):
+        Context.loaders += 1
+        return Users(self.resources.db)
+
+
+async def open_resources(stack):
+    db = sqlite3.connect(":memory:")
+    stack.callback(db.close)
+    db.execute("CREATE TABLE users (id TEXT, name TEXT)")
+    db.execute("INSERT INTO users VALUES ('1', 'Ann')")
+    return Resources(db)
+
+
+query = QueryType()
+
+
+@query.field("user")
+def resolve_user(_, info, id):
+    id_, name = info.context.users.get(id)
+    return {"id": id_, "name": name}
+
+
+@pytest.fixture
+def app():
+    Context.loaders = 0
+    type_defs = load_schema_from_path(
+        examples_dir / "context" / "out" / "schema.graphql"
+    )
+    return ContextGraphQL(
+        make_executable_schema(type_defs, query),
+        open_resources=open_resources,
+        context_class=Context,
+    )
+
+
+async def post(app, payload):
+    messages = [{"type": "http.request", "body": json.dumps(payload).encode()}]
+    response = {"body": b""}
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        response["body"] += message.get("body", b"")
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+    }
+    await app(scope, receive, send)
+    return json.loads(response["body"])
+
+
+async def lifespan_event(app, event):
+    sent = []
+
+    async def receive():
+        return {"type": f"lifespan.{event}"}
+
+    async def send(message):
+        sent.append(message)
+        raise asyncio.CancelledError  # stop waiting for next event
+
+    try:
+        await app({"type": "lifespan"}, receive, send)
+    except asyncio.CancelledError:
+        pass
+    return sent[0]
+
+
+def test_resources_live_from_startup_to_shutdown(app):
+    async def run():
+        started = await lifespan_event(app, "startup")
+        db = app.resources.db
+        first = await post(app, {"query": QUERY})
+        second = await post(app, {"query": QUERY})
+        stopped = await lifespan_event(app, "shutdown")
+        return started, first, second, stopped, db
+
+    started, first, second, stopped, db = asyncio.run(run())
+
+    assert started == {"type": "lifespan.startup.complete"}
+    assert stopped == {"type": "lifespan.shutdown.complete"}
+    user = {"name": "Ann"}
+    assert first == second == {"data": {"a": user, "b": user}}
+    with pytest.raises(sqlite3.ProgrammingError, match="closed"):
+        db.execute("SELECT 1")
+
+
+def test_request_objects_are_created_lazily_per_request(app):
+    async def run():
+        await lifespan_event(app, "startup")
+        await post(app, {"query": "{ __typename }"})
+        unused = Context.loaders
+        await post(app, {"query": QUERY})
+        await post(app, {"query": QUERY})
+        return unused, app.resources.statements
+
+    unused, statements = asyncio.run(run())
+
+    assert unused == 0
+    assert Context.loaders == 2
+    assert [s for s in statements if s.startswith("SELECT")] == [
+        "SELECT id, name FROM users WHERE id = '1'"
+    ] * 2
+
+
+def test_requests_need_lifespan(app):
+    with pytest.raises(RuntimeError, match="lifespan"):
+        asyncio.run(post(app, {"query": QUERY}))
+
+
+def test_failed_startup_is_reported(app):
+    async def failing(stack):
+        stack.callback(closed.append, True)
+        raise ConnectionError("database is down")
+
+    closed = []
+    app.open_resources = failing
+
+    message = asyncio.run(lifespan_event(app, "startup"))
+
+    assert message == {"type": "lifespan.startup.failed", "message": "database is down"}
+    assert closed == [True]
+
+
+def test_production_profile_hides_tracebacks(monkeypatch):
+    monkeypatch.setenv("GRAPHQL_PROFILE", "production")
+    assert importlib.reload(lifespan).DEBUG is False
+
+    monkeypatch.delenv("GRAPHQL_PROFILE")
+    assert importlib.reload(lifespan).DEBUG is True
+
+
+def test_implemented_context_is_kept(tmp_path):
+    (tmp_path / "schema.graphql").write_text("type Query { hello: String }")
+    (tmp_path / "context.py").write_text(IMPLEMENTED)
+
+    result = CliRunner().invoke(pasiphae, [str(tmp_path), "--app", "--context"])
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "context.py").read_text() == IMPLEMENTED
+
+
+def test_context_module_is_marked_as_service_code(tmp_path):
+    (tmp_path / "schema.graphql").write_text("type Query { hello: String }")
+
+    result = CliRunner().invoke(pasiphae, [str(tmp_path), "--app", "--context"])
+
+    assert result.exit_code == 0, result.output
+    header = (tmp_path / "context.py").read_text().splitlines()[0]
+    assert header.startswith("# implemented by the service")
+    assert "generated by pasiphae" in (tmp_path / "lifespan.py").read_text()
@@ -0,0 +1,99 @@
+from datetime import datetime
+from datetime import timezone
+from decimal import Decimal
+from uuid import UUID
+
+from tests.examples.converters.out.converters import order_from_mapping
+from tests.examples.converters.out.converters import order_from_row
+from tests.examples.converters.out.converters import order_from_rows
+from tests.examples.converters.out.converters import order_to_dict
+from tests.examples.converters.out.types import Customer
+from tests.examples.converters.out.types import Order
+from tests.examples.converters.out.types import OrderLine
+from tests.examples.converters.out.types import Status
+
+PLACED_AT = datetime(2022, 5, 1, tzinfo=timezone.utc)
+NODE = Customer("not an order")
+
+ORDER = Order(
+    id=UUID(int=1),
+    status=Status.PAID,
+    placed_at=PLACED_AT,
+    lines=[OrderLine("lamp", 2, Decimal("9.99")), OrderLine("desk", 1)],
+    customer=Customer("Ann", Status.PLACED),
+    tags=("new",),
+    previous_statuses=[Status.PLACED, None],
+    related=[NODE],
+)
+ROW = (
+    UUID(int=1),
+    "PAID",
+    PLACED_AT,
+    [("lamp", 2, Decimal("9.99")), ("desk", 1, None)],
+    ("Ann", "PLACED"),
+    ("new",),
+    ["PLACED", None],
+    [NODE],
+)
+
+
+def test_rows_are_converted_recursively():
+    assert order_from_row(ROW) == ORDER
+
+
+def test_rows_are_converted_in_batch():
+    empty = (UUID(int=2), "SHIPPED", PLACED_AT, [], None, None, None, None)
+
+    orders = order_from_rows(iter([ROW, empty]))
+
+    assert orders == [
+        ORDER,
+        Order(id=UUID(int=2), status=Status.SHIPPED, placed_at=PLACED_AT, lines=[]),
+    ]
+
+
+def test_dicts_are_converted_back_to_types():
+    mapping = order_to_dict(ORDER)
+
+    assert mapping == {
+        "id": UUID(int=1),
+        "status": "PAID",
+        "placed_at": PLACED_AT,
+        "lines": [
+            {"product": "lamp", "quantity": 2, "price": Decimal("9.99")},
+            {"product": "desk", "quantity": 1, "price": None},
+        ],
+        "customer": {"name": "Ann", "tier": "PLACED"},
+        "tags": ("new",),
+        "previous_statuses": ["PLACED", None],
+        "related": [NODE],
+    }
+    assert order_from_mapping(mapping) == ORDER
+
+
+def test_missing_optional_keys_are_none():
+    order = order_from_mapping(
+        {"id": UUID(int=3), "status": "PLACED", "placed_at": PLACED_AT, "lines": []}
+    )
+
+    assert order == Order(
+        id=UUID(int=3), status=Status.PLACED, placed_at=PLACED_AT, lines=[]
+    )
+
+
+def test_values_are_read_once():
+    read = []
+
+    class Reads(dict):
+        def __getitem__(self, key):
+            read.append(key)
+            return super().__getitem__(key)
+
+        def get(self, key, default=None):
+            read.append(key)
+            return super().get(key, default)
+
+    mapping = Reads(order_to_dict(ORDER))
+
+    assert order_from_mapping(mapping) == ORDER
+    assert sorted(read) == sorted(mapping)
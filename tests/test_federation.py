@@ -0,0 +1,67 @@
+import asyncio
+from pathlib import Path
+
+from ariadne import load_schema_from_path
+from ariadne.contrib.federation import make_federated_schema
+from graphql import graphql
+from tests.examples.federation.out.federation import batch_entities
+from tests.examples.federation.out.federation import references
+from tests.examples.federation.out.types import Product
+
+schema_path = Path(__file__).parent / "examples" / "federation" / "out"
+
+QUERY = """
+query ($representations: [_Any!]!) {
+    _entities(representations: $representations) {
+        __typename
+        ... on Product { upc name }
+        ... on Review { id }
+    }
+}
+"""
+
+
+def execute(representations):
+    schema = make_federated_schema(
+        load_schema_from_path(schema_path / "schema.graphql")
+    )
+    batch_entities(schema)
+    return asyncio.run(
+        graphql(schema, QUERY, variable_values={"representations": representations})
+    )
+
+
+def test_entities_are_resolved_with_one_call_per_type(monkeypatch):
+    calls = []
+
+    async def resolve_products(info, representations):
+        calls.append([representation["upc"] for representation in representations])
+        return [
+            Product(upc=r["upc"], name=f"product {r['upc']}", price=None, reviews=[])
+            for r in representations
+        ]
+
+    monkeypatch.setitem(references, "Product", resolve_products)
+    result = execute(
+        [
+            {"__typename": "Product", "upc": "1"},
+            {"__typename": "Review", "id": "7"},
+            {"__typename": "Product", "upc": "2"},
+        ]
+    )
+
+    assert result.errors is None
+    assert result.data == {
+        "_entities": [
+            {"__typename": "Product", "upc": "1", "name": "product 1"},
+            {"__typename": "Review", "id": "7"},
+            {"__typename": "Product", "upc": "2", "name": "product 2"},
+        ]
+    }
+    assert calls == [["1", "2"]]
+
+
+def test_entities_reject_types_without_key():
+    result = execute([{"__typename": "User", "name": "anonymous"}])
+
+    assert result.errors[0].message == "User is not an entity of this service"
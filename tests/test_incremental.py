@@ -0,0 +1,174 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from ariadne import ObjectType
+from ariadne import QueryType
+from ariadne import load_schema_from_path
+from ariadne import make_executable_schema
+from tests.examples.incremental.out.app import GraphQL
+from tests.examples.incremental.out.incremental import add_directives
+
+from pasiphae.api import generate
+
+schema_path = (
+    Path(__file__).parent / "examples" / "incremental" / "out" / "schema.graphql"
+)
+
+PRODUCTS = [
+    {"id": 1, "name": "Lamp", "reviews": [{"stars": 5}, {"stars": 3}]},
+    {"id": 2, "name": "Desk", "reviews": None},
+    {"id": 3, "name": "Chair", "reviews": []},
+]
+
+
+def make_app():
+    query = QueryType()
+    product = ObjectType("Product")
+
+    @query.field("products")
+    async def resolve_products(_, info, category=None):
+        for item in PRODUCTS:
+            await asyncio.sleep(0.01)
+            yield item
+
+    @product.field("name")
+    async def resolve_name(product_, info):
+        if product_["id"] == 2:
+            raise ValueError("No name")
+        await asyncio.sleep(0.02)
+        return product_["name"]
+
+    schema = make_executable_schema(
+        load_schema_from_path(schema_path), [query, product]
+    )
+    add_directives(schema)
+    return GraphQL(schema)
+
+
+async def post(app, payload, accept):
+    """Chunks of response body, as sent by the app"""
+    chunks = []
+    messages = [{"type": "http.request", "body": json.dumps(payload).encode()}]
+    response = {}
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await asyncio.Event().wait()  # client stays connected
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response.update(message)
+        elif message.get("body"):
+            chunks.append(message["body"])
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "query_string": b"",
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"accept", accept.encode()),
+        ],
+    }
+    await app(scope, receive, send)
+    headers = {name.decode(): value.decode() for name, value in response["headers"]}
+    return headers["content-type"], chunks
+
+
+def parts(chunks):
+    body = b"".join(chunks)
+    assert body.endswith(b"\r\n-----\r\n")
+    return [
+        json.loads(part.partition(b"\r\n\r\n")[2])
+        for part in body[: -len(b"\r\n-----\r\n")].split(b"\r\n---\r\n")[1:]
+    ]
+
+
+def run(query, accept="multipart/mixed"):
+    return asyncio.run(post(make_app(), {"query": query}, accept))
+
+
+def test_streamed_items_are_sent_one_by_one():
+    content_type, chunks = run(
+        "{ products @stream(initialCount: 1) { id reviews @stream { stars } } }"
+    )
+
+    assert content_type.startswith("multipart/mixed")
+    payloads = parts(chunks)
+    assert len(chunks) > 2  # sent as they are ready, not at once
+    assert payloads[0] == {
+        "data": {"products": [{"id": 1, "reviews": []}]},
+        "hasNext": True,
+    }
+    items = {
+        tuple(item["path"]): item["items"]
+        for payload in payloads[1:]
+        for item in payload.get("incremental", [])
+    }
+    assert items == {
+        ("products", 0, "reviews", 0): [{"stars": 5}],
+        ("products", 0, "reviews", 1): [{"stars": 3}],
+        ("products", 1): [{"id": 2, "reviews": None}],
+        ("products", 2): [{"id": 3, "reviews": []}],
+    }
+    assert payloads[-1]["hasNext"] is False
+
+
+def test_deferred_fragments_are_sent_later_with_their_errors():
+    _, chunks = run(
+        '{ products { id ... @defer(label: "names") { name } } }',
+    )
+
+    payloads = parts(chunks)
+    assert payloads[0] == {
+        "data": {"products": [{"id": 1}, {"id": 2}, {"id": 3}]},
+        "hasNext": True,
+    }
+    deferred = [
+        item for payload in payloads[1:] for item in payload.get("incremental", [])
+    ]
+    assert sorted(deferred, key=lambda item: item["path"]) == [
+        {"data": {"name": "Lamp"}, "path": ["products", 0], "label": "names"},
+        {
+            "data": None,
+            "path": ["products", 1],
+            "label": "names",
+            "errors": [
+                {
+                    "message": "No name",
+                    "locations": [{"line": 1, "column": 46}],
+                    "path": ["products", 1, "name"],
+                }
+            ],
+        },
+        {"data": {"name": "Chair"}, "path": ["products", 2], "label": "names"},
+    ]
+    assert payloads[-1]["hasNext"] is False
+
+
+@pytest.mark.parametrize(
+    "query, accept",
+    [
+        ("{ products @stream { id } }", "application/json"),
+        ("{ products { id } }", "multipart/mixed"),
+    ],
+)
+def test_complete_result_is_sent_without_incremental_delivery(query, accept):
+    content_type, chunks = run(query, accept)
+
+    assert content_type == "application/json"
+    assert json.loads(b"".join(chunks)) == {
+        "data": {"products": [{"id": 1}, {"id": 2}, {"id": 3}]}
+    }
+
+
+def test_only_list_fields_can_be_streamed():
+    with pytest.raises(ValueError, match="field product has to be a list"):
+        generate(
+            """directive @streamable on FIELD_DEFINITION
+            type Query { product: String @streamable }"""
+        )
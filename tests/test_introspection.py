@@ -0,0 +1,87 @@
+import asyncio
+import json
+
+import pytest
+from graphql import get_introspection_query
+from graphql import graphql_sync
+from tests.examples.introspection.out.app import app
+from tests.examples.introspection.out.introspection import ETAG
+from tests.examples.introspection.out.introspection import RESPONSE
+
+from pasiphae.api import Options
+from pasiphae.api import generate
+
+QUERY = get_introspection_query(descriptions=True)
+
+
+async def post(payload, **headers):
+    messages = [{"type": "http.request", "body": json.dumps(payload).encode()}]
+    response = {"body": b""}
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {
+                name.decode(): value.decode() for name, value in message["headers"]
+            }
+        else:
+            response["body"] += message.get("body", b"")
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "query_string": b"",
+        "headers": [
+            (b"content-type", b"application/json"),
+            *((name.encode(), value.encode()) for name, value in headers.items()),
+        ],
+    }
+    await app(scope, receive, send)
+    return response
+
+
+def test_stored_result_is_the_same_as_executed():
+    result = graphql_sync(app.schema, QUERY)
+
+    assert result.errors is None
+    assert json.loads(RESPONSE) == {"data": result.data}
+
+
+def test_standard_query_is_answered_with_stored_result():
+    query = "  ".join(QUERY.split())  # formatting of query does not matter
+
+    response = asyncio.run(post({"query": query}))
+
+    assert response["status"] == 200
+    assert response["headers"]["etag"] == ETAG
+    assert response["body"] == RESPONSE
+
+
+def test_unchanged_result_is_not_sent_again():
+    response = asyncio.run(
+        post({"query": QUERY}, **{"if-none-match": f'"outdated", {ETAG}'})
+    )
+
+    assert response["status"] == 304
+    assert response["body"] == b""
+
+
+def test_other_introspection_queries_are_executed():
+    response = asyncio.run(post({"query": "{ __schema { queryType { name } } }"}))
+
+    assert response["status"] == 200
+    assert "etag" not in response["headers"]
+    assert json.loads(response["body"]) == {
+        "data": {"__schema": {"queryType": {"name": "Query"}}}
+    }
+
+
+def test_federated_schema_is_rejected():
+    with pytest.raises(ValueError, match="federated schema"):
+        generate(
+            "type Query { hello: String }", Options(introspection=True, federation=True)
+        )
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+from graphql import GraphQLError
+from tests.examples.limits.out.limits import limited
+from tests.examples.limits.out.limits import limits
+
+
+def test_limited_runs_at_most_concurrency_calls_at_once():
+    running = []
+
+    @limited("Test.concurrency", concurrency=2)
+    async def resolver(value):
+        running.append(value)
+        await asyncio.sleep(0.01)
+        assert len(running) <= 2
+        running.remove(value)
+        return value
+
+    async def scenario():
+        return await asyncio.gather(*map(resolver, range(6)))
+
+    assert asyncio.run(scenario()) == list(range(6))
+
+
+def test_limited_rejects_calls_waiting_longer_than_deadline():
+    @limited("Test.rejected", concurrency=1, timeout_ms=20)
+    async def resolver(delay):
+        await asyncio.sleep(delay)
+
+    async def scenario():
+        return await asyncio.gather(resolver(0.05), resolver(0), return_exceptions=True)
+
+    first, second = asyncio.run(scenario())
+    assert isinstance(first, GraphQLError)
+    assert isinstance(second, GraphQLError)
+    assert limits["Test.rejected"].rejected == 1
+    assert limits["Test.rejected"].timed_out == 1
+
+
+def test_limited_times_out_slow_calls():
+    @limited("Test.timeout", concurrency=5, timeout_ms=10)
+    async def resolver():
+        await asyncio.sleep(1)
+
+    with pytest.raises(GraphQLError, match="Test.timeout timed out"):
+        asyncio.run(resolver())
+    assert limits["Test.timeout"].timed_out == 1
+
+
+def test_limited_keeps_timeouts_of_resolvers():
+    @limited("Test.own_timeout", concurrency=5, timeout_ms=1000)
+    async def resolver():
+        await asyncio.wait_for(asyncio.sleep(1), 0.001)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(resolver())
+    assert limits["Test.own_timeout"].timed_out == 0
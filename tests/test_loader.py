@@ -0,0 +1,85 @@
+import graphql
+import pytest
+
+from pasiphae import loader
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    (tmp_path / "users").mkdir()
+    (tmp_path / "query.graphql").write_text("type Query { me: User }")
+    (tmp_path / "users" / "user.graphql").write_text("type User { id: ID! }")
+    (tmp_path / "schema.generated.graphql").write_text("type Query { me: User }")
+    (tmp_path / "resolvers.py").write_text("")
+    return tmp_path
+
+
+def test_find_files_in_directory(schema_dir):
+    root, files = loader.find_files(schema_dir)
+
+    assert root == schema_dir
+    assert files == [
+        schema_dir / "query.graphql",
+        schema_dir / "users" / "user.graphql",
+    ]
+
+
+def test_find_files_matching_glob(schema_dir):
+    root, files = loader.find_files(schema_dir / "**" / "u*.graphql")
+
+    assert root == schema_dir
+    assert files == [schema_dir / "users" / "user.graphql"]
+
+
+def test_merge_extensions():
+    document = loader.merge_extensions(
+        graphql.parse(
+            """
+            extend type Query { posts: [Post!]! }
+            type Query { me: User }
+            extend type User @key(fields: "id") { id: ID! }
+            extend enum Role { ADMIN }
+            enum Role { READER }
+            """
+        )
+    )
+
+    assert graphql.print_ast(document) == (
+        "type Query {\n  me: User\n  posts: [Post!]!\n}\n\n"
+        "enum Role {\n  READER\n  ADMIN\n}\n\n"
+        'type User @key(fields: "id") {\n  id: ID!\n}'
+    )
+
+
+def test_merge_extensions_of_other_kind_fails():
+    with pytest.raises(ValueError, match="Cannot extend Role"):
+        loader.merge_extensions(
+            graphql.parse("type Role { id: ID } extend enum Role { A }")
+        )
+
+
+def test_parse_files_in_parallel_and_cache_on_disk(tmp_path, monkeypatch):
+    files = []
+    for index in range(loader.PARALLEL_THRESHOLD):
+        files.append(tmp_path / f"type{index}.graphql")
+        files[-1].write_text(f"type Type{index} {{ id: ID! }}")
+    cache_dir = tmp_path / "cache"
+
+    document = loader.parse_files(files, loader.ParseCache(cache_dir))
+    assert len(document.definitions) == loader.PARALLEL_THRESHOLD
+    assert len(list(cache_dir.iterdir())) == loader.PARALLEL_THRESHOLD
+
+    monkeypatch.setattr(loader, "parse", None)
+    cached = loader.parse_files(files, loader.ParseCache(cache_dir))
+    assert graphql.print_ast(cached) == graphql.print_ast(document)
+
+
+def test_parse_files_reports_file_with_syntax_error(tmp_path):
+    files = []
+    for index in range(loader.PARALLEL_THRESHOLD):
+        files.append(tmp_path / f"type{index}.graphql")
+        files[-1].write_text(f"type Type{index} {{ id: ID! }}")
+    files[3].write_text("type {")
+
+    with pytest.raises(graphql.GraphQLSyntaxError, match="type3.graphql"):
+        loader.parse_files(files)
@@ -0,0 +1,59 @@
+import asyncio
+
+import graphql
+import pytest
+from tests.examples.loadtest.out import loadtest
+
+from pasiphae.api import Options
+from pasiphae.api import generate
+from pasiphae.loadtest import generate_operations
+
+SCHEMA = """
+enum Sort { NEWEST OLDEST }
+input Filter { author: String! tag: String }
+type Book { id: ID! title: String! }
+type Query {
+    books(filter: Filter!, sort: Sort = OLDEST, tag: String): [Book!]!
+    book(id: ID!): Book
+}
+"""
+
+
+def test_operations_pass_required_arguments_and_defaults():
+    operations = generate_operations(graphql.parse(SCHEMA))
+
+    assert operations == {
+        "books": 'query Books { books(filter: {author: "loadtest"}, sort: OLDEST)'
+        " { id title } }",
+        "book": 'query Book { book(id: "1") { id title } }',
+    }
+
+
+def test_harness_is_generated_with_transport():
+    generated = generate(SCHEMA, Options(loadtest=True))
+
+    assert "from .transport import Connection" in generated.modules["loadtest"]
+    assert "class Connection" in generated.modules["transport"]
+
+
+@pytest.mark.parametrize("latencies, expected", [([], 0.0), ([1.0, 2.0], 2.0)])
+def test_percentile(latencies, expected):
+    assert loadtest.percentile(latencies, 0.95) == expected
+
+
+def test_operations_are_run_in_process():
+    operations = {"reviews": loadtest.OPERATIONS["reviews"]}
+
+    results = asyncio.run(loadtest.run(operations, 2, 5, None))
+
+    assert results["reviews"]["requests"] == 5
+    assert results["reviews"]["errors"] == 5  # resolvers are not implemented
+    assert "reviews" in loadtest.report(results)
+
+
+def test_run_without_requests_reports_zeros():
+    results = asyncio.run(
+        loadtest.run({"hero": loadtest.OPERATIONS["hero"]}, 2, 0, None)
+    )
+
+    assert results["hero"]["p99"] == 0.0
@@ -0,0 +1,137 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from ariadne import QueryType
+from ariadne import graphql
+from ariadne import load_schema_from_path
+from ariadne import make_executable_schema
+from tests.examples.metrics.out import metrics
+from tests.examples.metrics.out.metrics import Histogram
+from tests.examples.metrics.out.metrics import Registry
+from tests.examples.metrics.out.metrics import ResolverMetrics
+from tests.examples.metrics.out.metrics import metrics_endpoint
+
+schema_path = Path(__file__).parent / "examples" / "metrics" / "out" / "schema.graphql"
+
+BOOK = {"id": "1", "title": "Dune", "author": "Herbert"}
+
+query = QueryType()
+
+
+@query.field("book")
+def resolve_query_book(_, info, id):
+    if id == "0":
+        raise LookupError("No such book")
+    return BOOK
+
+
+@query.field("books")
+async def resolve_query_books(_, info, author=None):
+    if author == "nobody":
+        raise LookupError("No such author")
+    return [BOOK]
+
+
+schema = make_executable_schema(load_schema_from_path(schema_path), query)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = Registry()
+    registry.register(schema)
+    monkeypatch.setattr(metrics, "registry", registry)
+    return registry
+
+
+def execute(query):
+    _, result = asyncio.run(
+        graphql(schema, {"query": query}, extensions=[ResolverMetrics])
+    )
+    return result
+
+
+def test_histogram_buckets_include_their_upper_bound():
+    histogram = Histogram("resolve_query_book")
+
+    for seconds in (0.0001, 0.0005, 0.0006, 5.0, 60.0):
+        histogram.observe(seconds)
+
+    assert histogram.buckets == [2, 1] + [0] * 10 + [1, 1]
+    assert histogram.sum == pytest.approx(65.0012)
+
+
+def test_only_generated_resolvers_are_registered(registry):
+    assert {type_: list(fields) for type_, fields in registry.histograms.items()} == {
+        "Query": ["book", "books"]
+    }
+
+
+def test_calls_errors_and_latency_are_recorded(registry):
+    execute('{ book(id: "1") { title } books { title } }')
+    execute('{ book(id: "0") { title } books(author: "nobody") { title } }')
+
+    book = registry.histograms["Query"]["book"]
+    books = registry.histograms["Query"]["books"]
+    assert (book.calls, book.errors, sum(book.buckets)) == (2, 1, 2)
+    assert (books.calls, books.errors, sum(books.buckets)) == (2, 1, 2)
+
+
+def test_errors_are_counted_for_calls_which_are_not_sampled(registry):
+    registry.set_sample_rate(0.25)
+
+    for _ in range(4):
+        execute('{ book(id: "0") { title } books(author: "nobody") { title } }')
+
+    for histogram in registry.histograms["Query"].values():
+        assert (histogram.calls, histogram.errors) == (4, 4)
+        assert sum(histogram.buckets) == 1
+
+
+@pytest.mark.parametrize("sample_rate", [0, 1.5])
+def test_sample_rate_is_validated(sample_rate):
+    with pytest.raises(ValueError):
+        Registry(sample_rate)
+
+
+def test_registry_renders_prometheus_text(registry):
+    histogram = registry.histograms["Query"]["book"]
+    histogram.calls, histogram.errors = 3, 1
+    histogram.observe(0.003)
+    histogram.observe(0.2)
+
+    lines = registry.render().splitlines()
+
+    label = 'resolver="resolve_query_book"'
+    assert f'graphql_resolver_duration_seconds_bucket{{{label},le="0.001"}} 0' in lines
+    assert f'graphql_resolver_duration_seconds_bucket{{{label},le="0.005"}} 1' in lines
+    assert f'graphql_resolver_duration_seconds_bucket{{{label},le="+Inf"}} 2' in lines
+    assert f"graphql_resolver_duration_seconds_count{{{label}}} 2" in lines
+    assert f"graphql_resolver_calls_total{{{label}}} 3" in lines
+    assert f"graphql_resolver_errors_total{{{label}}} 1" in lines
+    assert "# TYPE graphql_resolver_errors_total counter" in lines
+
+
+def test_metrics_endpoint_serves_registry_and_passes_other_requests(registry):
+    async def app(scope, receive, send):
+        passed.append(scope["path"])
+
+    async def request(path):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        await endpoint({"type": "http", "path": path}, None, send)
+        return messages
+
+    passed = []
+    endpoint = metrics_endpoint(app)
+
+    start, body = asyncio.run(request("/metrics"))
+    assert asyncio.run(request("/graphql")) == []
+
+    assert passed == ["/graphql"]
+    assert start["status"] == 200
+    assert start["headers"] == [(b"content-type", metrics.CONTENT_TYPE)]
+    assert body["body"] == registry.render().encode()
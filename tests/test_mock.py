@@ -0,0 +1,73 @@
+import asyncio
+from datetime import datetime
+from pathlib import Path
+
+from ariadne import load_schema_from_path
+from ariadne import make_executable_schema
+from graphql import graphql
+from tests.examples.mock.out.mock import mock_schema
+from tests.examples.mock.out.resolvers import resolvers
+
+from pasiphae.api import Options
+from pasiphae.api import generate
+
+schema_path = Path(__file__).parent / "examples" / "mock" / "out" / "schema.graphql"
+
+QUERY = """
+{
+    hero(episode: JEDI) { __typename id name appearsIn }
+    starships { id length crew operational launchedAt }
+}
+"""
+
+
+def execute(query=QUERY, **options):
+    schema = make_executable_schema(load_schema_from_path(schema_path), resolvers)
+    mock_schema(schema, **options)
+    result = asyncio.run(graphql(schema, query))
+    assert result.errors is None
+    return result.data
+
+
+def test_mock_data_depends_only_on_seed():
+    assert execute(seed=1) == execute(seed=1)
+    assert execute(seed=1) != execute(seed=2)
+
+
+def test_mock_data_is_schema_valid():
+    data = execute()
+
+    assert data["hero"]["__typename"] in ("Human", "Droid")
+    assert set(data["hero"]["appearsIn"]) <= {"NEWHOPE", "EMPIRE", "JEDI"}
+    assert len(data["starships"]) == 3
+    for starship in data["starships"]:
+        assert isinstance(starship["crew"], int)
+        assert isinstance(starship["operational"], bool)
+
+
+def test_mock_list_sizes_can_be_configured():
+    data = execute(
+        '{ starships { id } search(text: "") { __typename } }',
+        list_size=5,
+        list_sizes={"Query.starships": 1000},
+    )
+
+    assert len(data["starships"]) == 1000
+    assert len(data["search"]) == 5
+
+
+def test_mock_scalars_are_serialized_by_their_codecs():
+    for starship in execute()["starships"]:
+        assert datetime.fromisoformat(starship["launchedAt"]).tzinfo is not None
+
+
+def test_mock_scalars_follow_configured_types():
+    schema = "scalar Day scalar Money type Query { day: Day money: Money }"
+    scalars = {"Float": "float", "ID": "str", "Day": "datetime.date"}
+
+    mock = generate(schema, Options(mock=True, scalars=scalars)).modules["mock"]
+
+    assert '"ID": VALUES["str"],' in mock
+    assert '"Float": VALUES["float"],' in mock
+    assert '"Day": VALUES["date"],' in mock
+    assert '"Money": VALUES["str"],' in mock
@@ -8,25 +8,34 @@ from pasiphae.cli import pasiphae
 
 examples_dir = Path(__file__).parent / "examples"
 
-FILES_TO_IGNORE = {"out"}
+FILES_TO_IGNORE = {"out", "__pycache__"}
+
+
+def list_files(path):
+    return sorted(set(listdir(path)) - FILES_TO_IGNORE)
 
 
 @pytest.mark.parametrize("path", listdir(examples_dir))
-def test_from_directories(path):
+def test_from_directories(path, monkeypatch):
     in_path = examples_dir / path / "in"
     out_path = examples_dir / path / "out"
 
     schema_path = in_path / "schema.graphql"
+    if not schema_path.exists():
+        schema_path = in_path
+    args_path = examples_dir / path / "args"
+    args = args_path.read_text().split() if args_path.exists() else []
+    monkeypatch.chdir(examples_dir / path)  # args are relative to example
     runner = CliRunner()
     result = runner.invoke(
-        pasiphae, [str(schema_path), "--app"], catch_exceptions=False
+        pasiphae, [str(schema_path), "--app", *args], catch_exceptions=False
     )
     assert result.exception is None
 
-    assert listdir(in_path) == listdir(
+    assert list_files(in_path) == list_files(
         out_path
     ), "in and out dirs content should be the same"
-    for file_name in listdir(in_path):
+    for file_name in list_files(in_path):
         assert (
             open(in_path / file_name).read() == open(out_path / file_name).read()
         ), f"{file_name} should be the same in in and out"
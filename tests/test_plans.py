@@ -0,0 +1,298 @@
+import asyncio
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from ariadne import MutationType
+from ariadne import ObjectType
+from ariadne import QueryType
+from ariadne import ScalarType
+from ariadne import graphql
+from ariadne import load_schema_from_path
+from ariadne import make_executable_schema
+from graphql import GraphQLError
+from graphql import ValidationRule
+from tests.examples.plans.out import plans
+from tests.examples.plans.out.plans import PlansGraphQL
+
+from pasiphae.api import Options
+from pasiphae.api import generate
+
+example_dir = Path(__file__).parent / "examples" / "plans" / "out"
+operations = (example_dir / "operations.graphql").read_text()
+
+USERS = {
+    "1": {
+        "id": "1",
+        "name": "Ann",
+        "status": "ACTIVE",
+        "joined": datetime(2022, 1, 1),
+        "friends": ["2", "3", "4"],
+        "posts": [{"title": "Hello", "tags": ["intro"], "author": "1"}, None],
+    },
+    "2": {
+        "id": "2",
+        "name": "Bob",
+        "status": "BANNED",
+        "friends": ["1"],
+        # author of the second one fails, it is nulled with its post
+        "posts": [{"title": "Spam", "author": "2"}, {"title": "Oops", "author": "x"}],
+    },
+    "3": {"id": "3", "name": "Cid", "status": "ACTIVE", "friends": ["5"]},
+    "4": {"id": 4, "name": "Dan", "status": "ACTIVE"},
+    # friend without name nulls all friends and user itself
+    "5": {"id": "5", "name": None, "status": "ACTIVE"},
+}
+
+events = []
+
+query = QueryType()
+mutation = MutationType()
+user = ObjectType("User")
+post = ObjectType("Post")
+date_time = ScalarType("DateTime", serializer=lambda value: value.isoformat())
+
+
+@query.field("user")
+def resolve_user(_, info, id):
+    return USERS.get(id)
+
+
+@query.field("users")
+async def resolve_users(_, info, ids):
+    return [USERS.get(id) for id in ids]
+
+
+@user.field("friends")
+async def resolve_friends(user_, info, first=None):
+    return [USERS[id] for id in user_["friends"][:first]]
+
+
+@post.field("author")
+async def resolve_author(post_, info):
+    events.append(("start", post_["title"]))
+    await asyncio.sleep(0)
+    events.append(("end", post_["title"]))
+    return USERS[post_["author"]]
+
+
+@mutation.field("rename")
+async def resolve_rename(_, info, id, name):
+    return {**USERS[id], "name": name}
+
+
+schema = make_executable_schema(
+    load_schema_from_path(example_dir / "schema.graphql"),
+    [query, mutation, user, post, date_time],
+)
+
+
+@pytest.fixture
+def app(monkeypatch):
+    executed = []
+    run = plans.run
+
+    async def spy(plan, *args):
+        executed.append(plan.name)
+        return await run(plan, *args)
+
+    monkeypatch.setattr(plans, "run", spy)
+    app = PlansGraphQL(schema)
+    app.executed = executed
+    return app
+
+
+async def post_json(app, payload):
+    messages = [{"type": "http.request", "body": json.dumps(payload).encode()}]
+    response = {"body": b""}
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+        else:
+            response["body"] += message.get("body", b"")
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+    }
+    await app(scope, receive, send)
+    return response["status"], json.loads(response["body"])
+
+
+def executed(query, variables):
+    _, result = asyncio.run(graphql(schema, {"query": query, "variables": variables}))
+    return 200, result
+
+
+def test_known_operations_have_plans(app):
+    assert set(app.plans) == {"GetUser", "ListUsers", "Rename"}
+
+
+@pytest.mark.parametrize(
+    "name, variables",
+    [
+        ("GetUser", {"id": "1"}),
+        ("GetUser", {"id": "2"}),
+        ("GetUser", {"id": "3"}),
+        ("GetUser", {"id": "404"}),
+        ("ListUsers", {"ids": ["1", "404", "4"]}),
+        ("ListUsers", {}),
+        ("Rename", {"id": "1", "name": "Anna"}),
+    ],
+)
+def test_plans_give_the_same_results_as_executor(app, name, variables):
+    response = asyncio.run(post_json(app, {"id": name, "variables": variables}))
+
+    assert app.executed == [name]
+    assert response == executed(app.plans[name].source, variables)
+
+
+def test_errors_are_located(app):
+    _, result = asyncio.run(post_json(app, {"id": "GetUser", "variables": {"id": "3"}}))
+
+    assert result == {
+        "data": {"user": None},
+        "errors": [
+            {
+                "message": "Cannot return null for non-nullable field User.name.",
+                "locations": [{"line": 7, "column": 7}],
+                "path": ["user", "friends", 0, "name"],
+            }
+        ],
+    }
+
+
+def test_async_fields_are_resolved_concurrently(app):
+    events.clear()
+
+    asyncio.run(post_json(app, {"id": "GetUser", "variables": {"id": "2"}}))
+
+    assert events == [
+        ("start", "Spam"),
+        ("start", "Oops"),
+        ("end", "Spam"),
+        ("end", "Oops"),
+    ]
+
+
+def test_operations_are_found_by_query_text(app):
+    query = " ".join(app.plans["ListUsers"].source.split())
+
+    response = asyncio.run(
+        post_json(app, {"query": query, "variables": {"ids": ["1"]}})
+    )
+
+    assert app.executed == ["ListUsers"]
+    assert response == executed(query, {"ids": ["1"]})
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"query": operations, "operationName": "GetNode", "variables": {"id": "1"}},
+        {"id": "GetUser", "operationName": "ListUsers", "variables": {"id": "1"}},
+        {"query": "{ user(id: 1) { id } }"},
+    ],
+)
+def test_other_operations_are_executed(app, payload):
+    status, _ = asyncio.run(post_json(app, payload))
+
+    assert app.executed == []
+    assert status in (200, 400)
+
+
+@pytest.mark.parametrize(
+    "query", ['query Other { users(ids: ["1"]) { id } }', "ListUsers"]
+)
+def test_query_sent_with_other_id_is_executed(app, query):
+    query = app.plans[query].source if query in app.plans else query
+
+    response = asyncio.run(
+        post_json(app, {"id": "GetUser", "query": query, "variables": {"ids": ["1"]}})
+    )
+
+    assert app.executed == []
+    assert response == executed(query, {"ids": ["1"]})
+
+
+def test_operations_sent_by_id_are_executed_without_plans(app):
+    app.middleware = [lambda resolve, *args, **kwargs: resolve(*args, **kwargs)]
+
+    response = asyncio.run(post_json(app, {"id": "GetUser", "variables": {"id": "1"}}))
+
+    assert app.executed == []
+    assert response == executed(app.plans["GetUser"].source, {"id": "1"})
+
+
+class NoFriends(ValidationRule):
+    def enter_field(self, node, *_):
+        if node.name.value == "friends":
+            self.report_error(GraphQLError("Friends are private", node))
+
+
+@pytest.mark.parametrize(
+    "rules", [[NoFriends], lambda context, document, data: [NoFriends]]
+)
+def test_validation_rules_are_checked(app, rules):
+    app.validation_rules = rules
+
+    status, result = asyncio.run(
+        post_json(app, {"id": "GetUser", "variables": {"id": "1"}})
+    )
+    _, listed = asyncio.run(
+        post_json(app, {"id": "ListUsers", "variables": {"ids": ["1"]}})
+    )
+
+    assert app.executed == ["ListUsers"]
+    assert status == 400
+    assert result["errors"][0]["message"] == "Friends are private"
+    assert listed == executed(app.plans["ListUsers"].source, {"ids": ["1"]})[1]
+
+
+def test_responses_are_created_by_app(app):
+    async def create_json_response(request, result, success):
+        created.append(success)
+        return await type(app).create_json_response(app, request, result, success)
+
+    created = []
+    app.create_json_response = create_json_response
+
+    asyncio.run(post_json(app, {"id": "GetUser", "variables": {"id": "1"}}))
+
+    assert app.executed == ["GetUser"]
+    assert created == [True]
+
+
+def test_unsupported_operations_are_reported():
+    generated = generate(
+        "type Query { hello(name: String): String }",
+        plans="""
+        query Hello($skip: Boolean!) { hello @skip(if: $skip) }
+        query Greeting { hello(name: "Ann") @include(if: true) }
+        """,
+    )
+
+    assert generated.warnings == [
+        "Hello is executed without plan: directive @skip(if: $skip) is not supported"
+    ]
+    assert "PLANS = [build_greeting]" in generated.modules["plans"]
+
+
+def test_plans_of_apps_with_metrics_are_reported():
+    generated = generate(
+        "type Query { hello: String }",
+        Options(app=True, metrics=True),
+        plans="query Hello { hello }",
+    )
+
+    assert generated.warnings == [
+        "Plans are not executed by apps with metrics extension"
+    ]
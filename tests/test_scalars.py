@@ -0,0 +1,149 @@
+import asyncio
+import dataclasses as d
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from decimal import Decimal
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+from ariadne import QueryType
+from ariadne import load_schema_from_path
+from ariadne import make_executable_schema
+from graphql import graphql
+from tests.examples.scalar_codecs.out import scalar_codecs
+from tests.examples.scalar_codecs.out.resolvers import resolvers
+from tests.examples.scalar_codecs.out.types import Event
+
+from pasiphae.api import Options
+from pasiphae.api import generate
+
+schema_path = (
+    Path(__file__).parent / "examples" / "scalar_codecs" / "out" / "schema.graphql"
+)
+
+EVENT = Event(
+    id="1",
+    uuid=UUID(int=1),
+    start=datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    day=date(2020, 1, 2),
+    price=Decimal("9.99"),
+    rating=4.5,
+)
+
+
+def test_scalars_are_parsed_and_serialized():
+    arguments = {}
+    query = QueryType()
+
+    @query.field("events")
+    def resolve_events(_, info, **kwargs):
+        arguments.update(kwargs)
+        return [EVENT]
+
+    schema = make_executable_schema(
+        load_schema_from_path(schema_path), [*resolvers[:-1], query]
+    )
+    result = asyncio.run(
+        graphql(
+            schema,
+            """query ($after: DateTime) {
+                events(after: $after, day: "2020-01-02") {
+                    uuid start day price rating
+                }
+            }""",
+            variable_values={"after": "2020-01-01T00:00:00Z"},
+        )
+    )
+
+    assert result.errors is None
+    assert arguments == {
+        "after": datetime(2020, 1, 1, tzinfo=timezone.utc),
+        "day": date(2020, 1, 2),
+    }
+    assert result.data == {
+        "events": [
+            {
+                "uuid": "00000000-0000-0000-0000-000000000001",
+                "start": "2020-01-02T03:04:05+00:00",
+                "day": "2020-01-02",
+                "price": "9.99",
+                "rating": 4.5,
+            }
+        ]
+    }
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2020-01-02T03:04:05Z", datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+        ("2020-01-02T03:04:05.5", datetime(2020, 1, 2, 3, 4, 5, 500000)),
+        ("2020-01-02T03:04:05", datetime(2020, 1, 2, 3, 4, 5)),
+    ],
+)
+def test_parse_datetime(value, expected):
+    assert scalar_codecs.parse_datetime(value) == expected
+
+
+@pytest.mark.parametrize(
+    "codec, value",
+    [
+        (scalar_codecs.parse_datetime, "yesterday"),
+        (scalar_codecs.parse_datetime, 1),
+        (scalar_codecs.parse_uuid, "1"),
+        (scalar_codecs.parse_decimal, "one"),
+        (scalar_codecs.parse_decimal, True),
+    ],
+)
+def test_invalid_values_are_rejected(codec, value):
+    with pytest.raises(ValueError):
+        codec(value)
+
+
+def test_memoized_codecs_keep_representation_of_equal_values():
+    utc = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    cet = utc.astimezone(timezone(timedelta(hours=1)))
+    query = QueryType()
+    query.set_field(
+        "events",
+        lambda *_, **__: [
+            d.replace(EVENT, start=utc, price=Decimal("1.0")),
+            d.replace(EVENT, start=cet, price=Decimal("1.00")),
+        ],
+    )
+    schema = make_executable_schema(
+        load_schema_from_path(schema_path), [*resolvers[:-1], query]
+    )
+
+    result = asyncio.run(
+        graphql(schema, '{ events(day: "2020-01-02") { start price } }')
+    )
+
+    assert result.data == {
+        "events": [
+            {"start": "2020-01-01T00:00:00+00:00", "price": "1.0"},
+            {"start": "2020-01-01T01:00:00+01:00", "price": "1.00"},
+        ]
+    }
+
+
+def test_memoized_parsers_tell_equal_values_of_other_types_apart():
+    parse_decimal = scalar_codecs.memoized(scalar_codecs.parse_decimal)
+
+    assert parse_decimal(1.0) == Decimal("1.0")
+    with pytest.raises(ValueError):
+        parse_decimal(True)
+
+
+def test_overrides_change_builtin_annotations():
+    generated = generate(
+        "type Item { price: Float! } type Query { item(id: ID!): Item }",
+        Options(scalars={"Float": "float", "ID": "str"}),
+    )
+
+    assert "price: float" in generated.modules["types"]
+    assert "id: str" in generated.modules["resolvers"]
+    assert "scalar_codecs" not in generated.modules
@@ -0,0 +1,99 @@
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+root = Path(__file__).parent.parent
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+
+
+class Server:
+    def __init__(self, *args):
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "tests.examples.serve.out.serve", *args],
+            cwd=root,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        self.lines = []
+
+    def wait_for(self, pattern, timeout=10):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            line = self.process.stderr.readline()
+            self.lines.append(line)
+            if match := re.search(pattern, line):
+                return match
+        raise AssertionError(f"{pattern} not logged in:\n{''.join(self.lines)}")
+
+    def stop(self):
+        self.process.send_signal(signal.SIGTERM)
+        self.process.wait(10)
+        self.lines.extend(self.process.stderr)
+        self.process.stderr.close()
+
+
+@pytest.fixture
+def server():
+    server = Server(
+        "--port", "0", "--workers", "2", "--report-interval", "0.5", "--timeout", "5"
+    )
+    yield server
+    if server.process.poll() is None:
+        server.stop()
+
+
+def query(port):
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{port}/",
+        data=json.dumps({"query": "{ __typename }"}).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return json.load(response)
+
+
+def test_workers_serve_shared_app_and_report_memory(server):
+    port = int(server.wait_for(r"listening on http://127.0.0.1:(\d+)")[1])
+    workers = {server.wait_for(r"worker (\d+) started")[1] for _ in range(2)}
+
+    assert query(port) == {"data": {"__typename": "Query"}}
+    report = server.wait_for(r"worker (\d+): rss [\d.]+ MiB")
+    assert report[1] in workers
+
+    server.stop()
+    assert server.process.returncode == 0
+    assert "stopped" in server.lines[-1]
+
+
+def test_dead_workers_are_replaced(server):
+    port = int(server.wait_for(r"listening on http://127.0.0.1:(\d+)")[1])
+    pid = int(server.wait_for(r"worker (\d+) started")[1])
+    server.wait_for(r"worker \d+ started")
+
+    os.kill(pid, signal.SIGKILL)
+
+    server.wait_for(rf"worker {pid} exited with -9")
+    server.wait_for(r"worker \d+ started")
+    assert query(port) == {"data": {"__typename": "Query"}}
+
+
+def test_hanging_workers_are_killed():
+    server = Server("--port", "0", "--workers", "1", "--timeout", "2")
+    try:
+        pid = int(server.wait_for(r"worker (\d+) started")[1])
+        os.kill(pid, signal.SIGSTOP)
+
+        server.wait_for(rf"worker {pid} is not responding")
+        server.wait_for(rf"worker {pid} exited with -9")
+        server.wait_for(r"worker \d+ started")
+    finally:
+        server.stop()
@@ -0,0 +1,162 @@
+from ariadne import make_executable_schema
+from graphql import graphql_sync
+
+from pasiphae.update import REMOVED_MARKER
+from pasiphae.update import merge
+
+EXISTING = """# generated by pasiphae, please do not change manually
+from graphql import GraphQLResolveInfo
+
+from .auth import login_required
+from .types import Book
+
+query = QueryType()
+
+
+@query.field("book")
+@login_required
+def resolve_query_book(_: None, info: GraphQLResolveInfo, id: str) -> Book:
+    # implemented by hand
+    return info.context["books"][id]
+
+
+@query.field("author")
+def resolve_query_author(_: None, info: GraphQLResolveInfo, id: str) -> str:
+    return "someone"
+
+
+resolvers = [query]
+"""
+
+GENERATED = """# generated by pasiphae, please do not change manually
+from typing import Optional
+
+from graphql import GraphQLResolveInfo
+
+from .types import Book
+
+query = QueryType()
+
+
+@query.field("book")
+def resolve_query_book(
+    _: None, info: GraphQLResolveInfo, id: str, lang: Optional[str]
+) -> Optional[Book]:
+    ...
+
+
+@query.field("books")
+def resolve_query_books(_: None, info: GraphQLResolveInfo) -> Book:
+    ...
+
+
+shelf = ObjectType("Shelf")
+
+resolvers = [query, shelf]
+"""
+
+MERGED = """# generated by pasiphae, please do not change manually
+from typing import Optional
+
+from graphql import GraphQLResolveInfo
+
+from .auth import login_required
+from .types import Book
+
+query = QueryType()
+
+
+@query.field("book")
+@login_required
+def resolve_query_book(
+    _: None, info: GraphQLResolveInfo, id: str, lang: Optional[str]
+) -> Optional[Book]:
+    # implemented by hand
+    return info.context["books"][id]
+
+
+@query.field("books")
+def resolve_query_books(_: None, info: GraphQLResolveInfo) -> Book:
+    ...
+
+
+shelf = ObjectType("Shelf")
+
+
+# pasiphae: field is not defined in schema anymore
+# @query.field("author")
+def resolve_query_author(_: None, info: GraphQLResolveInfo, id: str) -> str:
+    return "someone"
+
+
+resolvers = [query, shelf]
+"""
+
+
+def test_merge_keeps_bodies_and_rewrites_changed_signatures():
+    assert merge(EXISTING, GENERATED) == MERGED
+
+
+def test_merge_is_idempotent():
+    assert merge(MERGED, GENERATED) == MERGED
+
+
+def test_merge_unmarks_resolvers_added_back_to_schema():
+    generated = GENERATED.replace(
+        "shelf = ObjectType",
+        '@query.field("author")\n'
+        "def resolve_query_author(_: None, info: GraphQLResolveInfo, id: str) -> str:"
+        "\n    ...\n\n\nshelf = ObjectType",
+    )
+    assert REMOVED_MARKER not in merge(MERGED, generated)
+
+
+def test_merge_keeps_implemented_coroutines_async():
+    existing = EXISTING.replace(
+        "def resolve_query_book", "async def resolve_query_book"
+    ).replace(
+        'return info.context["books"][id]', 'return await info.context["books"](id)'
+    )
+
+    merged = merge(existing, GENERATED)
+
+    assert "async def resolve_query_book(\n    _: None" in merged
+    assert 'return await info.context["books"](id)' in merged
+    compile(merged, "resolvers.py", "exec")
+    assert merge(merged, GENERATED) == merged
+
+
+def test_merge_of_removed_field_still_builds_schema():
+    existing = """from ariadne import QueryType
+from graphql import GraphQLResolveInfo
+
+query = QueryType()
+
+
+@query.field("hello")
+def resolve_query_hello(_: None, info: GraphQLResolveInfo) -> str:
+    return "hello"
+
+
+@query.field("author")
+def resolve_query_author(_: None, info: GraphQLResolveInfo) -> str:
+    return "someone"
+
+
+resolvers = [query]
+"""
+    generated = existing[: existing.index('@query.field("author")')] + (
+        "resolvers = [query]\n"
+    )
+    namespace: dict = {}
+
+    exec(merge(existing, generated), namespace)
+    schema = make_executable_schema("type Query { hello: String }", namespace["query"])
+
+    assert graphql_sync(schema, "{ hello }").data == {"hello": "hello"}
+
+
+def test_merge_comments_out_decorators_of_legacy_marked_resolvers():
+    legacy = MERGED.replace("# @query.field", "@query.field")
+
+    assert merge(legacy, GENERATED) == MERGED